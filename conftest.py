@@ -91,3 +91,24 @@ def reset_settings(settings):
 
     if django_unicorn_settings:
         settings.DJANGO_UNICORN = django_unicorn_settings
+
+
+@pytest.fixture
+def profiled_phases(monkeypatch):
+    """
+    The phases of a request are only profiled if profiling was enabled when `Unicorn` was imported, so decorate
+    them again for tests that enable profiling or `SERVER_TIMING` in their settings.
+    """
+
+    from django_unicorn.components import unicorn_view  # noqa: PLC0415
+    from django_unicorn.profiling import profiled  # noqa: PLC0415
+
+    phases = (
+        (unicorn_view, "construct_component", "construct"),
+        (unicorn_view.Component, "render", "render"),
+        (unicorn_view.Component, "get_frontend_context_variables", "serialize"),
+        (unicorn_view.Component, "validate", "validate"),
+    )
+
+    for owner, attribute_name, span_name in phases:
+        monkeypatch.setattr(owner, attribute_name, profiled(name=span_name)(getattr(owner, attribute_name)))
@@ -56,6 +56,14 @@ class CacheableComponent:
             else:
                 extra_context = None
 
+            # Memoized computed values are only valid for the current render, so don't pickle them
+            computed_cache = getattr(component, "_computed_cache", {})
+            component._computed_cache = {}
+
+            # Field hashes are only re-used in the current request, so don't pickle the data they were hashed from
+            field_checksums = getattr(component, "_field_checksums", None)
+            component._field_checksums = None
+
             # Pop the request off for pickling
             request = component.request
             component.request = None
@@ -73,6 +81,8 @@ class CacheableComponent:
                 component.parent,
                 component.children.copy(),
                 template_name,
+                computed_cache,
+                field_checksums,
             )
 
             if component.parent:
@@ -104,8 +114,19 @@ class CacheableComponent:
         return self
 
     def __exit__(self, *args):
-        for component, request, extra_context, parent, children, template_name in self._state.values():
+        for (
+            component,
+            request,
+            extra_context,
+            parent,
+            children,
+            template_name,
+            computed_cache,
+            field_checksums,
+        ) in self._state.values():
             component.request = request
+            component._computed_cache = computed_cache
+            component._field_checksums = field_checksums
             component.parent = parent
             component.children = children
             component.template_name = template_name
@@ -114,7 +135,7 @@ class CacheableComponent:
             if component.template_name is None and hasattr(component, "template_html"):
                 component.template_name = create_template(component.template_html)
 
-            if extra_context:
+            if extra_context is not None:
                 component.extra_context = extra_context
 
     def components(self) -> list["UnicornView"]:
@@ -161,6 +182,7 @@ def restore_from_cache(component_cache_key: str, request: HttpRequest | None = N
                 current.setup(request)
             current._validate_called = False
             current.calls = []
+            current._computed_cache = {}
 
             for index, child in enumerate(current.children):
                 key = child.component_cache_key
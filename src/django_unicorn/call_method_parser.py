@@ -1,15 +1,31 @@
 import ast
 import logging
+import re
 from collections.abc import Mapping
 from functools import lru_cache
+from keyword import iskeyword
 from types import MappingProxyType
 from typing import Any
 
+from django.core.exceptions import ImproperlyConfigured
+
+from django_unicorn.settings import get_call_method_parser_cache_size
 from django_unicorn.typer import CASTERS
 
 logger = logging.getLogger(__name__)
 
 
+def _get_cache_size() -> int:
+    try:
+        return get_call_method_parser_cache_size()
+    except ImproperlyConfigured:
+        # Django settings are not configured yet
+        return 1024
+
+
+CACHE_SIZE = _get_cache_size()
+
+
 class InvalidKwargError(Exception):
     pass
 
@@ -67,15 +83,319 @@ def _cast_value(value):
     return value
 
 
-@lru_cache(maxsize=128, typed=True)
-def eval_value(value):
+class _UnparseableError(Exception):
+    """
+    Raised by `_LiteralParser` for anything outside of the grammar it handles; the `ast` module gets used instead.
     """
-    Uses `ast.literal_eval` to parse strings into an appropriate Python primitive.
 
-    Also returns an appropriate object for strings that look like they represent datetime,
-    date, time, duration, or UUID.
+
+_TOKEN_RE = re.compile(
+    r"""
+    [ \t]*(?:
+        (?P<string>'[^'\\\n\r\x00]*'|"[^"\\\n\r\x00]*")
+        |(?P<escaped_string>'(?:[^'\\\n\r\x00]|\\[^\n\r\x00])*'|"(?:[^"\\\n\r\x00]|\\[^\n\r\x00])*")
+        |(?P<number>[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)
+        |(?P<name>[A-Za-z_][A-Za-z0-9_]*)
+        |(?P<punctuation>[()\[\]{},:=])
+    )
+    """,
+    re.VERBOSE,
+)
+_TRAILING_WHITESPACE_RE = re.compile(r"[ \t]*")
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_KWARG_TARGET_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)[ \t]*=(?!=)")
+
+_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+class _LiteralParser:
+    """
+    Parses the subset of Python that is used for calling methods from templates: method calls with positional and
+    keyword arguments, and literals (strings, numbers, `True`/`False`/`None`, lists, tuples, sets and dictionaries).
+
+    The results are the same as `ast.literal_eval`; anything else raises `_UnparseableError`.
     """
 
+    __slots__ = ("idx", "tokens")
+
+    def __init__(self, text: str, start: int = 0):
+        self.tokens = self._tokenize(text, start)
+        self.idx = 0
+
+    @staticmethod
+    def _tokenize(text: str, start: int) -> list[tuple[str, str]]:
+        tokens = []
+        idx = start
+        text_length = len(text)
+
+        while idx < text_length:
+            match = _TOKEN_RE.match(text, idx)
+
+            if not match:
+                if _TRAILING_WHITESPACE_RE.match(text, idx).end() == text_length:  # type: ignore
+                    break
+
+                raise _UnparseableError
+
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))  # type: ignore
+            idx = match.end()
+
+        return tokens
+
+    def _next(self) -> tuple[str, str]:
+        try:
+            token = self.tokens[self.idx]
+        except IndexError:
+            raise _UnparseableError from None
+
+        self.idx += 1
+
+        return token
+
+    def _peek(self, offset: int = 0) -> str | None:
+        try:
+            return self.tokens[self.idx + offset][1]
+        except IndexError:
+            return None
+
+    def _expect(self, punctuation: str) -> None:
+        if self._next() != ("punctuation", punctuation):
+            raise _UnparseableError
+
+    def is_done(self) -> bool:
+        return self.idx == len(self.tokens)
+
+    def parse_value(self) -> Any:
+        (kind, token) = self._next()
+
+        if kind == "string":
+            return token[1:-1]
+        elif kind == "number":
+            return _parse_number(token)
+        elif kind == "name":
+            if token in _CONSTANTS:
+                return _CONSTANTS[token]
+        elif kind == "escaped_string":
+            return ast.literal_eval(token)
+        elif token == "[":
+            (items, _) = self._parse_items("]")
+            return items
+        elif token == "(":
+            (items, has_comma) = self._parse_items(")")
+
+            if len(items) == 1 and not has_comma:
+                # Parenthesized expression instead of a tuple
+                return items[0]
+
+            return tuple(items)
+        elif token == "{":
+            return self._parse_braces()
+
+        raise _UnparseableError
+
+    def _parse_items(self, closing: str) -> tuple[list[Any], bool]:
+        """
+        Parses comma-separated values until the `closing` punctuation.
+
+        Returns:
+            Tuple of the values and whether there was a comma.
+        """
+
+        items: list[Any] = []
+
+        if self._peek() == closing:
+            self.idx += 1
+            return (items, False)
+
+        while True:
+            items.append(self.parse_value())
+
+            (_, token) = self._next()
+
+            if token == closing:
+                return (items, len(items) > 1)
+            elif token != ",":
+                raise _UnparseableError
+
+            if self._peek() == closing:
+                self.idx += 1
+                return (items, True)
+
+    def _parse_braces(self) -> dict | set:
+        if self._peek() == "}":
+            self.idx += 1
+            return {}
+
+        start_idx = self.idx
+        first = self.parse_value()
+
+        if self._peek() != ":":
+            # Re-parse the first value as part of the set
+            self.idx = start_idx
+            (items, _) = self._parse_items("}")
+
+            return set(items)
+
+        data = {}
+        key = first
+
+        while True:
+            self._expect(":")
+            data[key] = self.parse_value()
+
+            (_, token) = self._next()
+
+            if token == "}":
+                return data
+            elif token != ",":
+                raise _UnparseableError
+
+            if self._peek() == "}":
+                self.idx += 1
+                return data
+
+            key = self.parse_value()
+
+    def parse_expression_list(self) -> Any:
+        """
+        Parses comma-separated values, which is a tuple if there is more than one, e.g. "1, 2".
+        """
+
+        items = [self.parse_value()]
+        has_comma = False
+
+        while not self.is_done():
+            self._expect(",")
+            has_comma = True
+
+            if self.is_done():
+                break
+
+            items.append(self.parse_value())
+
+        if has_comma:
+            return tuple(items)
+
+        return items[0]
+
+    def parse_arguments(self) -> tuple[list[Any], dict[str, Any]]:
+        """
+        Parses the arguments of a method call (after the opening parenthesis) until the closing parenthesis.
+        """
+
+        args: list[Any] = []
+        kwargs: dict[str, Any] = {}
+
+        if self._peek() == ")":
+            self.idx += 1
+            return (args, kwargs)
+
+        while True:
+            if self._peek(1) == "=" and self.tokens[self.idx][0] == "name":
+                name = self.tokens[self.idx][1]
+
+                if name in kwargs or iskeyword(name):
+                    raise _UnparseableError
+
+                self.idx += 2
+                kwargs[name] = self.parse_value()
+            elif kwargs:
+                # Positional argument after a keyword argument
+                raise _UnparseableError
+            else:
+                args.append(self.parse_value())
+
+            (_, token) = self._next()
+
+            if token == ")":
+                return (args, kwargs)
+            elif token != ",":
+                raise _UnparseableError
+
+            if self._peek() == ")":
+                self.idx += 1
+                return (args, kwargs)
+
+
+def _parse_number(token: str) -> int | float:
+    if "." in token or "e" in token or "E" in token:
+        return float(token)
+
+    digits = token.lstrip("+-")
+
+    if len(digits) > 1 and digits[0] == "0" and digits.strip("0"):
+        # Leading zeros are not allowed for a non-zero int
+        raise _UnparseableError
+
+    return int(token)
+
+
+def _fast_eval_value(value: str) -> Any:
+    parser = _LiteralParser(value)
+
+    if parser.is_done():
+        raise _UnparseableError
+
+    return parser.parse_expression_list()
+
+
+def _fast_parse_kwarg(kwarg: str) -> dict[str, Any]:
+    match = _KWARG_TARGET_RE.match(kwarg)
+
+    if not match:
+        if not kwarg.startswith("$") and _fast_parse_call_method_name(kwarg):
+            # A method call can't be a kwarg
+            raise InvalidKwargError(f"'{kwarg}' is invalid")
+
+        raise _UnparseableError
+
+    key = match.group(1)
+
+    if any(iskeyword(name) for name in key.split(".")):
+        raise _UnparseableError
+
+    parser = _LiteralParser(kwarg, match.end())
+
+    if parser.is_done():
+        raise _UnparseableError
+
+    return {key: parser.parse_expression_list()}
+
+
+def _fast_parse_call_method_name(call_method_name: str) -> tuple[str, list[Any], dict[str, Any]]:
+    is_special_method = False
+    method_name = call_method_name
+
+    if method_name.startswith("$"):
+        is_special_method = True
+        method_name = method_name[1:]
+
+    name_match = _NAME_RE.match(method_name)
+
+    if not name_match or iskeyword(name_match.group()):
+        raise _UnparseableError
+
+    name = name_match.group()
+
+    if name_match.end() == len(method_name):
+        return (call_method_name, [], {})
+
+    parser = _LiteralParser(method_name, name_match.end())
+    parser._expect("(")
+    (args, kwargs) = parser.parse_arguments()
+
+    if not parser.is_done():
+        raise _UnparseableError
+
+    if is_special_method:
+        # Add "$" back to special functions
+        name = f"${name}"
+
+    return (name, args, kwargs)
+
+
+def _eval_value_ast(value):
     try:
         value = ast.literal_eval(value)
     except SyntaxError:
@@ -84,22 +404,26 @@ def eval_value(value):
     return value
 
 
-@lru_cache(maxsize=128, typed=True)
-def parse_kwarg(kwarg: str, *, raise_if_unparseable=False) -> dict[str, Any]:
+@lru_cache(maxsize=CACHE_SIZE, typed=True)
+def eval_value(value):
     """
-    Parses a potential kwarg as a string into a dictionary.
+    Parses strings into an appropriate Python primitive; the same as `ast.literal_eval`.
 
-    Example:
-        `parse_kwarg("test='1'")` == `{"test": "1"}`
+    Also returns an appropriate object for strings that look like they represent datetime,
+    date, time, duration, or UUID.
+    """
 
-    Args:
-        kwarg: Potential kwarg as a string. e.g. "test='1'".
-        raise_if_unparseable: Raise an error if the `kwarg` cannot be parsed. Defaults to `False`.
+    if isinstance(value, str):
+        try:
+            return _fast_eval_value(value)
+        except Exception:  # noqa: S110
+            # Anything that is not handled by the fast parser gets parsed with `ast`
+            pass
+
+    return _eval_value_ast(value)
 
-    Returns:
-        Dictionary of key-value pairs.
-    """
 
+def _parse_kwarg_ast(kwarg: str, *, raise_if_unparseable=False) -> dict[str, Any]:
     try:
         tree = ast.parse(kwarg, "eval")
 
@@ -110,7 +434,7 @@ def parse_kwarg(kwarg: str, *, raise_if_unparseable=False) -> dict[str, Any]:
                 target = assign.targets[0]
                 key = _get_expr_string(target)
 
-                return {key: eval_value(assign.value)}
+                return {key: ast.literal_eval(assign.value)}
             except ValueError:
                 if raise_if_unparseable:
                     raise
@@ -126,22 +450,34 @@ def parse_kwarg(kwarg: str, *, raise_if_unparseable=False) -> dict[str, Any]:
         raise InvalidKwargError(f"'{kwarg}' could not be parsed") from e
 
 
-@lru_cache(maxsize=128, typed=True)
-def parse_call_method_name(
-    call_method_name: str,
-) -> tuple[str, tuple[Any, ...], Mapping[str, Any]]:
+@lru_cache(maxsize=CACHE_SIZE, typed=True)
+def parse_kwarg(kwarg: str, *, raise_if_unparseable=False) -> dict[str, Any]:
     """
-    Parses the method name from the request payload into a set of parameters to pass to
-    a method.
+    Parses a potential kwarg as a string into a dictionary.
+
+    Example:
+        `parse_kwarg("test='1'")` == `{"test": "1"}`
 
     Args:
-        param call_method_name: String representation of a method name with parameters,
-            e.g. "set_name('Bob')"
+        kwarg: Potential kwarg as a string. e.g. "test='1'".
+        raise_if_unparseable: Raise an error if the `kwarg` cannot be parsed. Defaults to `False`.
 
     Returns:
-        Tuple of method_name, a list of arguments and a dict of keyword arguments
+        Dictionary of key-value pairs.
     """
 
+    try:
+        return _fast_parse_kwarg(kwarg)
+    except InvalidKwargError:
+        raise
+    except Exception:  # noqa: S110
+        # Anything that is not handled by the fast parser gets parsed with `ast`
+        pass
+
+    return _parse_kwarg_ast(kwarg, raise_if_unparseable=raise_if_unparseable)
+
+
+def _parse_call_method_name_ast(call_method_name: str) -> tuple[str, list[Any], dict[str, Any]]:
     is_special_method = False
     args: list[Any] = []
     kwargs: dict[str, Any] = {}
@@ -158,12 +494,79 @@ def parse_call_method_name(
     if tree.body and isinstance(statement, ast.Call):
         call = tree.body[0].value  # type: ignore
         method_name = call.func.id
-        args = [eval_value(arg) for arg in call.args]
-        kwargs = {kw.arg: eval_value(kw.value) for kw in call.keywords}
+        args = [ast.literal_eval(arg) for arg in call.args]
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
 
     # Add "$" back to special functions
     if is_special_method:
         method_name = f"${method_name}"
 
+    return (method_name, args, kwargs)
+
+
+@lru_cache(maxsize=CACHE_SIZE, typed=True)
+def parse_call_method_name(
+    call_method_name: str,
+) -> tuple[str, tuple[Any, ...], Mapping[str, Any]]:
+    """
+    Parses the method name from the request payload into a set of parameters to pass to
+    a method.
+
+    Args:
+        param call_method_name: String representation of a method name with parameters,
+            e.g. "set_name('Bob')"
+
+    Returns:
+        Tuple of method_name, a list of arguments and a dict of keyword arguments
+    """
+
+    try:
+        (method_name, args, kwargs) = _fast_parse_call_method_name(call_method_name)
+    except Exception:
+        # Anything that is not handled by the fast parser gets parsed with `ast`
+        (method_name, args, kwargs) = _parse_call_method_name_ast(call_method_name)
+
     # conversion to immutable types - tuple and MappingProxyType
     return method_name, tuple(args), MappingProxyType(kwargs)
+
+
+def _is_method_name(method_name: Any) -> bool:
+    if not isinstance(method_name, str):
+        return False
+
+    if method_name.startswith("$"):
+        method_name = method_name[1:]
+
+    return bool(_NAME_RE.fullmatch(method_name)) and not iskeyword(method_name)
+
+
+def parse_call_method_payload(
+    payload: Mapping[str, Any],
+) -> tuple[str, tuple[Any, ...], Mapping[str, Any]] | None:
+    """
+    Gets the method name and arguments from a `callMethod` payload that were already parsed by the frontend,
+    e.g. `{"name": "select(1234)", "method": "select", "args": [1234], "kwargs": {}}`.
+
+    Args:
+        param payload: The payload of the `callMethod` action.
+
+    Returns:
+        Tuple of method_name, a list of arguments and a dict of keyword arguments, or `None` if the payload
+        does not have valid parsed arguments and `name` should be parsed with `parse_call_method_name`.
+    """
+
+    method_name = payload.get("method")
+
+    if not _is_method_name(method_name):
+        return None
+
+    args = payload.get("args", [])
+    kwargs = payload.get("kwargs", {})
+
+    if not isinstance(args, list) or not isinstance(kwargs, dict):
+        return None
+
+    if not all(_is_method_name(key) and not key.startswith("$") for key in kwargs):
+        return None
+
+    return method_name, tuple(args), MappingProxyType(kwargs)
@@ -1,3 +1,4 @@
+from django_unicorn.components.computed import computed
 from django_unicorn.components.mixins import ModelValueMixin
 from django_unicorn.components.unicorn_view import Component, UnicornField, UnicornView
 from django_unicorn.components.updaters import HashUpdate, LocationUpdate, PollUpdate
@@ -12,4 +13,5 @@ __all__ = [
     "QuerySetType",
     "UnicornField",
     "UnicornView",
+    "computed",
 ]
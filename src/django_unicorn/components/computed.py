@@ -0,0 +1,98 @@
+from collections.abc import Callable, Iterable
+from functools import lru_cache, update_wrapper
+from typing import Any
+
+
+class ComputedProperty:
+    """
+    Property-like descriptor whose value is memoized on the component for the duration of a render.
+
+    The memoized value is stored in the component's `_computed_cache` and is thrown away when a declared
+    dependency is changed with `_set_property`, when the component's lifecycle moves to `complete()`, and
+    whenever the component is restored for a new request.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        *,
+        depends_on: Iterable[str] | None = None,
+        javascript_exclude: bool = False,
+    ):
+        self.func = func
+        self.name = func.__name__
+        self.depends_on = frozenset(depends_on or ())
+        self.javascript_exclude = javascript_exclude
+
+        update_wrapper(self, func)  # type: ignore
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        cache = instance.__dict__.setdefault("_computed_cache", {})
+
+        if self.name not in cache:
+            cache[self.name] = self.func(instance)
+
+        return cache[self.name]
+
+    def __set__(self, instance, value):
+        raise AttributeError(f"Computed property '{self.name}' cannot be set")
+
+    def is_invalidated_by(self, name: str) -> bool:
+        """
+        Whether setting the `name` attribute should throw away the memoized value. Computed
+        properties without explicit dependencies are invalidated by every change.
+        """
+
+        return not self.depends_on or name in self.depends_on
+
+
+def computed(
+    func: Callable | None = None,
+    *,
+    depends_on: Iterable[str] | None = None,
+    javascript_exclude: bool = False,
+) -> Any:
+    """
+    Decorator that turns a component method into a property that only gets calculated once per render.
+
+    Can be used as `@computed` or with arguments, e.g. `@computed(depends_on=("name",), javascript_exclude=True)`.
+
+    Args:
+        param depends_on: Attribute names that invalidate the memoized value when they are set. Defaults to
+            invalidating on any attribute change.
+        param javascript_exclude: Whether the value should be left out of the data serialized to the frontend.
+            Defaults to `False`.
+    """
+
+    def decorator(_func: Callable) -> ComputedProperty:
+        return ComputedProperty(_func, depends_on=depends_on, javascript_exclude=javascript_exclude)
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
+
+@lru_cache(maxsize=128)
+def get_computed_properties(component_class: type) -> dict[str, ComputedProperty]:
+    """
+    Gets the computed properties defined on a component class (including its base classes).
+    """
+
+    computed_properties = {}
+
+    for klass in reversed(component_class.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, ComputedProperty):
+                computed_properties[name] = value
+            elif name in computed_properties:
+                # A subclass overrode the computed property with something else
+                del computed_properties[name]
+
+    return computed_properties
@@ -0,0 +1,83 @@
+from typing import Any, NamedTuple
+
+from django.core import signing
+from django.utils.html import format_html
+
+from django_unicorn.errors import LazyComponentExpiredError, UnicornViewError
+from django_unicorn.settings import get_lazy_max_age
+
+LAZY_COMPONENT_SALT = "django_unicorn.lazy"
+
+LAZY_TRIGGERS = ("visible", "idle")
+
+
+class LazyComponent(NamedTuple):
+    """
+    Everything needed to render a component that was deferred with `lazy=True` in the `unicorn` template tag.
+    """
+
+    component_id: str
+    component_name: str
+    component_key: str
+    parent_cache_key: str | None
+    args: list[Any]
+    kwargs: dict[str, Any]
+
+
+def get_lazy_trigger(lazy: Any) -> str | None:
+    """
+    Gets when a lazy component should get rendered on the frontend from the `lazy` kwarg of the `unicorn` template
+    tag. Returns `None` if the component should not be rendered lazily.
+    """
+
+    if lazy is True:
+        return "visible"
+
+    if not lazy:
+        return None
+
+    if lazy not in LAZY_TRIGGERS:
+        raise AssertionError(f"lazy should be True or one of {', '.join(LAZY_TRIGGERS)}")
+
+    return lazy
+
+
+def dumps_lazy_component(lazy_component: LazyComponent) -> str:
+    """
+    Signs the lazy component so that the name, args, and kwargs can't be changed on the frontend.
+
+    Raises `TypeError` if the args or kwargs can't be serialized to JSON.
+    """
+
+    return signing.dumps(list(lazy_component), salt=LAZY_COMPONENT_SALT, compress=True)
+
+
+def loads_lazy_component(signed_lazy_component: str) -> LazyComponent:
+    """
+    Verifies the signed lazy component.
+
+    Raises `LazyComponentExpiredError` if it was signed more than `LAZY_MAX_AGE` seconds ago, so that it can't be
+    replayed forever, or `UnicornViewError` if it is invalid.
+    """
+
+    try:
+        return LazyComponent(
+            *signing.loads(signed_lazy_component, salt=LAZY_COMPONENT_SALT, max_age=get_lazy_max_age())
+        )
+    except signing.SignatureExpired as e:
+        raise LazyComponentExpiredError("Lazy component has expired") from e
+    except (signing.BadSignature, TypeError) as e:
+        raise UnicornViewError("Lazy component is invalid") from e
+
+
+def render_lazy_placeholder(lazy_component: LazyComponent, trigger: str) -> str:
+    """
+    Renders the element that the frontend replaces with the rendered component.
+    """
+
+    return format_html(
+        '<div unicorn:lazy="{}" unicorn:lazy:trigger="{}" unicorn:name="{}"></div>',
+        dumps_lazy_component(lazy_component),
+        trigger,
+        lazy_component.component_name,
+    )
@@ -0,0 +1,194 @@
+import logging
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from lxml import html
+
+from django_unicorn.settings import get_cache_alias
+from django_unicorn.utils import generate_content_hash
+
+if TYPE_CHECKING:
+    from django_unicorn.components.unicorn_view import UnicornView
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RENDER_CACHE_TIMEOUT = 60
+
+
+class RenderCacheStats:
+    """
+    Counts the render cache hits and misses per component name in the current process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def __repr__(self):
+        return f"RenderCacheStats(hits={self.hits.total()}, misses={self.misses.total()})"
+
+    def hit(self, component_name: str) -> None:
+        with self._lock:
+            self.hits[component_name] += 1
+
+    def miss(self, component_name: str) -> None:
+        with self._lock:
+            self.misses[component_name] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits.total(),
+                "misses": self.misses.total(),
+                "components": {
+                    component_name: {"hits": self.hits[component_name], "misses": self.misses[component_name]}
+                    for component_name in sorted(self.hits.keys() | self.misses.keys())
+                },
+            }
+
+
+render_cache_stats = RenderCacheStats()
+
+
+def get_render_cache_timeout(component: "UnicornView") -> int | None:
+    """
+    Gets the timeout in seconds for the rendered HTML of the component from `Meta.render_cache` and
+    `Meta.render_cache_timeout`. Returns `None` if the render cache is not enabled for the component.
+    """
+
+    meta = getattr(component, "Meta", None)
+
+    if meta is None or not getattr(meta, "render_cache", False):
+        return None
+
+    timeout = getattr(meta, "render_cache_timeout", DEFAULT_RENDER_CACHE_TIMEOUT)
+
+    if not isinstance(timeout, int) or isinstance(timeout, bool) or timeout <= 0:
+        raise AssertionError("Meta.render_cache_timeout should be a positive number of seconds")
+
+    return timeout
+
+
+def _get_template_key(component: "UnicornView") -> str | None:
+    if isinstance(component.template_name, str):
+        return component.template_name
+
+    template_html = getattr(component, "template_html", None)
+
+    if isinstance(template_html, str):
+        return generate_content_hash(template_html)
+
+    return None
+
+
+def get_render_cache_key(
+    component: "UnicornView", *, init_js: bool, frontend_context_variables: str | None = None
+) -> str | None:
+    """
+    Gets the cache key for the rendered HTML of the component. It is based on the component class, the template,
+    and a hash of the frontend data. Returns `None` if the current render can't be cached.
+
+    The frontend data gets serialized if the already serialized `frontend_context_variables` are not passed in.
+    """
+
+    if component.children or component.calls or component.errors or getattr(component, "_mount_result", None):
+        # Rendered children, JavaScript calls, and errors are not part of the frontend data
+        return None
+
+    template_key = _get_template_key(component)
+
+    if template_key is None:
+        return None
+
+    if frontend_context_variables is None:
+        frontend_context_variables = component.get_frontend_context_variables()
+
+    component_class = type(component)
+
+    content_hash = generate_content_hash(
+        "|".join(
+            (
+                f"{component_class.__module__}.{component_class.__qualname__}",
+                template_key,
+                component.component_name,
+                str(component.component_key or ""),
+                str(init_js),
+                str(component.parent is not None),
+                frontend_context_variables,
+            )
+        )
+    )
+
+    return f"unicorn:render:{component.component_id}:{content_hash}"
+
+
+def render_component(component: "UnicornView", *, init_js: bool = False, extra_context=None) -> str:
+    """
+    Renders the component, but re-uses the rendered HTML from the cache if `Meta.render_cache` is enabled
+    and the state of the component did not change since it was cached.
+    """
+
+    timeout = get_render_cache_timeout(component)
+
+    if timeout is None:
+        return component.render(init_js=init_js, extra_context=extra_context)
+
+    # The data gets serialized once for the key and re-used when the component gets rendered
+    frontend_context_variables = component.get_frontend_context_variables()
+    render_cache_key = get_render_cache_key(
+        component, init_js=init_js, frontend_context_variables=frontend_context_variables
+    )
+
+    if render_cache_key is None:
+        return component.render(
+            init_js=init_js, extra_context=extra_context, frontend_context_variables=frontend_context_variables
+        )
+
+    cache = caches[get_cache_alias()]
+    cached_render = cache.get(render_cache_key)
+
+    if cached_render is not None:
+        render_cache_stats.hit(component.component_name)
+
+        (rendered_component, init_script, json_tag_text) = cached_render
+
+        if init_script is not None:
+            # Child components pass their init script to the root component
+            component._init_script = init_script
+            component._json_tag = html.Element(
+                "script", type="application/json", id=f"unicorn:data:{component.component_id}"
+            )
+            component._json_tag.text = json_tag_text
+
+        component.rendered(rendered_component)
+
+        return rendered_component
+
+    render_cache_stats.miss(component.component_name)
+
+    rendered_component = component.render(
+        init_js=init_js, extra_context=extra_context, frontend_context_variables=frontend_context_variables
+    )
+
+    if component.children:
+        # The HTML of child components depends on their own state
+        return rendered_component
+
+    init_script = None
+    json_tag_text = None
+
+    if init_js and component.parent is not None and hasattr(component, "_json_tag"):
+        init_script = component._init_script
+        json_tag_text = component._json_tag.text
+
+    cache.set(render_cache_key, (rendered_component, init_script, json_tag_text), timeout=timeout)
+
+    return rendered_component
@@ -0,0 +1,135 @@
+import logging
+from collections import deque
+from itertools import chain
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import loader
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+if TYPE_CHECKING:
+    from django_unicorn.components.unicorn_view import UnicornView
+
+logger = logging.getLogger(__name__)
+
+STREAM_CONTEXT_KEY = "unicorn_stream"
+
+
+class StreamedComponent(NamedTuple):
+    """
+    Everything needed to render a component that was deferred with `stream=True` in the `unicorn` template tag.
+    """
+
+    component_id: str
+    component_name: str
+    component_key: str
+    parent: "UnicornView | None"
+    args: list[Any]
+    kwargs: dict[str, Any]
+    extra_context: dict[str, Any]
+
+
+class ComponentStream:
+    """
+    Collects the components that get deferred with `stream=True` while a page renders. After the page is sent,
+    each deferred component is rendered and sent in the same response as a `<template>` chunk which the
+    frontend swaps in for the placeholder.
+    """
+
+    def __init__(self, request=None):
+        self.request = request
+        self.deferred: deque[StreamedComponent] = deque()
+
+    def __repr__(self):
+        return f"ComponentStream(deferred={len(self.deferred)})"
+
+    def __bool__(self):
+        return bool(self.deferred)
+
+    def defer(self, streamed_component: StreamedComponent) -> str:
+        """
+        Defers the component until the page is sent and returns the placeholder to render instead.
+        """
+
+        self.deferred.append(streamed_component)
+
+        return format_html(
+            '<div unicorn:stream="{}" unicorn:name="{}"></div>',
+            streamed_component.component_id,
+            streamed_component.component_name,
+        )
+
+    def render_chunk(self, streamed_component: StreamedComponent) -> str:
+        # Import here to prevent a circular import
+        from django_unicorn.components.render_cache import render_component  # noqa: PLC0415
+        from django_unicorn.components.unicorn_view import UnicornView  # noqa: PLC0415
+
+        component = UnicornView.create(
+            component_id=streamed_component.component_id,
+            component_name=streamed_component.component_name,
+            component_key=streamed_component.component_key,
+            parent=streamed_component.parent,
+            request=self.request,
+            component_args=streamed_component.args,
+            kwargs=streamed_component.kwargs,
+        )
+
+        # Nested components can be streamed as well, so the stream is available in the context; the component
+        # gets initialized by the frontend when it is swapped in, so `init_js` is not needed
+        extra_context = {**streamed_component.extra_context, STREAM_CONTEXT_KEY: self}
+        rendered_component = render_component(component, init_js=False, extra_context=extra_context)
+
+        # The trailing newline lets the frontend know that the chunk is complete
+        return format_html(
+            '<template unicorn:stream:for="{}">{}</template>\n',
+            streamed_component.component_id,
+            mark_safe(rendered_component),  # noqa: S308
+        )
+
+    def __iter__(self):
+        while self.deferred:
+            streamed_component = self.deferred.popleft()
+
+            try:
+                yield self.render_chunk(streamed_component)
+            except Exception:
+                # The response was already started, so the placeholder is left on the page instead
+                logger.exception(f"'{streamed_component.component_name}' could not be streamed")
+
+    def streaming_response(self, response: HttpResponse) -> HttpResponse:
+        """
+        Converts the rendered response into a `StreamingHttpResponse` which sends the deferred components after the
+        content of the response. Returns the response as-is if no components were deferred.
+        """
+
+        if not self.deferred:
+            return response
+
+        streaming_response = StreamingHttpResponse(
+            chain((response.content,), self),
+            status=response.status_code,
+            reason=response.reason_phrase,
+        )
+
+        for header, value in response.items():
+            if header.lower() != "content-length":
+                streaming_response[header] = value
+
+        streaming_response.cookies = response.cookies
+
+        return streaming_response
+
+
+def render_stream(
+    request, template_name, context=None, *, content_type=None, status=None, using=None
+) -> HttpResponse | StreamingHttpResponse:
+    """
+    Like `django.shortcuts.render`, but components with `stream=True` in the `unicorn` template tag are rendered
+    after the rest of the page was sent.
+    """
+
+    stream = ComponentStream(request)
+    content = loader.render_to_string(template_name, {**(context or {}), STREAM_CONTEXT_KEY: stream}, request, using)
+
+    return stream.streaming_response(HttpResponse(content, content_type, status))
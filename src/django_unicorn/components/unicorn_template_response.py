@@ -1,22 +1,26 @@
 import logging
 import re
 from collections import deque
+from collections.abc import Iterator, Mapping
+from typing import Any
 
 import orjson
 from django.conf import settings
+from django.template import Context
 from django.template.backends.django import Template
+from django.template.context import make_context
 from django.template.response import TemplateResponse
 from lxml import html
 
-from django_unicorn.decorators import timed
 from django_unicorn.errors import (
     MissingComponentElementError,
     MissingComponentViewElementError,
     MultipleRootComponentElementError,
     NoRootComponentElementError,
 )
+from django_unicorn.profiling import profile, profiled
 from django_unicorn.settings import get_minify_html_enabled, get_script_location
-from django_unicorn.utils import generate_checksum, html_element_to_string, sanitize_html
+from django_unicorn.utils import generate_content_hash, html_element_to_string, sanitize_html
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +150,58 @@ def assert_has_single_wrapper_element(content: str, component_name: str) -> None
         )
 
 
+class LazyContext(Mapping):
+    """
+    Read-only snapshot of the template `Context` that a component is rendered in. Values are looked up in the
+    context's layers when they get read (and remembered), instead of flattening every layer for each component.
+    """
+
+    __slots__ = ("_dicts", "_values")
+
+    def __init__(self, context: Context):
+        # Copy the current layers (top-most first) because the context pops them after the tag is rendered and
+        # updates them in place, e.g. the variables of a `{% for %}` loop
+        self._dicts = tuple(dict(d) for d in reversed(context.dicts))
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+
+        for d in self._dicts:
+            if key in d:
+                value = self._values[key] = d[key]
+                return value
+
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or any(key in d for d in self._dicts)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.flatten())
+
+    def __len__(self) -> int:
+        return len(self.flatten())
+
+    def __repr__(self):
+        return f"LazyContext(values={list(self._values)})"
+
+    def flatten(self) -> dict[str, Any]:
+        """
+        Returns all the context variables as one dictionary.
+        """
+
+        flat = {}
+
+        for d in reversed(self._dicts):
+            flat.update(d)
+
+        flat.update(self._values)
+
+        return flat
+
+
 class UnicornTemplateResponse(TemplateResponse):
     def __init__(
         self,
@@ -159,6 +215,8 @@ class UnicornTemplateResponse(TemplateResponse):
         using=None,
         component=None,
         init_js=False,
+        stream=None,
+        frontend_context_variables=None,
         **kwargs,  # noqa: ARG002
     ):
         super().__init__(
@@ -173,6 +231,8 @@ class UnicornTemplateResponse(TemplateResponse):
 
         self.component = component
         self.init_js = init_js
+        self.stream = stream
+        self.frontend_context_variables = frontend_context_variables
 
     def resolve_template(self, template):
         """Override the TemplateResponseMixin to resolve a list of Templates.
@@ -187,117 +247,151 @@ class UnicornTemplateResponse(TemplateResponse):
 
         return super().resolve_template(template)
 
-    @timed
+    @property
+    def rendered_content(self):
+        extra_context = getattr(self.component, "extra_context", None)
+
+        if not isinstance(extra_context, LazyContext):
+            return super().rendered_content
+
+        template = self.resolve_template(self.template_name)
+        context_data = self.resolve_context(self.context_data)
+
+        if not isinstance(template, Template):
+            # Other template engines only accept a `dict`
+            return template.render({**extra_context.flatten(), **context_data}, self._request)
+
+        context = make_context(context_data, self._request, autoescape=template.backend.engine.autoescape)
+
+        # Variables from the surrounding template are looked up after the component's own context
+        context.dicts.insert(len(context.dicts) - 1, extra_context)
+
+        return template.template.render(context)
+
+    @profiled
     def render(self):
-        response = super().render()
+        with profile("template"):
+            response = super().render()
 
         if not self.component or not self.component.component_id:
             return response
 
-        content = response.content.decode("utf-8")
+        # Parses the rendered template to add the attributes and scripts for the component
+        with profile("parse-html") as span:
+            content = response.content.decode("utf-8")
 
-        # Only check if HTML is well-formed in DEBUG mode
-        if settings.DEBUG and not is_html_well_formed(content):
-            logger.warning(
-                f"The HTML in '{self.component.component_name}' appears to be missing a closing tag. "
-                "That can potentially cause errors in Unicorn."
-            )
-
-        try:
-            assert_has_single_wrapper_element(content, self.component.component_name)
-        except (NoRootComponentElementError, MultipleRootComponentElementError) as ex:
-            logger.warning(ex)
-
-        root_element = get_root_element(content)
-
-        # Prepare Data
-        frontend_context_variables = self.component.get_frontend_context_variables()
-        frontend_context_variables_dict = orjson.loads(frontend_context_variables)
-        checksum = generate_checksum(frontend_context_variables_dict)
-
-        # Modify Attributes
-        root_element.set("unicorn:id", self.component.component_id)
-        if hasattr(self.component, "component_name"):
-            root_element.set("unicorn:name", self.component.component_name)
-        root_element.set("unicorn:key", str(self.component.component_key or ""))
-        root_element.set("unicorn:checksum", checksum)
-        root_element.set("unicorn:data", frontend_context_variables)
-        root_element.set("unicorn:calls", orjson.dumps(self.component.calls).decode("utf-8"))
-
-        # Calculate content hash (without script)
-        rendered_template_no_script = html_element_to_string(root_element)
-        content_hash = generate_checksum(rendered_template_no_script)
-
-        rendered_template = rendered_template_no_script
-
-        # Inject Scripts
-        if self.init_js:
-            init = {
-                "id": self.component.component_id,
-                "name": self.component.component_name,
-                "key": self.component.component_key,
-                "data": orjson.loads(frontend_context_variables),
-                "calls": self.component.calls,
-                "hash": content_hash,
-            }
-            init_json = orjson.dumps(init).decode("utf-8")
-            init_json_safe = sanitize_html(init_json)
-            json_element_id = f"unicorn:data:{self.component.component_id}"
-            init_script = (
-                f"Unicorn.componentInit(JSON.parse(document.getElementById('{json_element_id}').textContent));"
-            )
-
-            # Create JSON script tag
-            json_tag = html.Element("script", type="application/json", id=json_element_id)
-            json_tag.text = init_json_safe
-
-            if self.component.parent:
-                self.component._init_script = init_script
-                self.component._json_tag = json_tag
-            else:
-                json_tags = [json_tag]
-
-                descendants = []
-                descendants.append(self.component)
-                while descendants:
-                    descendant = descendants.pop()
-                    for child in descendant.children:
-                        init_script = f"{init_script} {child._init_script}"
-
-                        if hasattr(child, "_json_tag"):
-                            json_tags.append(child._json_tag)
-                            del child._json_tag
-
-                        descendants.append(child)
-
-                script_tag = html.Element("script", type="module")
-                script_content = (
-                    "if (typeof Unicorn === 'undefined') { "
-                    "console.error('Unicorn is missing. Do you need {% load unicorn %} or {% unicorn_scripts %}?') "
-                    "} else { " + init_script + " }"
+            # Only check if HTML is well-formed in DEBUG mode
+            if settings.DEBUG and not is_html_well_formed(content):
+                logger.warning(
+                    f"The HTML in '{self.component.component_name}' appears to be missing a closing tag. "
+                    "That can potentially cause errors in Unicorn."
                 )
-                script_tag.text = script_content
 
-                if get_script_location() == "append":
-                    root_element.append(script_tag)
-                    for t in json_tags:
-                        root_element.append(t)
-                    rendered_template = html_element_to_string(root_element)
-                else:
-                    root_html = html_element_to_string(root_element)
-                    script_html = html_element_to_string(script_tag)
-                    for t in json_tags:
-                        script_html += html_element_to_string(t)
-                    rendered_template = root_html + script_html
-
-        self.component.rendered(rendered_template)
-        response.content = rendered_template
+            try:
+                assert_has_single_wrapper_element(content, self.component.component_name)
+            except (NoRootComponentElementError, MultipleRootComponentElementError) as ex:
+                logger.warning(ex)
+
+            root_element = get_root_element(content)
+
+            # Prepare Data; it might already have been serialized for the render cache key
+            frontend_context_variables = self.frontend_context_variables
+
+            if frontend_context_variables is None:
+                frontend_context_variables = self.component.get_frontend_context_variables()
+
+            frontend_context_variables_dict = orjson.loads(frontend_context_variables)
+            checksum = self.component._get_checksum(frontend_context_variables_dict)
+
+            # Modify Attributes
+            root_element.set("unicorn:id", self.component.component_id)
+            if hasattr(self.component, "component_name"):
+                root_element.set("unicorn:name", self.component.component_name)
+            root_element.set("unicorn:key", str(self.component.component_key or ""))
+            root_element.set("unicorn:checksum", checksum)
+            root_element.set("unicorn:data", frontend_context_variables)
+            root_element.set("unicorn:calls", orjson.dumps(self.component.calls).decode("utf-8"))
+
+            # Calculate content hash (without script)
+            rendered_template_no_script = html_element_to_string(root_element)
+            content_hash = generate_content_hash(rendered_template_no_script)
+
+            rendered_template = rendered_template_no_script
+
+            # Inject Scripts
+            if self.init_js:
+                init = {
+                    "id": self.component.component_id,
+                    "name": self.component.component_name,
+                    "key": self.component.component_key,
+                    "data": orjson.loads(frontend_context_variables),
+                    "calls": self.component.calls,
+                    "hash": content_hash,
+                }
+                init_json = orjson.dumps(init).decode("utf-8")
+                init_json_safe = sanitize_html(init_json)
+                json_element_id = f"unicorn:data:{self.component.component_id}"
+                init_script = (
+                    f"Unicorn.componentInit(JSON.parse(document.getElementById('{json_element_id}').textContent));"
+                )
 
-        if get_minify_html_enabled():
-            from htmlmin import minify  # noqa: PLC0415  # type: ignore
+                # Create JSON script tag
+                json_tag = html.Element("script", type="application/json", id=json_element_id)
+                json_tag.text = init_json_safe
 
-            minified_html = minify(response.content.decode())
-            if len(minified_html) < len(rendered_template):
-                response.content = minified_html
+                if self.component.parent:
+                    self.component._init_script = init_script
+                    self.component._json_tag = json_tag
+                else:
+                    json_tags = [json_tag]
+
+                    descendants = []
+                    descendants.append(self.component)
+                    while descendants:
+                        descendant = descendants.pop()
+                        for child in descendant.children:
+                            init_script = f"{init_script} {child._init_script}"
+
+                            if hasattr(child, "_json_tag"):
+                                json_tags.append(child._json_tag)
+                                del child._json_tag
+
+                            descendants.append(child)
+
+                    script_tag = html.Element("script", type="module")
+                    script_content = (
+                        "if (typeof Unicorn === 'undefined') { "
+                        "console.error('Unicorn is missing. Do you need {% load unicorn %} or {% unicorn_scripts %}?') "
+                        "} else { " + init_script + " }"
+                    )
+                    script_tag.text = script_content
+
+                    if get_script_location() == "append":
+                        root_element.append(script_tag)
+                        for t in json_tags:
+                            root_element.append(t)
+                        rendered_template = html_element_to_string(root_element)
+                    else:
+                        root_html = html_element_to_string(root_element)
+                        script_html = html_element_to_string(script_tag)
+                        for t in json_tags:
+                            script_html += html_element_to_string(t)
+                        rendered_template = root_html + script_html
+
+            self.component.rendered(rendered_template)
+            response.content = rendered_template
+
+            if get_minify_html_enabled():
+                from htmlmin import minify  # noqa: PLC0415  # type: ignore
+
+                minified_html = minify(response.content.decode())
+                if len(minified_html) < len(rendered_template):
+                    response.content = minified_html
+
+            span.add_size("dom", len(response.content))
+
+        if self.stream is not None:
+            # Child components with `stream=True` get sent after the component
+            return self.stream.streaming_response(response)
 
         return response
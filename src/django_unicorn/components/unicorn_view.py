@@ -3,9 +3,10 @@ import inspect
 import logging
 import pickle
 import sys
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Collection, Sequence
 from functools import lru_cache
 from typing import Any, Optional, cast
+from weakref import WeakKeyDictionary
 
 import shortuuid
 from django.apps import apps as django_apps_module
@@ -17,19 +18,22 @@ from django.utils.decorators import classonlymethod
 from django.utils.safestring import mark_safe
 from django.views.generic.base import TemplateView
 
-from django_unicorn import serializer
+from django_unicorn import metrics, serializer
 from django_unicorn.cacher import cache_full_tree, restore_from_cache
+from django_unicorn.components.computed import get_computed_properties
 from django_unicorn.components.fields import UnicornField
-from django_unicorn.components.unicorn_template_response import UnicornTemplateResponse
-from django_unicorn.decorators import timed
+from django_unicorn.components.streaming import STREAM_CONTEXT_KEY, ComponentStream
+from django_unicorn.components.unicorn_template_response import LazyContext, UnicornTemplateResponse
+from django_unicorn.components.validation import FormValidationCache, can_clean_form_fields, clean_form_fields
 from django_unicorn.errors import (
     ComponentClassLoadError,
     ComponentModuleLoadError,
     UnicornCacheError,
 )
-from django_unicorn.settings import get_setting
+from django_unicorn.profiling import get_current_span, profile, profiled
+from django_unicorn.settings import get_serializer_data_size_warning, get_setting
 from django_unicorn.typer import cast_attribute_value, get_type_hints
-from django_unicorn.utils import create_template, is_non_string_sequence
+from django_unicorn.utils import FieldChecksums, create_template, is_non_string_sequence
 
 try:
     from cachetools.lru import LRUCache  # type: ignore
@@ -49,8 +53,74 @@ views_cache = LRUCache(maxsize=100)
 # Module cache for constructed component classes
 # This can create a subtle race condition so a more long-term solution needs to be found
 constructed_views_cache = LRUCache(maxsize=100)
+
+# Module cache for the pickled "resettable" class attributes of a component class
+resettable_class_attributes_cache: WeakKeyDictionary = WeakKeyDictionary()
 COMPONENTS_MODULE_CACHE_ENABLED = "pytest" not in sys.modules
 
+# Standard attributes from `TemplateView` and component methods that should never be public
+PROTECTED_NAMES = frozenset(
+    (
+        "render",
+        "request",
+        "args",
+        "kwargs",
+        "content_type",
+        "extra_context",
+        "http_method_names",
+        "template_engine",
+        "template_name",
+        "template_html",
+        "dispatch",
+        "id",
+        "get",
+        "get_context_data",
+        "get_template_names",
+        "render_to_response",
+        "http_method_not_allowed",
+        "options",
+        "setup",
+        "fill",
+        "view_is_async",
+        # Component methods
+        "component_id",
+        "component_name",
+        "component_key",
+        "reset",
+        "mount",
+        "hydrate",
+        "update",
+        "validate",
+        "is_valid",
+        "get_frontend_context_variables",
+        "errors",
+        "parent",
+        "children",
+        "call",
+        "calls",
+        "component_cache_key",
+        "component_kwargs",
+        "component_args",
+        "force_render",
+        # Lifecycle hooks
+        "pre_parse",
+        "post_parse",
+        "complete",
+        "rendered",
+        "parent_rendered",
+        "updating",
+        "updated",
+        "resolved",
+        "calling",
+        "called",
+    )
+)
+
+EMPTY_EXCLUDES: frozenset[str] = frozenset()
+
+# Module cache of the compiled `Meta.exclude` names keyed by the `Meta` class
+meta_excludes_cache: WeakKeyDictionary = WeakKeyDictionary()
+
 STANDARD_COMPONENT_KWARG_KEYS = {
     "id",
     "component_id",
@@ -122,7 +192,55 @@ def get_locations(component_name: str) -> list[tuple[str, str]]:
     return locations
 
 
-@timed
+def is_resettable(value: Any) -> bool:
+    """
+    Whether the value can be reset to its original state, i.e. a `UnicornField` or a Django Model without a pk.
+    """
+
+    if isinstance(value, UnicornField):
+        return True
+
+    return isinstance(value, Model) and not value.pk
+
+
+def get_resettable_class_attributes(component_class: type) -> dict[str, bytes]:
+    """
+    Gets a snapshot of the "resettable" class attributes of a component class. The snapshot is pickled the first
+    time it is needed for a component class and then shared by all instances of that class.
+
+    Returns:
+        Dictionary with key: attribute name; value: pickled attribute value.
+    """
+
+    if component_class in resettable_class_attributes_cache:
+        return resettable_class_attributes_cache[component_class]
+
+    class_attributes = {}
+
+    for klass in reversed(component_class.__mro__):
+        for attribute_name, attribute_value in vars(klass).items():
+            if attribute_name.startswith("_"):
+                continue
+
+            class_attributes[attribute_name] = attribute_value
+
+    snapshot = {}
+
+    for attribute_name, attribute_value in class_attributes.items():
+        if not is_resettable(attribute_value):
+            continue
+
+        try:
+            snapshot[attribute_name] = pickle.dumps(attribute_value)
+        except (pickle.PickleError, TypeError, AttributeError):
+            logger.warning(f"Caching '{attribute_name}' failed because it could not be pickled.")
+
+    resettable_class_attributes_cache[component_class] = snapshot
+
+    return snapshot
+
+
+@profiled(name="construct")
 def construct_component(
     component_class,
     component_id,
@@ -151,6 +269,9 @@ def construct_component(
 
     component._mount_result = component.mount()
     component.hydrate()
+
+    # `mount` and `hydrate` can set attributes directly, so make sure `complete` gets fresh computed values
+    component._computed_cache = {}
     component.complete()
     component._validate_called = False
 
@@ -181,10 +302,20 @@ class Component(TemplateView):
         # Caches to reduce the amount of time introspecting the class
         self._methods_cache: dict[str, Callable] = {}
         self._attribute_names_cache: list[str] = []
-        self._hook_methods_cache: list[str] = []
+        self._hook_methods_cache: set[str] = set()
+
+        # Dictionary with key: attribute name; value: pickled attribute value (or `None` if the attribute
+        # is not resettable) for attributes that are set on the instance instead of the class
+        self._resettable_attributes_cache: dict[str, bytes | None] = {}
+
+        # Dictionary with key: computed property name; value: memoized value for the current render
+        self._computed_cache: dict[str, Any] = {}
 
-        # Dictionary with key: attribute name; value: pickled attribute value
-        self._resettable_attributes_cache: dict[str, Any] = {}
+        # Per-field cleaning results of `form_class` that are re-used across messages
+        self._form_validation_cache = FormValidationCache()
+
+        # Field hashes of the frontend data that are re-used for checksums in the current request
+        self._field_checksums: FieldChecksums | None = None
 
         # JavaScript method calls
         self.calls: list[Any] = []
@@ -232,7 +363,7 @@ class Component(TemplateView):
         self._set_default_template_name()
         self._set_caches()
 
-    @timed
+    @profiled
     def _set_default_template_name(self) -> None:
         """Sets a default template name based on component's name if necessary.
 
@@ -298,23 +429,31 @@ class Component(TemplateView):
             if isinstance(value, str):
                 setattr(self, field_name, mark_safe(value))  # noqa: S308
 
-    @timed
+    @profiled
     def _set_caches(self) -> None:
         """
         Setup some initial "caches" to prevent Python from having to introspect
         a component UnicornView for methods and properties multiple times.
         """
+        # Validate and compile `Meta.exclude` up front instead of while checking each attribute
+        self._get_meta_excludes()
+
         self._attribute_names_cache = self._attribute_names()
         self._set_hook_methods_cache()
         self._methods_cache = self._methods()
         self._set_resettable_attributes_cache()
 
-    @timed
+    @profiled
     def reset(self):
-        for (
-            attribute_name,
-            pickled_value,
-        ) in self._resettable_attributes_cache.items():
+        resettable_attributes = {
+            **get_resettable_class_attributes(self.__class__),
+            **self._resettable_attributes_cache,
+        }
+
+        for attribute_name, pickled_value in resettable_attributes.items():
+            if pickled_value is None or attribute_name not in self._attribute_names_cache:
+                continue
+
             try:
                 attribute_value = pickle.loads(pickled_value)  # noqa: S301
                 self._set_property(attribute_name, attribute_value)
@@ -403,18 +542,22 @@ class Component(TemplateView):
         """
         pass
 
-    @timed
-    def render(self, *, init_js=False, extra_context=None, request=None) -> str:
+    @profiled(name="render")
+    @metrics.observe_duration(metrics.render_duration)
+    def render(self, *, init_js=False, extra_context=None, request=None, frontend_context_variables=None) -> str:
         """
         Renders a UnicornView component with the public properties available. Delegates to a
         UnicornTemplateResponse to actually render a response.
 
         Args:
             param init_js: Whether or not to include the Javascript required to initialize the component.
-            param extra_context:
+            param extra_context: Additional context for the template, e.g. a `LazyContext` of the template the
+                component is rendered in.
             param request: Set the `request` for rendering. Usually it will be in the context,
                 but it is missing when the component is re-rendered as a direct view, so it needs
                 to be set explicitly.
+            param frontend_context_variables: The already serialized frontend data of the component, so that it
+                does not get serialized again.
         """
 
         if extra_context is not None:
@@ -431,6 +574,7 @@ class Component(TemplateView):
             context=self.get_context_data(),
             component=self,
             init_js=init_js,
+            frontend_context_variables=frontend_context_variables,
         )
 
         # render_to_response() could only return a HttpResponse, so check for render()
@@ -438,6 +582,7 @@ class Component(TemplateView):
             cast(Any, response).render()
 
         rendered_component = response.content.decode("utf-8")
+        get_current_span().add_size("dom", len(rendered_component))
 
         return rendered_component
 
@@ -452,10 +597,16 @@ class Component(TemplateView):
 
         self.hydrate()
 
+        # Child components with `stream=True` get sent after the rest of the component
+        stream = ComponentStream(request)
+        context = self.get_context_data()
+        context[STREAM_CONTEXT_KEY] = stream
+
         return self.render_to_response(
-            context=self.get_context_data(),
+            context=context,
             component=self,
             init_js=True,
+            stream=stream,
         )
 
     def _cache_component(self, *, parent=None, component_args=None, **kwargs):
@@ -483,14 +634,32 @@ class Component(TemplateView):
         except UnicornCacheError as e:
             logger.warning(e)
 
-    @timed
+    def _get_checksum(self, frontend_context_variables: dict) -> str:
+        """
+        Gets the checksum of the frontend data. Only the fields that changed since the last checksum in the
+        current request get hashed again.
+        """
+
+        field_checksums = getattr(self, "_field_checksums", None)
+
+        if field_checksums is None:
+            field_checksums = FieldChecksums(frontend_context_variables)
+        else:
+            field_checksums = field_checksums.update(frontend_context_variables)
+
+        self._field_checksums = field_checksums
+
+        return field_checksums.checksum
+
+    @profiled(name="serialize")
+    @metrics.observe_duration(metrics.serialize_duration)
     def get_frontend_context_variables(self) -> str:
         """
         Get publicly available properties and output them in a string-encoded JSON object.
         """
 
         frontend_context_variables = {}
-        attributes = self._attributes()
+        attributes = self._attributes(javascript_exclude_computed=True)
         frontend_context_variables.update(attributes)
 
         exclude_field_attributes: list[str] = []
@@ -512,7 +681,7 @@ class Component(TemplateView):
                         del frontend_context_variables[field_name]
 
         # Add cleaned values to `frontend_content_variables` based on the widget in form's fields
-        form = self._get_form(attributes)
+        form = self._get_form(attributes, field_names=())
 
         if form:
             for key in attributes.keys():
@@ -547,27 +716,57 @@ class Component(TemplateView):
             exclude_field_attributes=tuple(exclude_field_attributes),
         )
 
+        data_size_warning = get_serializer_data_size_warning()
+        get_current_span().add_size("data", len(encoded_frontend_context_variables))
+
+        if data_size_warning and len(encoded_frontend_context_variables) > data_size_warning:
+            logger.warning(
+                f"The data for '{self.component_name}' is {len(encoded_frontend_context_variables)} characters "
+                "which will slow down rendering and requests. Consider excluding attributes from JavaScript with "
+                "`Meta.javascript_exclude` or limiting the number of rows in querysets."
+            )
+
         return encoded_frontend_context_variables
 
-    @timed
-    def _get_form(self, data):
+    @profiled
+    def _get_form(self, data, *, field_names: Collection[str] | None = None):
+        """
+        Instantiates and cleans `form_class` with the data.
+
+        Args:
+            param field_names: Only clean these fields and the fields whose value changed since the form was
+                last cleaned; see `clean_form_fields`. Defaults to `None` which cleans the whole form.
+        """
+
         if hasattr(self, "form_class"):
             try:
                 form = cast(Callable, self.form_class)(data=data)
-                form.is_valid()
+
+                if field_names is not None and can_clean_form_fields(form):
+                    clean_form_fields(form, self._form_validation_cache, field_names)
+                else:
+                    form.is_valid()
 
                 return form
             except Exception as e:
                 logger.exception(e)
 
-    @timed
+    @profiled
     def get_context_data(self, **kwargs):
         """
         Overrides the standard `get_context_data` to add in publicly available
         properties and methods.
         """
 
-        context = super().get_context_data(**kwargs)
+        if isinstance(self.extra_context, LazyContext):
+            # The surrounding template context gets looked up lazily by `UnicornTemplateResponse`, but
+            # its `view` still takes precedence like it would if the extra context was merged in
+            context = kwargs
+
+            if "view" not in self.extra_context:
+                context.setdefault("view", self)
+        else:
+            context = super().get_context_data(**kwargs)
 
         attributes = self._attributes()
         context.update(attributes)
@@ -586,11 +785,11 @@ class Component(TemplateView):
 
         return context
 
-    @timed
+    @profiled
     def is_valid(self, model_names: list | None = None) -> bool:
         return len(self.validate(model_names).keys()) == 0
 
-    @timed
+    @profiled(name="validate")
     def validate(self, model_names: list | None = None) -> dict:
         """
         Validates the data using the `form_class` set on the component.
@@ -606,7 +805,10 @@ class Component(TemplateView):
         self._validate_called = True
 
         data = self._attributes()
-        form = self._get_form(data)
+
+        # Only the changed fields need to be cleaned again when validating specific fields; validating everything
+        # re-cleans every field
+        form = self._get_form(data, field_names=model_names if model_names is not None else data.keys())
 
         if form:
             form_errors = form.errors.get_json_data(escape_html=True)
@@ -637,12 +839,28 @@ class Component(TemplateView):
 
         return self.errors
 
-    @timed
+    @profiled
     def _attribute_names(self) -> list[str]:
         """
         Gets publicly available attribute names. Cached in `_attribute_names_cache`.
         """
-        non_callables = [member[0] for member in inspect.getmembers(self, lambda x: not callable(x))]
+        computed_properties = get_computed_properties(self.__class__)
+        non_callables = []
+
+        for name in sorted(dir(self)):
+            # Computed properties are looked up on the class, so they do not get evaluated before `mount` is called
+            if name in computed_properties:
+                non_callables.append(name)
+                continue
+
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+
+            if not callable(value):
+                non_callables.append(name)
+
         attribute_names = [name for name in non_callables if self._is_public(name)]
 
         # Add type hints for the component to the attribute names since
@@ -654,21 +872,34 @@ class Component(TemplateView):
 
         return attribute_names
 
-    @timed
-    def _attributes(self) -> dict[str, Any]:
+    @profiled
+    def _attributes(self, *, javascript_exclude_computed: bool = False) -> dict[str, Any]:
         """
         Get publicly available attributes and their values from the component.
+
+        Args:
+            param javascript_exclude_computed: Skip computed properties that are marked with
+                `javascript_exclude` so they never get evaluated for serialization. Defaults to `False`.
         """
 
         attribute_names = self._attribute_names_cache
         attributes = {}
 
+        if javascript_exclude_computed:
+            computed_properties = get_computed_properties(self.__class__)
+            attribute_names = [
+                attribute_name
+                for attribute_name in attribute_names
+                if attribute_name not in computed_properties
+                or not computed_properties[attribute_name].javascript_exclude
+            ]
+
         for attribute_name in attribute_names:
             attributes[attribute_name] = getattr(self, attribute_name, None)
 
         return attributes
 
-    @timed
+    @profiled
     def _set_property(
         self,
         name: str,
@@ -684,7 +915,7 @@ class Component(TemplateView):
         value = cast_attribute_value(self, name, value)
         data[name] = value
 
-        form = self._get_form(data)
+        form = self._get_form(data, field_names=(name,))
 
         if form and name in form.fields and name in form.cleaned_data:
             # The Django form CharField validator will remove whitespace
@@ -702,6 +933,7 @@ class Component(TemplateView):
 
         try:
             setattr(self, name, value)
+            self._invalidate_computed_cache(name)
 
             if call_updated_method:
                 updated_function_name = f"updated_{name}"
@@ -717,7 +949,19 @@ class Component(TemplateView):
         except AttributeError:
             raise
 
-    @timed
+    def _invalidate_computed_cache(self, name: str) -> None:
+        """
+        Removes the memoized values of computed properties that depend on the `name` attribute.
+        """
+
+        if not self._computed_cache:
+            return
+
+        for computed_name, computed_property in get_computed_properties(self.__class__).items():
+            if computed_property.is_invalidated_by(name):
+                self._computed_cache.pop(computed_name, None)
+
+    @profiled
     def _methods(self) -> dict[str, Callable]:
         """
         Get publicly available method names and their functions from the component.
@@ -727,19 +971,31 @@ class Component(TemplateView):
         if self._methods_cache:
             return self._methods_cache
 
-        member_methods = inspect.getmembers(self, inspect.ismethod)
-        public_methods = [method for method in member_methods if self._is_public(method[0])]
-        methods = dict(public_methods)
+        computed_properties = get_computed_properties(self.__class__)
+        methods = {}
+
+        for name in sorted(dir(self)):
+            if name in computed_properties or not self._is_public(name):
+                continue
+
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+
+            if inspect.ismethod(value):
+                methods[name] = value
+
         self._methods_cache = methods
 
         return methods
 
-    @timed
+    @profiled
     def _set_hook_methods_cache(self) -> None:
         """
         Caches the updating/updated attribute function names defined on the component.
         """
-        self._hook_methods_cache = []
+        self._hook_methods_cache = set()
 
         for attribute_name in self._attribute_names_cache:
             updating_function_name = f"updating_{attribute_name}"
@@ -748,121 +1004,83 @@ class Component(TemplateView):
 
             for function_name in hook_function_names:
                 if hasattr(self, function_name):
-                    self._hook_methods_cache.append(function_name)
+                    self._hook_methods_cache.add(function_name)
 
-    @timed
+    @profiled
     def _set_resettable_attributes_cache(self) -> None:
         """
-        Caches the attributes that are "resettable" in `_resettable_attributes_cache`.
-        Cache is a dictionary with key: attribute name; value: pickled attribute value
+        Caches the attributes that are "resettable".
+
+        Class attributes are pickled once per component class in `get_resettable_class_attributes`, so only
+        attributes that have been set on the instance (e.g. from kwargs) get pickled into
+        `_resettable_attributes_cache`.
 
         Examples:
             - `UnicornField`
             - Django Models without a defined pk
         """
         self._resettable_attributes_cache = {}
+        resettable_class_attributes = get_resettable_class_attributes(self.__class__)
+
+        for attribute_name in self._attribute_names_cache:
+            if attribute_name not in self.__dict__:
+                continue
 
-        for attribute_name, attribute_value in self._attributes().items():
-            if isinstance(attribute_value, UnicornField):
-                self._resettable_attributes_cache[attribute_name] = pickle.dumps(attribute_value)
-            elif isinstance(attribute_value, Model):
-                if not attribute_value.pk:
-                    if attribute_name not in self._resettable_attributes_cache:
-                        try:
-                            self._resettable_attributes_cache[attribute_name] = pickle.dumps(attribute_value)
-                        except pickle.PickleError:
-                            logger.warning(f"Caching '{attribute_name}' failed because it could not be pickled.")
-                            pass
+            attribute_value = self.__dict__[attribute_name]
 
-    def _is_public(self, name: str) -> bool:
+            if is_resettable(attribute_value):
+                try:
+                    self._resettable_attributes_cache[attribute_name] = pickle.dumps(attribute_value)
+                except (pickle.PickleError, TypeError, AttributeError):
+                    logger.warning(f"Caching '{attribute_name}' failed because it could not be pickled.")
+            elif attribute_name in resettable_class_attributes:
+                # The instance overrides the class attribute with something that is not resettable
+                self._resettable_attributes_cache[attribute_name] = None
+
+    def _get_meta_excludes(self) -> frozenset[str]:
         """
-        Determines if the name should be sent in the context.
+        Gets the attribute names in `Meta.exclude`. The names are validated and compiled once per `Meta` class
+        and cached in `meta_excludes_cache`.
         """
 
-        # Ignore some standard attributes from TemplateView
-        protected_names = (
-            "render",
-            "request",
-            "args",
-            "kwargs",
-            "content_type",
-            "extra_context",
-            "http_method_names",
-            "template_engine",
-            "template_name",
-            "template_html",
-            "dispatch",
-            "id",
-            "get",
-            "get_context_data",
-            "get_template_names",
-            "render_to_response",
-            "http_method_not_allowed",
-            "options",
-            "setup",
-            "fill",
-            "view_is_async",
-            # Component methods
-            "component_id",
-            "component_name",
-            "component_key",
-            "reset",
-            "mount",
-            "hydrate",
-            "updating",
-            "update",
-            "calling",
-            "called",
-            "complete",
-            "rendered",
-            "parent_rendered",
-            "validate",
-            "is_valid",
-            "get_frontend_context_variables",
-            "errors",
-            "updated",
-            "resolved",
-            "parent",
-            "children",
-            "call",
-            "calls",
-            "component_cache_key",
-            "component_kwargs",
-            "component_args",
-            "force_render",
-            # Lifecycle hooks
-            "pre_parse",
-            "post_parse",
-            "hydrate",
-            "complete",
-            "rendered",
-            "parent_rendered",
-            "updating",
-            "updated",
-            "resolved",
-            "calling",
-            "called",
-        )
-        excludes = []
+        meta = getattr(self, "Meta", None)
+
+        if meta is None or not hasattr(meta, "exclude"):
+            return EMPTY_EXCLUDES
 
-        if hasattr(self, "Meta") and hasattr(self.Meta, "exclude"):
-            if not is_non_string_sequence(self.Meta.exclude):
-                raise AssertionError("Meta.exclude should be a list, tuple, or set")
+        try:
+            return meta_excludes_cache[meta]
+        except KeyError:
+            pass
+
+        if not is_non_string_sequence(meta.exclude):
+            raise AssertionError("Meta.exclude should be a list, tuple, or set")
+
+        meta_exclude = cast(Sequence[str], meta.exclude)
 
-            meta_exclude = cast(Sequence[str], self.Meta.exclude)
+        for exclude in meta_exclude:
+            if not hasattr(self, str(exclude)):
+                raise serializer.InvalidFieldNameError(field_name=str(exclude), data=self._attributes())
 
-            for exclude in meta_exclude:
-                if not hasattr(self, str(exclude)):
-                    raise serializer.InvalidFieldNameError(field_name=str(exclude), data=self._attributes())
+        excludes = frozenset(str(exclude) for exclude in meta_exclude)
+        meta_excludes_cache[meta] = excludes
 
-            excludes = meta_exclude
+        return excludes
+
+    def _is_public(self, name: str) -> bool:
+        """
+        Determines if the name should be sent in the context.
+        """
 
         return not (
-            name.startswith("_") or name in protected_names or name in self._hook_methods_cache or name in excludes
+            name.startswith("_")
+            or name in PROTECTED_NAMES
+            or name in self._hook_methods_cache
+            or name in self._get_meta_excludes()
         )
 
     @staticmethod
-    @timed
+    @profiled
     def create(
         *,
         component_id: str,
@@ -899,7 +1117,7 @@ class Component(TemplateView):
         component_args = component_args if component_args is not None else []
         kwargs = kwargs if kwargs is not None else {}
 
-        @timed
+        @profiled
         def _get_component_class(module_name: str, class_name: str) -> type[Component]:
             """
             Imports a component based on module and class name.
@@ -910,17 +1128,27 @@ class Component(TemplateView):
             return component_class
 
         component_cache_key = f"unicorn:component:{component_id}"
-        cached_component = restore_from_cache(component_cache_key, request=request)
 
-        if not cached_component:
+        with profile("restore"):
+            cached_component = restore_from_cache(component_cache_key, request=request)
+
+        if cached_component:
+            metrics.cache_hits.inc(tier="component")
+        else:
+            metrics.cache_misses.inc(tier="component")
+
             # Note that `hydrate()` and `complete` don't need to be called here
             # because this path only happens for re-rendering from the view
             cached_component = constructed_views_cache.get(component_id)
 
             if cached_component:
+                metrics.cache_hits.inc(tier="constructed")
                 cached_component.setup(request)
                 cached_component._validate_called = False
                 cached_component.calls = []
+                cached_component._computed_cache = {}
+            else:
+                metrics.cache_misses.inc(tier="constructed")
 
         if use_cache and cached_component:
             logger.debug(f"Retrieve {component_id} from constructed views cache")
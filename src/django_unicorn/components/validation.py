@@ -0,0 +1,179 @@
+import copy
+import logging
+from collections.abc import Collection
+from typing import Any, NamedTuple
+
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.forms import BaseForm, BaseModelForm, FileField
+from django.forms.utils import ErrorDict
+
+logger = logging.getLogger(__name__)
+
+# Stored instead of a value that can't be copied so that the field always gets re-cleaned
+UNCACHEABLE_VALUE = object()
+
+
+class CleanedField(NamedTuple):
+    """
+    The result of cleaning one form field.
+    """
+
+    value: Any
+    cleaned_value: Any
+    errors: list[dict[str, str]] | None
+
+
+class FormValidationCache:
+    """
+    Per-field cleaning results for a component's `form_class`. Stored on the component, so results are
+    re-used across messages until the field's value changes.
+    """
+
+    def __init__(self):
+        self.fields: dict[str, CleanedField] = {}
+
+        # The state of the whole form after the form-level `clean`
+        self.cleaned_data: dict[str, Any] | None = None
+        self.errors: dict[str, list[dict[str, str]]] = {}
+
+    def __repr__(self):
+        return f"FormValidationCache(fields={list(self.fields)})"
+
+
+def can_clean_form_fields(form: Any) -> bool:
+    """
+    Whether the form can be cleaned field by field. `ModelForm`s and forms that customize `full_clean` or
+    `_post_clean` always get cleaned as a whole.
+    """
+
+    if not isinstance(form, BaseForm) or isinstance(form, BaseModelForm):
+        return False
+
+    form_class = type(form)
+
+    return form_class.full_clean is BaseForm.full_clean and form_class._post_clean is BaseForm._post_clean
+
+
+def _copy_value(value: Any) -> Any:
+    try:
+        return copy.deepcopy(value)
+    except Exception as e:
+        logger.debug(e)
+
+    return UNCACHEABLE_VALUE
+
+
+def _is_value_unchanged(cached_value: Any, value: Any) -> bool:
+    if cached_value is UNCACHEABLE_VALUE:
+        return False
+
+    try:
+        return bool(cached_value == value)
+    except Exception:
+        return False
+
+
+def _add_errors(form: BaseForm, errors: dict[str, list[dict[str, str]]]) -> None:
+    """
+    Re-create `ValidationError`s from the JSON representation of the form errors and add them to the form.
+    """
+
+    for field_name, field_errors in errors.items():
+        validation_errors = [
+            ValidationError(error["message"], code=error.get("code") or None) for error in field_errors
+        ]
+        form.add_error(None if field_name == NON_FIELD_ERRORS else field_name, validation_errors)
+
+
+def _clean_field(form: BaseForm, field_name: str) -> None:
+    """
+    Clean one field of the form. This is the same as the loop in `BaseForm._clean_fields` for a single field.
+    """
+
+    field = form.fields[field_name]
+    bound_field = form[field_name]
+    value = bound_field.initial if field.disabled else bound_field.data
+
+    try:
+        if isinstance(field, FileField):
+            form.cleaned_data[field_name] = field.clean(value, bound_field.initial)
+        else:
+            form.cleaned_data[field_name] = field.clean(value)
+
+        clean_method = getattr(form, f"clean_{field_name}", None)
+
+        if clean_method:
+            form.cleaned_data[field_name] = clean_method()
+    except ValidationError as e:
+        form.add_error(field_name, e)
+
+
+def clean_form_fields(form: BaseForm, validation_cache: FormValidationCache, field_names: Collection[str]) -> None:
+    """
+    Cleans a bound form by only running the field cleaners for fields in `field_names` and fields whose value
+    changed since the results in `validation_cache` were stored. The form-level `clean` only runs when at least
+    one field was cleaned. Afterwards, `form.cleaned_data` and `form.errors` are the same as after `is_valid()`.
+
+    Args:
+        param form: The bound form to clean. `can_clean_form_fields` should be checked first.
+        param validation_cache: Cleaning results from previous calls; gets updated in place.
+        param field_names: Names of fields that should be cleaned even if their value is unchanged.
+    """
+
+    form.cleaned_data = {}
+    form._errors = ErrorDict()
+
+    cached_errors = {}
+    is_changed = False
+
+    for field_name, field in form.fields.items():
+        bound_field = form[field_name]
+        value = bound_field.initial if field.disabled else bound_field.data
+        cleaned_field = validation_cache.fields.get(field_name)
+
+        if (
+            field_name not in field_names
+            and cleaned_field is not None
+            and _is_value_unchanged(cleaned_field.value, value)
+        ):
+            if cleaned_field.errors:
+                cached_errors[field_name] = cleaned_field.errors
+            else:
+                form.cleaned_data[field_name] = cleaned_field.cleaned_value
+
+            continue
+
+        is_changed = True
+        _clean_field(form, field_name)
+
+        errors = None
+
+        if field_name in form.errors:
+            errors = form.errors[field_name].get_json_data()
+
+        validation_cache.fields[field_name] = CleanedField(
+            value=_copy_value(value),
+            cleaned_value=form.cleaned_data.get(field_name),
+            errors=errors,
+        )
+
+    if not is_changed and validation_cache.cleaned_data is not None:
+        # Nothing changed, so re-use the result of the form-level `clean` from the last time
+        form.cleaned_data = dict(validation_cache.cleaned_data)
+        form._errors = ErrorDict()
+        _add_errors(form, validation_cache.errors)
+
+        return
+
+    _add_errors(form, cached_errors)
+
+    try:
+        cleaned_data = form.clean()
+    except ValidationError as e:
+        form.add_error(None, e)
+    else:
+        if cleaned_data is not None:
+            form.cleaned_data = cleaned_data
+
+    validation_cache.cleaned_data = dict(form.cleaned_data)
+    validation_cache.errors = form.errors.get_json_data()
@@ -1,41 +1,17 @@
-import logging
-import time
+import warnings
 
-from decorator import decorator
-from django.conf import settings
+from django_unicorn.profiling import profiled
 
 
-@decorator
-def timed(func, *args, **kwargs):
+def timed(func):
     """
-    Decorator that prints out the timing of a function.
-
-    Slightly altered version of https://gist.github.com/bradmontgomery/bd6288f09a24c06746bbe54afe4b8a82.
+    Deprecated: use `django_unicorn.profiling.profiled` instead.
     """
-    if not settings.DEBUG:
-        return func(*args, **kwargs)
-
-    logger = logging.getLogger("profile")
-    start = time.time()
-    result = func(*args, **kwargs)
-    end = time.time()
-
-    function_name = func.__name__
-    arguments = ""
-
-    if args:
-        arguments = f"{args}, "
-
-    for kwarg_key, kwarg_val in kwargs.items():
-        if isinstance(kwarg_val, str):
-            kwarg_val = f"'{kwarg_val}'"  # noqa: PLW2901
-
-        arguments = f"{arguments}{kwarg_key}={kwarg_val}, "
-
-    if arguments.endswith(", "):
-        arguments = arguments[:-2]
 
-    ms = round(end - start, 4)
+    warnings.warn(
+        "`django_unicorn.decorators.timed` is deprecated; use `django_unicorn.profiling.profiled` instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
 
-    logger.debug(f"{function_name}({arguments}): {ms}ms")
-    return result
+    return profiled(func)
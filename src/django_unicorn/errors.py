@@ -6,6 +6,10 @@ class UnicornViewError(Exception):
     pass
 
 
+class LazyComponentExpiredError(UnicornViewError):
+    pass
+
+
 class ComponentLoadError(Exception):
     def __init__(self, *args, locations=None, **kwargs):
         super().__init__(*args, **kwargs)
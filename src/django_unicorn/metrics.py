@@ -0,0 +1,388 @@
+import math
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import Http404, HttpResponse
+
+from django_unicorn.errors import RenderNotModifiedError
+from django_unicorn.settings import LEGACY_SETTINGS_KEY, SETTINGS_KEY, get_setting
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+DEFAULT_DEPTH_BUCKETS = (1, 2, 3, 5, 10, 25, 50)
+
+
+# Whether metrics are enabled; resolved once so that disabled metrics only cost a function call
+_metrics_enabled: bool | None = None
+
+
+def is_metrics_enabled() -> bool:
+    global _metrics_enabled  # noqa: PLW0603
+
+    if _metrics_enabled is not None:
+        return _metrics_enabled
+
+    try:
+        metrics_settings = get_setting("METRICS", {})
+    except ImproperlyConfigured:
+        # Django settings are not configured yet, e.g. when the module is imported by a script
+        return False
+
+    if isinstance(metrics_settings, bool):
+        _metrics_enabled = metrics_settings
+    else:
+        _metrics_enabled = bool(metrics_settings.get("ENABLED", False))
+
+    return _metrics_enabled
+
+
+@receiver(setting_changed)
+def _reset_metrics_enabled(*, setting: str, **kwargs) -> None:  # noqa: ARG001
+    global _metrics_enabled  # noqa: PLW0603
+
+    if setting in (SETTINGS_KEY, LEGACY_SETTINGS_KEY):
+        _metrics_enabled = None
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels: dict[str, Any]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+class Metric:
+    """
+    Base class for a metric that is kept in memory for the current process.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name='{self.name}')"
+
+    def _get_label_values(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise AssertionError(f"{self.name} requires the labels: {', '.join(self.labelnames)}")
+
+        return tuple(str(labels[labelname]) for labelname in self.labelnames)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        raise NotImplementedError()
+
+    def generate(self) -> str:
+        """
+        Formats the metric in the Prometheus text format.
+        """
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, e.g. the number of handled messages.
+    """
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if not is_metrics_enabled():
+            return
+
+        label_values = self._get_label_values(labels)
+
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._get_label_values(labels), 0)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            values = sorted(self._values.items())
+
+        return [
+            (self.name, dict(zip(self.labelnames, label_values, strict=True)), value) for label_values, value in values
+        ]
+
+
+class Histogram(Metric):
+    """
+    Counts observed values, e.g. durations or sizes, in cumulative buckets.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_DURATION_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = (*sorted(buckets), math.inf)
+
+    def observe(self, value: float, **labels) -> None:
+        if not is_metrics_enabled():
+            return
+
+        label_values = self._get_label_values(labels)
+
+        with self._lock:
+            if label_values not in self._values:
+                self._values[label_values] = {"buckets": [0] * len(self.buckets), "sum": 0, "count": 0}
+
+            values = self._values[label_values]
+            values["sum"] += value
+            values["count"] += 1
+
+            # Only the smallest bucket is counted here; buckets are made cumulative when they get exposed
+            values["buckets"][bisect_left(self.buckets, value)] += 1
+
+    def get_count(self, **labels) -> int:
+        values = self._values.get(self._get_label_values(labels))
+
+        return values["count"] if values else 0
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        samples = []
+
+        with self._lock:
+            values = sorted(
+                (label_values, {**value, "buckets": [*value["buckets"]]})
+                for label_values, value in self._values.items()
+            )
+
+        for label_values, value in values:
+            labels = dict(zip(self.labelnames, label_values, strict=True))
+
+            cumulative_count = 0
+
+            for bucket, bucket_count in zip(self.buckets, value["buckets"], strict=True):
+                cumulative_count += bucket_count
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(bucket)}, cumulative_count))
+
+            samples.append((f"{self.name}_sum", labels, value["sum"]))
+            samples.append((f"{self.name}_count", labels, value["count"]))
+
+        return samples
+
+
+class CacheCounter(Counter):
+    """
+    Counts cache hits or misses per cache tier. The render tier is not counted here because `render_cache_stats`
+    already counts it; its total is read from there when the metric gets exposed.
+    """
+
+    def __init__(self, name: str, documentation: str, render_cache_counter_name: str):
+        super().__init__(name, documentation, ("tier",))
+        self.render_cache_counter_name = render_cache_counter_name
+
+    def _get_render_cache_count(self) -> int:
+        from django_unicorn.components.render_cache import render_cache_stats  # noqa: PLC0415
+
+        return getattr(render_cache_stats, self.render_cache_counter_name).total()
+
+    def get(self, **labels) -> float:
+        if labels.get("tier") == "render":
+            return self._get_render_cache_count()
+
+        return super().get(**labels)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        samples = [sample for sample in super().samples() if sample[1]["tier"] != "render"]
+        render_cache_count = self._get_render_cache_count()
+
+        if render_cache_count:
+            samples.append((self.name, {"tier": "render"}, render_cache_count))
+
+        return sorted(samples, key=lambda sample: sample[1]["tier"])
+
+
+class MetricsRegistry:
+    """
+    Keeps track of all metrics, so they can be exposed together.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+
+    def __repr__(self):
+        return f"MetricsRegistry(metrics={len(self.metrics)})"
+
+    def register(self, metric: Metric) -> Any:
+        if metric.name in self.metrics:
+            raise AssertionError(f"{metric.name} is already registered")
+
+        self.metrics[metric.name] = metric
+
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_DURATION_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def generate(self) -> str:
+        """
+        Formats all metrics in the Prometheus text format.
+        """
+
+        return "".join(f"{metric.generate()}\n" for metric in self.metrics.values())
+
+
+registry = MetricsRegistry()
+
+messages = registry.counter("unicorn_messages_total", "Messages handled per component.", ("component",))
+messages_not_modified = registry.counter(
+    "unicorn_messages_not_modified_total",
+    "Messages per component that were answered with a 304 because the DOM did not change.",
+    ("component",),
+)
+message_duration = registry.histogram(
+    "unicorn_message_duration_seconds", "Time to handle a message per component.", ("component",)
+)
+message_payload_size = registry.histogram(
+    "unicorn_message_payload_bytes",
+    "Size of the message payloads per component.",
+    ("component",),
+    buckets=DEFAULT_SIZE_BUCKETS,
+)
+render_duration = registry.histogram(
+    "unicorn_render_duration_seconds", "Time to render a component, including its children.", ("component",)
+)
+serialize_duration = registry.histogram(
+    "unicorn_serialize_duration_seconds", "Time to serialize the data of a component.", ("component",)
+)
+cache_hits = registry.register(CacheCounter("unicorn_cache_hits_total", "Cache hits per cache tier.", "hits"))
+cache_misses = registry.register(CacheCounter("unicorn_cache_misses_total", "Cache misses per cache tier.", "misses"))
+serial_queued = registry.counter(
+    "unicorn_serial_queued_total", "Messages that had to wait for an earlier message to the same component."
+)
+serial_queue_depth = registry.histogram(
+    "unicorn_serial_queue_depth",
+    "Number of messages in the queue of a component when a message gets queued.",
+    buckets=DEFAULT_DEPTH_BUCKETS,
+)
+
+
+def observe_duration(histogram: Histogram):
+    """
+    Decorator for component methods that observes the duration of every call per component name.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(component, *args, **kwargs):
+            if not is_metrics_enabled():
+                return func(component, *args, **kwargs)
+
+            start = time.perf_counter()
+
+            try:
+                return func(component, *args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, component=component.component_name)
+
+        return wrapper
+
+    return decorator
+
+
+def _observe_message(request, component_name: str, duration: float) -> None:
+    messages.inc(component=component_name)
+    message_duration.observe(duration, component=component_name)
+    message_payload_size.observe(len(request.body), component=component_name)
+
+
+def observe_message(func):
+    """
+    Decorator for `UnicornMessageHandler._process_request` that counts the message and observes its duration and
+    payload size. Messages for components that could not be loaded are not counted, so that the number of
+    component names stays limited.
+    """
+
+    @wraps(func)
+    def wrapper(handler, component_request, *args, **kwargs):
+        if not is_metrics_enabled():
+            return func(handler, component_request, *args, **kwargs)
+
+        start = time.perf_counter()
+        component_name = component_request.name
+
+        try:
+            result = func(handler, component_request, *args, **kwargs)
+        except RenderNotModifiedError:
+            messages_not_modified.inc(component=component_name)
+            _observe_message(handler.request, component_name, time.perf_counter() - start)
+            raise
+
+        _observe_message(handler.request, component_name, time.perf_counter() - start)
+
+        return result
+
+    return wrapper
+
+
+def metrics_view(request):  # noqa: ARG001
+    """
+    Returns all metrics in the Prometheus text format. Returns a 404 if `UNICORN["METRICS"]` is not enabled.
+    """
+
+    if not is_metrics_enabled():
+        raise Http404("Metrics are not enabled")
+
+    return HttpResponse(registry.generate(), content_type=PROMETHEUS_CONTENT_TYPE)
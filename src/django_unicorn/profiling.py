@@ -0,0 +1,340 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+import orjson
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from django_unicorn.settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_SINK_SIZE = 100
+
+
+class Span:
+    """
+    A timed section of code with the sizes (e.g. in bytes) of what it handled and the spans that were started
+    inside of it.
+    """
+
+    __slots__ = ("children", "duration", "name", "sizes", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.sizes: dict[str, int] = {}
+        self.children: list[Span] = []
+        self.start = time.perf_counter()
+        self.duration: float | None = None
+
+    def __repr__(self):
+        return f"Span(name='{self.name}', duration={self.duration}, sizes={self.sizes})"
+
+    def add_size(self, name: str, size: int) -> None:
+        self.sizes[name] = self.sizes.get(name, 0) + size
+
+    def finish(self) -> None:
+        # Duration in milliseconds
+        self.duration = (time.perf_counter() - self.start) * 1000
+
+    @property
+    def self_duration(self) -> float:
+        """
+        Duration in milliseconds without the time spent in child spans.
+        """
+
+        return (self.duration or 0) - sum(child.duration or 0 for child in self.children)
+
+    def iter_spans(self):
+        """
+        Iterates over the span and all of its descendants, breadth-first.
+        """
+
+        spans = deque((self,))
+
+        while spans:
+            span = spans.popleft()
+            yield span
+            spans.extend(span.children)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "sizes": self.sizes,
+            "children": [child.as_dict() for child in self.children],
+        }
+
+    def format(self, indent: int = 0) -> str:
+        """
+        Formats the span and its children as an indented tree, e.g. for logging.
+        """
+
+        sizes = "".join(f" {name}={size}" for name, size in self.sizes.items())
+        lines = [f"{'  ' * indent}{self.name}: {self.duration or 0:.3f}ms{sizes}"]
+        lines.extend(child.format(indent + 1) for child in self.children)
+
+        return "\n".join(lines)
+
+
+class NoopSpan:
+    """
+    Stands in for a `Span` when nothing gets profiled.
+    """
+
+    __slots__ = ()
+
+    def add_size(self, name: str, size: int) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("unicorn_current_span", default=None)
+
+
+class LoggingSink:
+    """
+    Logs the tree of every root span to the `django_unicorn.profiling` logger.
+    """
+
+    def emit(self, span: Span) -> None:
+        logger.debug(span.format())
+
+
+class MemorySink:
+    """
+    Keeps the most recent root spans in memory.
+    """
+
+    def __init__(self, size: int = DEFAULT_MEMORY_SINK_SIZE):
+        self.spans: deque[Span] = deque(maxlen=size)
+
+    def emit(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class FileSink:
+    """
+    Appends every root span as one line of JSON to a file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, span: Span) -> None:
+        line = orjson.dumps(span.as_dict(), option=orjson.OPT_APPEND_NEWLINE)
+
+        with self._lock, open(self.path, "ab") as f:
+            f.write(line)
+
+
+def get_profiling_settings() -> dict[str, Any]:
+    profiling_settings = get_setting("PROFILING", {})
+
+    if isinstance(profiling_settings, bool):
+        return {"ENABLED": profiling_settings}
+
+    return profiling_settings
+
+
+def is_profiling_enabled() -> bool:
+    try:
+        return bool(get_profiling_settings().get("ENABLED", False))
+    except ImproperlyConfigured:
+        # Django settings are not configured yet, e.g. when the module is imported by a script
+        return False
+
+
+def is_server_timing_enabled() -> bool:
+    try:
+        return bool(get_profiling_settings().get("SERVER_TIMING", False))
+    except ImproperlyConfigured:
+        return False
+
+
+_sinks: dict[tuple, Any] = {}
+
+
+def get_sink():
+    """
+    Gets the sink for finished root spans from `UNICORN["PROFILING"]["SINK"]`: "logging" (the default), "memory",
+    "file", or the dotted path of a class with an `emit(span)` method. The sink is re-used as long as the settings
+    stay the same.
+    """
+
+    profiling_settings = get_profiling_settings()
+    sink_name = profiling_settings.get("SINK", "logging")
+    sink_key = (sink_name, profiling_settings.get("SIZE"), profiling_settings.get("PATH"))
+
+    if sink_key in _sinks:
+        return _sinks[sink_key]
+
+    if sink_name == "logging":
+        sink = LoggingSink()
+    elif sink_name == "memory":
+        sink = MemorySink(profiling_settings.get("SIZE", DEFAULT_MEMORY_SINK_SIZE))
+    elif sink_name == "file":
+        path = profiling_settings.get("PATH")
+
+        if not path:
+            raise AssertionError('PROFILING["PATH"] is required for the file sink')
+
+        sink = FileSink(path)
+    else:
+        sink = import_string(sink_name)()
+
+    _sinks[sink_key] = sink
+
+    return sink
+
+
+def get_current_span() -> Span | NoopSpan:
+    return _current_span.get() or NOOP_SPAN
+
+
+@contextmanager
+def profile(name: str):
+    """
+    Records a span inside the current span. Does nothing if there is no current span.
+    """
+
+    parent = _current_span.get()
+
+    if parent is None:
+        yield NOOP_SPAN
+        return
+
+    span = Span(name)
+    parent.children.append(span)
+    token = _current_span.set(span)
+
+    try:
+        yield span
+    finally:
+        span.finish()
+        _current_span.reset(token)
+
+
+@contextmanager
+def profile_root(name: str, *, enabled: bool | None = None):
+    """
+    Starts recording spans if profiling is enabled (or `enabled` is `True`) and passes the root span to the
+    sink when it is finished. Inside of another span it records a nested span instead.
+    """
+
+    if _current_span.get() is not None:
+        with profile(name) as span:
+            yield span
+
+        return
+
+    if enabled is None:
+        enabled = is_profiling_enabled()
+
+    if not enabled:
+        yield NOOP_SPAN
+        return
+
+    span = Span(name)
+    token = _current_span.set(span)
+
+    try:
+        yield span
+    finally:
+        span.finish()
+        _current_span.reset(token)
+
+        if is_profiling_enabled():
+            try:
+                get_sink().emit(span)
+            except Exception:
+                logger.exception("Profiling span could not be emitted")
+
+
+def profiled(func=None, *, name: str | None = None):
+    """
+    Decorator that records a span for every call of the function inside of a root span. Returns the function as-is
+    if neither profiling nor `SERVER_TIMING` is enabled when it gets decorated, so that it adds no overhead.
+
+    Can be used as `@profiled` or `@profiled(name="render")`.
+    """
+
+    def decorator(_func):
+        if not is_profiling_enabled() and not is_server_timing_enabled():
+            return _func
+
+        span_name = name or _func.__qualname__
+
+        @wraps(_func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return _func(*args, **kwargs)
+
+            with profile(span_name):
+                return _func(*args, **kwargs)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
+
+def get_phase_durations(span: Span) -> dict[str, float]:
+    """
+    Sums up the time spent in each phase of the span tree. Only the time of a span without its children is counted,
+    so that the phases add up to the duration of the root span.
+    """
+
+    durations: dict[str, float] = {}
+
+    for child in span.iter_spans():
+        durations[child.name] = durations.get(child.name, 0) + child.self_duration
+
+    return durations
+
+
+def get_phase_sizes(span: Span) -> dict[str, int]:
+    """
+    Gets the sizes of the span tree. The size recorded closest to the root wins, so that e.g. the DOM of nested
+    components is not counted twice.
+    """
+
+    sizes: dict[str, int] = {}
+
+    for child in span.iter_spans():
+        for name, size in child.sizes.items():
+            sizes.setdefault(name, size)
+
+    return sizes
+
+
+def get_server_timing(span: Span) -> str:
+    """
+    Formats the phases of the span tree as the value of a `Server-Timing` header.
+    """
+
+    metrics = [f"{name};dur={duration:.3f}" for name, duration in get_phase_durations(span).items()]
+    metrics.append(f"total;dur={span.duration or 0:.3f}")
+
+    return ", ".join(metrics)
+
+
+def get_stats(span: Span) -> str:
+    """
+    Formats the sizes of the span tree as the value of an `X-Unicorn-Stats` header.
+    """
+
+    return ", ".join(f"{name}={size}" for name, size in get_phase_sizes(span).items())
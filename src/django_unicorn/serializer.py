@@ -1,9 +1,16 @@
 import logging
-from datetime import timedelta
+from collections.abc import Callable, Iterator
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from functools import lru_cache
+from enum import Enum
+from functools import lru_cache, partial
+from itertools import islice
+from math import isfinite
+from operator import attrgetter, methodcaller
 from types import MappingProxyType
-from typing import Any
+from typing import Any, NamedTuple
+from uuid import UUID
 
 import orjson
 from django.core.serializers import serialize
@@ -12,10 +19,12 @@ from django.db.models import (
     DateField,
     DateTimeField,
     DurationField,
+    Field,
     Model,
     QuerySet,
     TimeField,
 )
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor
 from django.utils.dateparse import (
     parse_date,
     parse_datetime,
@@ -23,7 +32,9 @@ from django.utils.dateparse import (
     parse_time,
 )
 from django.utils.duration import duration_string
+from django.utils.encoding import is_protected_type
 
+from django_unicorn.settings import get_serializer_chunk_size, get_serializer_max_queryset_rows
 from django_unicorn.utils import is_int, is_non_string_sequence
 
 try:
@@ -31,11 +42,25 @@ try:
 except ImportError:
     PydanticBaseModel = None  # type: ignore
 
+try:
+    from django.db.models import CompositePrimaryKey
+except ImportError:
+    # Only available in Django 5.2+
+    CompositePrimaryKey = None  # type: ignore
+
 
 logger = logging.getLogger(__name__)
 
 django_json_encoder = DjangoJSONEncoder()
 
+# Types that `orjson` serializes to a JSON string without any help
+ORJSON_NATIVE_TYPES = (datetime, date, time, UUID)
+
+JSON_TYPES = (dict, list, tuple, str, int, float)
+
+# Types that don't contain a `dict` that would need to be sorted
+JSON_VALUE_TYPES = frozenset((str, int, bool, float, list, tuple))
+
 
 class JSONDecodeError(Exception):
     pass
@@ -63,50 +88,213 @@ class InvalidFieldAttributeError(Exception):
         super().__init__(message)
 
 
-def _parse_field_values_from_string(model: Model) -> None:
+class FieldSerializer(NamedTuple):
+    """
+    How to serialize one model field. Mirrors Django's serializer: protected values (i.e. `None`, numbers,
+    and dates) are kept and everything else is converted with `value_to_string`.
     """
-    Convert the model fields' value to match the field type if appropriate.
 
-    This is mostly to deal with field string values that will get saved as a date-related field.
+    name: str
+    attname: str
+
+    # Only set if the field overrides the default `Field.value_from_object`
+    value_from_object: Callable | None
+
+    # Only set if the field overrides the default `Field.value_to_string` (i.e. `str(value)`)
+    value_to_string: Callable | None
+
+
+class ManyToManyRelation(NamedTuple):
+    """
+    How to get the related primary keys of a many-to-many field for multiple instances with one query.
+    Mirrors the related manager that `getattr(model, name)` returns.
     """
 
-    for field in model._meta.fields:
-        val = getattr(model, field.attname)
+    name: str
+    related_model: type[Model]
+    query_field_name: str
+    prefetch_cache_name: str
 
-        if not isinstance(val, str):
-            continue
 
-        if isinstance(field, DateTimeField):
-            setattr(model, field.attname, parse_datetime(val))
-        elif isinstance(field, TimeField):
-            setattr(model, field.attname, parse_time(val))
-        elif isinstance(field, DateField):
-            setattr(model, field.attname, parse_date(val))
-        elif isinstance(field, DurationField):
-            setattr(model, field.attname, parse_duration(val))
+class ModelSerializationPlan(NamedTuple):
+    """
+    Everything needed to serialize instances of a model class. Built once per model class from `_meta`.
+    """
 
+    # Date-related fields whose value gets parsed if it is a string: `(attname, parser)`
+    string_parsers: tuple[tuple[str, Callable], ...]
+    fields: tuple[FieldSerializer, ...]
+    # `None` for composite primary keys which get serialized by Django's serializer
+    pk_field: FieldSerializer | None
+    many_to_many_field_names: tuple[str, ...]
 
-def _get_many_to_many_field_related_names(model: Model) -> list[str]:
+    # Many-to-many fields whose related primary keys can be loaded for a whole queryset at once
+    many_to_many_relations: tuple[ManyToManyRelation, ...]
+
+    # Fields from parent models which need to be retrieved manually
+    inherited_fields: tuple[Field, ...]
+
+
+def _get_field_serializer(field: Field) -> FieldSerializer:
+    field_class = type(field)
+
+    value_from_object = None
+    value_to_string = None
+
+    if field_class.value_from_object is not Field.value_from_object:
+        value_from_object = field.value_from_object
+
+    if field_class.value_to_string is not Field.value_to_string:
+        value_to_string = field.value_to_string
+
+    return FieldSerializer(
+        name=field.name,
+        attname=field.attname,
+        value_from_object=value_from_object,
+        value_to_string=value_to_string,
+    )
+
+
+def _get_string_parser(field: Field) -> Callable | None:
+    if isinstance(field, DateTimeField):
+        return parse_datetime
+    elif isinstance(field, TimeField):
+        return parse_time
+    elif isinstance(field, DateField):
+        return parse_date
+    elif isinstance(field, DurationField):
+        return parse_duration
+
+    return None
+
+
+def _get_many_to_many_relation(model_class: type[Model], field_name: str) -> ManyToManyRelation | None:
+    descriptor = getattr(model_class, field_name, None)
+
+    if not isinstance(descriptor, ManyToManyDescriptor):
+        return None
+
+    field = descriptor.field
+
+    if descriptor.reverse:
+        related_model = descriptor.rel.related_model
+        query_field_name = field.name
+        prefetch_cache_name = field.related_query_name()
+        source_field_name = field.m2m_reverse_field_name()
+    else:
+        related_model = descriptor.rel.model
+        query_field_name = field.related_query_name()
+        prefetch_cache_name = field.name
+        source_field_name = field.m2m_field_name()
+
+    source_field = descriptor.through._meta.get_field(source_field_name)
+
+    if not source_field.target_field.primary_key:
+        # Related objects are looked up by a `to_field` instead of the primary key
+        return None
+
+    return ManyToManyRelation(
+        name=field_name,
+        related_model=related_model,
+        query_field_name=query_field_name,
+        prefetch_cache_name=prefetch_cache_name,
+    )
+
+
+@lru_cache(maxsize=128)
+def _get_model_serialization_plan(model_class: type[Model]) -> ModelSerializationPlan:
     """
-    Get the many-to-many fields for a particular model. Returns either the automatically
-    defined field name (i.e. something_set) or the related name.
+    Compiles how to serialize a model class. Fields are the same as Django's serializer produces: the
+    local, serializable fields of the concrete model.
     """
 
-    # Use this internal method so that the fields can be cached
-    @lru_cache(maxsize=128, typed=True)
-    def _get_many_to_many_field_related_names_from_meta(meta):
-        names = []
+    meta = model_class._meta
+
+    string_parsers = []
+
+    for field in meta.fields:
+        string_parser = _get_string_parser(field)
+
+        if string_parser:
+            string_parsers.append((field.attname, string_parser))
+
+    fields = tuple(_get_field_serializer(field) for field in meta.concrete_model._meta.local_fields if field.serialize)
+
+    pk_field = None
+
+    if not (CompositePrimaryKey and isinstance(meta.pk, CompositePrimaryKey)):
+        pk_field = _get_field_serializer(meta.pk)
+
+    many_to_many_field_names = tuple(_get_many_to_many_field_related_names_from_meta(meta))
+
+    many_to_many_relations = []
+
+    for m2m_field_name in many_to_many_field_names:
+        many_to_many_relation = _get_many_to_many_relation(model_class, m2m_field_name)
+
+        if many_to_many_relation:
+            many_to_many_relations.append(many_to_many_relation)
+
+    inherited_fields = []
+
+    if meta.get_parent_list():
+        serialized_names = {field.name for field in fields} | {"pk"} | set(many_to_many_field_names)
 
         for field in meta.get_fields():
+            if field.name in serialized_names or not hasattr(field, "primary_key") or field.primary_key:
+                continue
+
+            # We already serialized the m2m fields, so we can skip them, but need to handle FKs
             if field.is_relation and field.many_to_many:
-                related_name = field.name
+                continue
+
+            inherited_fields.append(field)
+
+    return ModelSerializationPlan(
+        string_parsers=tuple(string_parsers),
+        fields=fields,
+        pk_field=pk_field,
+        many_to_many_field_names=many_to_many_field_names,
+        many_to_many_relations=tuple(many_to_many_relations),
+        inherited_fields=tuple(inherited_fields),
+    )
+
+
+def _parse_field_values_from_string(model: Model) -> None:
+    """
+    Convert the model fields' value to match the field type if appropriate.
 
-                if field.auto_created:
-                    related_name = field.related_name or f"{field.name}_set"
+    This is mostly to deal with field string values that will get saved as a date-related field.
+    """
 
-                names.append(related_name)
+    for attname, string_parser in _get_model_serialization_plan(type(model)).string_parsers:
+        val = getattr(model, attname)
 
-        return names
+        if isinstance(val, str):
+            setattr(model, attname, string_parser(val))
+
+
+@lru_cache(maxsize=128, typed=True)
+def _get_many_to_many_field_related_names_from_meta(meta) -> list[str]:
+    names = []
+
+    for field in meta.get_fields():
+        if field.is_relation and field.many_to_many:
+            related_name = field.name
+
+            if field.auto_created:
+                related_name = field.related_name or f"{field.name}_set"
+
+            names.append(related_name)
+
+    return names
+
+
+def _get_many_to_many_field_related_names(model: Model) -> list[str]:
+    """
+    Get the many-to-many fields for a particular model. Returns either the automatically
+    defined field name (i.e. something_set) or the related name.
+    """
 
     return _get_many_to_many_field_related_names_from_meta(model._meta)
 
@@ -127,6 +315,41 @@ def _get_m2m_field_serialized(model: Model, field_name) -> list:
     return pks
 
 
+def _get_many_to_many_pks(model_class: type[Model], models: list[Model]) -> dict[str, dict[Any, list]]:
+    """
+    Gets the related primary keys of the many-to-many fields for all `models` with one query per field
+    instead of one query per model per field. Fields that are already prefetched are skipped because
+    the cached related objects get used.
+
+    Returns a dictionary of field names to a dictionary of model primary keys to related primary keys.
+    """
+
+    many_to_many_pks: dict[str, dict[Any, list]] = {}
+
+    if not models:
+        return many_to_many_pks
+
+    prefetched_objects_cache = getattr(models[0], "_prefetched_objects_cache", {})
+    model_pks = [model.pk for model in models]
+
+    for relation in _get_model_serialization_plan(model_class).many_to_many_relations:
+        if relation.prefetch_cache_name in prefetched_objects_cache:
+            continue
+
+        related_pks: dict[Any, list] = {}
+
+        related_queryset = relation.related_model._default_manager.filter(
+            **{f"{relation.query_field_name}__in": model_pks}
+        ).values_list(relation.query_field_name, "pk")
+
+        for model_pk, related_pk in related_queryset:
+            related_pks.setdefault(model_pk, []).append(related_pk)
+
+        many_to_many_pks[relation.name] = related_pks
+
+    return many_to_many_pks
+
+
 def _handle_inherited_models(model: Model, model_json: dict):
     """
     Handle if the model has a parent (i.e. the model is a subclass of another model).
@@ -136,58 +359,107 @@ def _handle_inherited_models(model: Model, model_json: dict):
     so those fields need to be retrieved manually.
     """
 
-    if model._meta.get_parent_list():
-        for field in model._meta.get_fields():
-            if field.name not in model_json and hasattr(field, "primary_key") and not field.primary_key:
-                if field.is_relation:
-                    # We already serialized the m2m fields above, so we can skip them, but need to handle FKs
-                    if not field.many_to_many:
-                        foreign_key_field = getattr(model, field.name)
-                        foreign_key_field_pk = getattr(
-                            foreign_key_field,
-                            "pk",
-                            getattr(foreign_key_field, "id", None),
-                        )
-                        model_json[field.name] = foreign_key_field_pk
-                else:
-                    value = getattr(model, field.name)
+    for field in _get_model_serialization_plan(type(model)).inherited_fields:
+        if field.is_relation:
+            foreign_key_field = getattr(model, field.name)
+            foreign_key_field_pk = getattr(
+                foreign_key_field,
+                "pk",
+                getattr(foreign_key_field, "id", None),
+            )
+            model_json[field.name] = foreign_key_field_pk
+        else:
+            value = getattr(model, field.name)
+
+            # Explicitly handle `timedelta`, but use the DjangoJSONEncoder for everything else
+            if isinstance(value, timedelta):
+                value = duration_string(value)
+            else:
+                # Make sure the value is properly serialized
+                value = django_json_encoder.encode(value)
 
-                    # Explicitly handle `timedelta`, but use the DjangoJSONEncoder for everything else
-                    if isinstance(value, timedelta):
-                        value = duration_string(value)
-                    else:
-                        # Make sure the value is properly serialized
-                        value = django_json_encoder.encode(value)
+                # The DjangoJSONEncoder has extra double-quotes for strings so remove them
+                if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
+                    value = value[1:-1]
 
-                        # The DjangoJSONEncoder has extra double-quotes for strings so remove them
-                        if isinstance(value, str) and value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
+            model_json[field.name] = value
 
-                    model_json[field.name] = value
 
+def _get_field_value(model: Model, field_serializer: FieldSerializer) -> Any:
+    """
+    Gets the serialized value of a model field. The same as the value in the output of Django's JSON
+    serializer.
+    """
+
+    if field_serializer.value_from_object:
+        value = field_serializer.value_from_object(model)
+    else:
+        value = getattr(model, field_serializer.attname)
+
+    value_type = type(value)
+
+    if value is None or value_type is int or value_type is bool or value_type is float:
+        return value
+    elif value_type is str and not field_serializer.value_to_string:
+        return value
+    elif is_protected_type(value):
+        if isinstance(value, Decimal):
+            return str(value)
+        elif isinstance(value, datetime | date | time):
+            return django_json_encoder.default(value)
+        elif isinstance(value, int):
+            return int(value)
+
+        return float(value)
+
+    if field_serializer.value_to_string:
+        value = field_serializer.value_to_string(model)
+    else:
+        value = str(value)
 
-def _get_model_dict(model: Model) -> dict:
+    if not isinstance(value, str):
+        # e.g. `JSONField` values
+        value = orjson.loads(django_json_encoder.encode(value))
+
+    return value
+
+
+def _get_composite_pk_value(model: Model) -> Any:
     """
-    Serializes Django models. Uses the built-in Django JSON serializer, but moves the data around to
-    remove some unnecessary information and make the structure more compact.
+    Gets the serialized value of a composite primary key from Django's JSON serializer, because its
+    representation depends on the version of Django.
     """
 
+    # Only serialize the primary key; "pk" is never the `attname` of a field
+    serialized_model = serialize("json", [model], fields=("pk",))
+
+    return orjson.loads(serialized_model)[0]["pk"]
+
+
+def _get_model_dict(model: Model, many_to_many_pks: dict[str, dict[Any, list]] | None = None) -> dict:
+    """
+    Serializes Django models. Generates the same data as the built-in Django JSON serializer, but with
+    a more compact structure: fields are at the top-level along with the `pk`.
+
+    Args:
+        param many_to_many_pks: Related primary keys that were already loaded for many-to-many fields;
+            see `_get_many_to_many_pks`.
+    """
+
+    plan = _get_model_serialization_plan(type(model))
+
     _parse_field_values_from_string(model)
 
-    # Django's `serialize` method always returns a string of an array
-    serialized_model = serialize("json", [model])
+    model_json = {}
+
+    for field_serializer in plan.fields:
+        model_json[field_serializer.name] = _get_field_value(model, field_serializer)
+
+    if plan.pk_field:
+        model_pk = _get_field_value(model, plan.pk_field)
+    else:
+        model_pk = _get_composite_pk_value(model)
 
-    try:
-        # Django's `serialize` method always returns a string of an array,
-        # so remove the brackets from the resulting string
-        model_json = orjson.loads(serialized_model[1:-1])
-    except orjson.JSONDecodeError:
-        # Convert the string into a dictionary and grab the `pk`
-        model_json = orjson.loads(serialized_model)[0]
-    model_pk = model_json.get("pk")
-
-    # Shuffle around the serialized pieces to condense the size of the payload
-    model_json = model_json.get("fields")
     model_json["pk"] = model_pk
 
     # Set `pk` for models that subclass another model which only have `id` set
@@ -195,16 +467,111 @@ def _get_model_dict(model: Model) -> dict:
         model_json["pk"] = model.pk or model.id  # type: ignore
 
     # Add in m2m fields
-    m2m_field_names = _get_many_to_many_field_related_names(model)
-
-    for m2m_field_name in m2m_field_names:
-        model_json[m2m_field_name] = _get_m2m_field_serialized(model, m2m_field_name)
+    for m2m_field_name in plan.many_to_many_field_names:
+        if many_to_many_pks and m2m_field_name in many_to_many_pks:
+            model_json[m2m_field_name] = many_to_many_pks[m2m_field_name].get(model.pk, [])
+        else:
+            model_json[m2m_field_name] = _get_m2m_field_serialized(model, m2m_field_name)
 
     _handle_inherited_models(model, model_json)
 
     return model_json
 
 
+def _limit_queryset_rows(models: Iterator, max_rows: int, model_class: type[Model]) -> Iterator:
+    """
+    Only yields the first `max_rows` models and logs a warning when the rest of the rows get dropped.
+    """
+
+    yield from islice(models, max_rows)
+
+    for _ in models:
+        logger.warning(
+            f"Only the first {max_rows} rows of a {model_class.__name__} queryset were serialized because of "
+            "the SERIALIZER.MAX_QUERYSET_ROWS setting; the other rows will be missing from the component data "
+            "that is sent back with the next request."
+        )
+        break
+
+
+def _iter_queryset_json(queryset: QuerySet) -> Iterator[dict]:
+    """
+    Serializes the models of a queryset one at a time. The queryset is iterated normally so that its result
+    cache gets filled and rendering the template (or caching the component) does not query the database
+    again. Related many-to-many primary keys are loaded once per chunk of models.
+    """
+
+    model_class = queryset.model
+    is_values_queryset = bool(queryset.query.values_select)
+    chunk_size = get_serializer_chunk_size()
+    max_rows = get_serializer_max_queryset_rows()
+
+    models: Iterator = iter(queryset)
+
+    if max_rows is not None:
+        models = _limit_queryset_rows(models, max_rows, model_class)
+
+    while chunk := list(islice(models, chunk_size)):
+        many_to_many_pks = None
+
+        if isinstance(chunk[0], Model):
+            many_to_many_pks = _get_many_to_many_pks(model_class, chunk)
+
+        for model in chunk:
+            if is_values_queryset and isinstance(model, dict):
+                # If the queryset was created with values it's already a dictionary
+                yield model
+            else:
+                yield _get_model_dict(model, many_to_many_pks)
+
+
+def _get_queryset_json(queryset: QuerySet) -> list:
+    return list(_iter_queryset_json(queryset))
+
+
+def _get_component_json(component) -> dict:
+    return {
+        "name": component.component_name,
+        "id": component.component_id,
+        "key": component.component_key,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _get_json_serializer_encoder(obj_type: type) -> Callable[[Any], Any] | None:
+    """
+    Gets the function that converts objects of `obj_type` for `_json_serializer`. Returns `None` if there
+    isn't a specific way to handle the type.
+    """
+
+    from django_unicorn.components import UnicornField, UnicornView  # noqa: PLC0415
+
+    if issubclass(obj_type, UnicornView):
+        return _get_component_json
+    elif issubclass(obj_type, Model):
+        return _get_model_dict
+    elif issubclass(obj_type, QuerySet):
+        return _get_queryset_json
+    elif PydanticBaseModel and issubclass(obj_type, PydanticBaseModel):  # type: ignore
+        if hasattr(obj_type, "model_dump"):
+            # Pydantic v2
+            return partial(obj_type.model_dump, mode="json")
+
+        return obj_type.dict
+    elif issubclass(obj_type, Decimal):
+        return str
+    elif issubclass(obj_type, MappingProxyType):
+        # Return a regular dict for `mappingproxy`
+        return MappingProxyType.copy
+    elif issubclass(obj_type, UnicornField) and obj_type.to_json is UnicornField.to_json:
+        # Skip calling `to_json` since it only returns `__dict__`
+        return vars
+    elif hasattr(obj_type, "to_json"):
+        return methodcaller("to_json")
+
+    return None
+
+
 def _json_serializer(obj):
     """
     Handle the objects that the `orjson` deserializer can't handle automatically.
@@ -215,37 +582,12 @@ def _json_serializer(obj):
     TODO: Investigate other ways to serialize objects automatically.
     e.g. Using DRF serializer: https://www.django-rest-framework.org/api-guide/serializers/#serializing-objects
     """
-    from django_unicorn.components import UnicornView  # noqa: PLC0415
+
+    encoder = _get_json_serializer_encoder(type(obj))
 
     try:
-        if isinstance(obj, UnicornView):
-            return {
-                "name": obj.component_name,
-                "id": obj.component_id,
-                "key": obj.component_key,
-            }
-        elif isinstance(obj, Model):
-            return _get_model_dict(obj)
-        elif isinstance(obj, QuerySet):
-            queryset_json = []
-
-            for model in obj:
-                if obj.query.values_select and isinstance(model, dict):
-                    # If the queryset was created with values it's already a dictionary
-                    model_json = model
-                else:
-                    model_json = _get_model_dict(model)
-
-                queryset_json.append(model_json)
-
-            return queryset_json
-        elif PydanticBaseModel and isinstance(obj, PydanticBaseModel):  # type: ignore
-            return obj.dict()
-        elif isinstance(obj, Decimal):
-            return str(obj)
-        elif isinstance(obj, MappingProxyType):
-            # Return a regular dict for `mappingproxy`
-            return obj.copy()
+        if encoder:
+            return encoder(obj)
         elif hasattr(obj, "to_json"):
             return obj.to_json()
     except Exception as e:
@@ -255,68 +597,76 @@ def _json_serializer(obj):
     raise TypeError
 
 
-def _fix_floats(current: dict, data: dict | None = None, paths: list | None = None) -> None:
+def _sort_key(item: tuple[Any, Any]) -> Any:
     """
-    Recursively change any Python floats to a string so that JavaScript
-    won't convert the float to an integer when deserializing.
-
-    Params:
-        current: Dictionary in which to check for and fix floats.
+    Sort dictionary items by key the same way JavaScript orders object keys, i.e. stringified integers
+    are sorted as if they are integers.
     """
 
-    if data is None:
-        data = current
+    key = item[0]
 
-    if paths is None:
-        paths = []
+    # Skip the (relatively slow) integer check for the common case of keys that start with a letter
+    if type(key) is str and (key[:1].isalpha() or key[:1] == "_"):
+        return key
 
-    if isinstance(current, dict):
-        for key, val in current.items():
-            paths.append(key)
-            _fix_floats(val, data, paths=paths)
-            paths.pop()
-    elif isinstance(current, list):
-        for idx, item in enumerate(current):
-            paths.append(idx)
-            _fix_floats(item, data, paths=paths)
-            paths.pop()
-    elif isinstance(current, float):
-        _piece = data
+    return key if not is_int(key) else int(key)
 
-        for idx, path in enumerate(paths):
-            if idx == len(paths) - 1:
-                # `path` can be a dictionary key or list index,
-                # but in either instance it is set the same way
-                _piece[path] = str(current)
-            else:
-                _piece = _piece[path]
 
+def _get_exclude_tree(exclude_field_attributes: tuple[str, ...] | None) -> dict[str, Any] | None:
+    """
+    Converts field attributes with dots into a tree of nested dictionaries. Attributes that should be
+    removed have a value of `None`.
 
-def _sort_dict(data: dict) -> dict:
+    Example:
+    _get_exclude_tree(("1.2", "1.3.4")) == {"1": {"2": None, "3": {"4": None}}}
     """
-    Recursively sort the dictionary keys so that JavaScript won't change the order
-    and change the generated checksum.
 
-    Params:
-        data: Dictionary to sort.
+    if not exclude_field_attributes:
+        return None
+
+    tree: dict[str, Any] = {}
+
+    for field in exclude_field_attributes:
+        field_splits = field.split(".")
+
+        # Field names without a dot are removed before serializing, so there is nothing to do here
+        if len(field_splits) < 2:  # noqa: PLR2004
+            continue
+
+        node: dict[str, Any] | None = tree
+
+        for field_split in field_splits[:-1]:
+            if field_split not in node:
+                node[field_split] = {}
+
+            node = node[field_split]
+
+            if node is None:
+                # A parent attribute is already excluded
+                break
+        else:
+            node[field_splits[-1]] = None
+
+    return tree or None
+
+
+def _check_exclude_tree(data: Any, field_name: str, exclude_tree: dict[str, Any]) -> None:
+    """
+    Make sure all of the attributes in `exclude_tree` are in `data`.
     """
 
-    if not isinstance(data, dict):
-        return data
+    is_dict = isinstance(data, dict)
 
-    items = [
-        [k, v]
-        for k, v in sorted(
-            data.items(),
-            key=lambda item: item[0] if not is_int(item[0]) else int(item[0]),
-        )
-    ]
+    for field_attr, subtree in exclude_tree.items():
+        if is_dict and field_attr in data:
+            continue
 
-    for item in items:
-        if isinstance(item[1], dict):
-            item[1] = _sort_dict(item[1])
+        if subtree is None:
+            raise InvalidFieldAttributeError(
+                field_name=field_name, field_attr=field_attr, data={field_name: data} if is_dict else None
+            )
 
-    return dict(items)
+        raise InvalidFieldNameError(field_name=field_attr, data=data if is_dict else None)
 
 
 def _exclude_field_attributes(dict_data: dict[Any, Any], exclude_field_attributes: tuple[str] | None = None) -> None:
@@ -327,64 +677,185 @@ def _exclude_field_attributes(dict_data: dict[Any, Any], exclude_field_attribute
     _exclude_field_attributes({"1": {"2": {"3": "4"}}}, ("1.2.3",)) == {"1": {"2": {}}}
     """
 
-    if exclude_field_attributes:
-        for field in exclude_field_attributes:
-            field_splits = field.split(".")
-            nested_attribute_split_count = 2
+    def _exclude(data: dict, field_name: str, exclude_tree: dict[str, Any]) -> None:
+        _check_exclude_tree(data, field_name, exclude_tree)
 
-            if len(field_splits) > nested_attribute_split_count:
-                next_attribute_index = field.index(".") + 1
-                remaining_field_attributes = field[next_attribute_index:]
-                remaining_dict_data = dict_data[field_splits[0]]
+        for field_attr, subtree in exclude_tree.items():
+            if subtree is None:
+                del data[field_attr]
+            elif data[field_attr] is not None:
+                _exclude(data[field_attr], field_attr, subtree)
 
-                return _exclude_field_attributes(remaining_dict_data, (remaining_field_attributes,))
-            elif len(field_splits) == nested_attribute_split_count:
-                (field_name, field_attr) = field_splits
+    exclude_tree = _get_exclude_tree(exclude_field_attributes)
 
-                if field_name not in dict_data:
-                    raise InvalidFieldNameError(field_name=field_name, data=dict_data)
+    if exclude_tree:
+        _exclude(dict_data, "", exclude_tree)
 
-                if dict_data[field_name] is not None:
-                    if field_attr not in dict_data[field_name]:
-                        raise InvalidFieldAttributeError(field_name=field_name, field_attr=field_attr, data=dict_data)
 
-                    del dict_data[field_name][field_attr]
+def _to_orjson_type(obj: Any) -> Any:
+    """
+    Let `orjson` handle anything else it knows about natively; raises `orjson.JSONEncodeError` otherwise.
+    """
 
+    return orjson.loads(orjson.dumps(obj))
 
-@lru_cache(maxsize=128, typed=True)
-def _dumps(
-    serialized_data: bytes,
-    *,
-    fix_floats: bool = True,
-    exclude_field_attributes: tuple[str] | None = None,
-    sort_dict: bool = True,
-) -> dict:
+
+def _get_dataclass_encoder(obj_type: type) -> Callable[[Any], dict]:
+    field_names = tuple(field.name for field in fields(obj_type))
+
+    def encode_dataclass(obj) -> dict:
+        return {field_name: getattr(obj, field_name) for field_name in field_names}
+
+    return encode_dataclass
+
+
+def _get_json_serializer_fallback_encoder(encoder: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def encode_or_fallback(obj):
+        try:
+            return encoder(obj)
+        except Exception as e:
+            # Log this because the `TypeError` and resulting stacktrace lacks context
+            logger.exception(e)
+
+        return _to_orjson_type(obj)
+
+    return encode_or_fallback
+
+
+def _to_json_type_fallback(obj: Any) -> Any:
+    try:
+        return _json_serializer(obj)
+    except TypeError:
+        return _to_orjson_type(obj)
+
+
+def _return_obj(obj: Any) -> Any:
+    return obj
+
+
+@lru_cache(maxsize=1024)
+def _get_type_encoder(obj_type: type) -> Callable[[Any], Any]:
+    """
+    Gets the function that converts objects of `obj_type` into something that can be encoded. The encoder
+    only gets looked up once per type, so nested objects of the same type skip the `isinstance` checks.
+    """
+
+    if issubclass(obj_type, Enum):
+        return attrgetter("value")
+    elif issubclass(obj_type, dict):
+        return dict
+    elif issubclass(obj_type, list | tuple):
+        return list
+    elif issubclass(obj_type, float):
+        return float
+    elif issubclass(obj_type, str | int) or issubclass(obj_type, ORJSON_NATIVE_TYPES):
+        return _return_obj
+    elif is_dataclass(obj_type):
+        return _get_dataclass_encoder(obj_type)
+
+    encoder = _get_json_serializer_encoder(obj_type)
+
+    if encoder:
+        return _get_json_serializer_fallback_encoder(encoder)
+
+    # Objects might still have an instance `to_json`
+    return _to_json_type_fallback
+
+
+def _to_json_type(obj: Any) -> Any:
+    """
+    Converts an object that is not a JSON type into something that can be encoded. Returns `obj` if
+    `orjson` can serialize it as-is.
+    """
+
+    return _get_type_encoder(type(obj))(obj)
+
+
+def _encode(data: Any, *, fix_floats: bool, sort_dict: bool, exclude_tree: dict[str, Any] | None) -> Any:
     """
-    Dump serialized data with custom massaging.
+    Converts `data` into JSON types in one pass: objects are converted with `_json_serializer`,
+    floats are fixed, dictionaries are sorted, and field attributes are excluded along the way.
 
-    Features:
-       - fix floats
-       - remove specific keys as needed
-       - sort dictionary
+    The result is the same as serializing with `orjson`, de-serializing, and then massaging the data,
+    but without the round-trip.
     """
 
-    data = orjson.loads(serialized_data)
+    def encode(obj):
+        obj_type = type(obj)
+
+        if obj_type is str or obj_type is int or obj_type is bool or obj is None:
+            return obj
+        elif obj_type is float:
+            # Convert floats to a string so that JavaScript won't convert the float to an integer
+            return str(obj) if fix_floats and isfinite(obj) else obj
+        elif obj_type is dict:
+            return {key: encode(value) for key, value in obj.items()}
+        elif obj_type is list or obj_type is tuple:
+            return [encode(item) for item in obj]
+        elif isinstance(obj, QuerySet):
+            # Encode each model as soon as it is serialized so only the encoded rows are kept
+            return [encode(model_json) for model_json in _iter_queryset_json(obj)]
+
+        json_obj = _to_json_type(obj)
+
+        return obj if json_obj is obj else encode(json_obj)
+
+    def encode_sorted(obj):
+        # Only dictionaries that are nested in dictionaries get sorted
+        obj_type = type(obj)
+
+        if obj_type is dict:
+            # Sort dictionary manually because stringified integers don't get sorted
+            # correctly with `orjson.OPT_SORT_KEYS` and JavaScript will sort the keys
+            # as if they are integers
+            return dict(sorted([(key, encode_sorted(value)) for key, value in obj.items()], key=_sort_key))
+        elif obj_type in JSON_VALUE_TYPES or obj is None or isinstance(obj, QuerySet):
+            return encode(obj)
 
-    if fix_floats:
-        _fix_floats(data)
+        json_obj = _to_json_type(obj)
 
-    if exclude_field_attributes:
-        # Excluding field attributes needs to de-serialize and then serialize again to
-        # handle complex objects
-        _exclude_field_attributes(data, exclude_field_attributes)
+        if json_obj is obj or isinstance(json_obj, list):
+            return encode(json_obj)
 
-    if sort_dict:
-        # Sort dictionary manually because stringified integers don't get sorted
-        # correctly with `orjson.OPT_SORT_KEYS` and JavaScript will sort the keys
-        # as if they are integers
-        data = _sort_dict(data)
+        return encode_sorted(json_obj)
 
-    return data
+    def encode_excluded(obj, field_name, exclude_tree):
+        while not isinstance(obj, JSON_TYPES):
+            json_obj = _to_json_type(obj)
+
+            if json_obj is obj:
+                break
+
+            obj = json_obj
+
+        _check_exclude_tree(obj, field_name, exclude_tree)
+
+        items = []
+
+        for key, value in obj.items():
+            subtree = exclude_tree.get(key, False)
+
+            if subtree is None:
+                # Excluded attributes don't need to be encoded
+                continue
+            elif subtree and value is not None:
+                items.append((key, encode_excluded(value, key, subtree)))
+            elif sort_dict:
+                items.append((key, encode_sorted(value)))
+            else:
+                items.append((key, encode(value)))
+
+        if sort_dict:
+            items.sort(key=_sort_key)
+
+        return dict(items)
+
+    if exclude_tree:
+        return encode_excluded(data, "", exclude_tree)
+    elif sort_dict:
+        return encode_sorted(data)
+
+    return encode(data)
 
 
 def dumps(
@@ -414,17 +885,14 @@ def dumps(
     if exclude_field_attributes is not None and not is_non_string_sequence(exclude_field_attributes):
         raise AssertionError("exclude_field_attributes type needs to be a sequence")
 
-    # Call `dumps` to make sure that complex objects are serialized correctly
-    serialized_data = orjson.dumps(data, default=_json_serializer)
-
-    data = _dumps(
-        serialized_data,
-        fix_floats=fix_floats,
-        exclude_field_attributes=exclude_field_attributes,
-        sort_dict=sort_dict,
-    )
+    exclude_tree = _get_exclude_tree(exclude_field_attributes)
 
-    serialized_data = orjson.dumps(data)
+    if not fix_floats and not sort_dict and not exclude_tree:
+        # Nothing needs to be massaged, so `orjson` can do all of the work
+        serialized_data = orjson.dumps(data, default=_json_serializer)
+    else:
+        encoded_data = _encode(data, fix_floats=fix_floats, sort_dict=sort_dict, exclude_tree=exclude_tree)
+        serialized_data = orjson.dumps(encoded_data)
 
     return serialized_data.decode("utf-8")
 
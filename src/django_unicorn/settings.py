@@ -38,6 +38,10 @@ def get_serial_settings():
     return get_setting("SERIAL", {})
 
 
+def get_serializer_settings():
+    return get_setting("SERIALIZER", {})
+
+
 def get_cache_alias():
     return get_setting("CACHE_ALIAS", "default")
 
@@ -98,6 +102,41 @@ def get_serial_timeout():
     return get_serial_settings().get("TIMEOUT", 60)
 
 
+def get_serializer_chunk_size():
+    """
+    Default chunk size for iterating over querysets is 2000.
+    """
+    return get_serializer_settings().get("CHUNK_SIZE", 2000)
+
+
+def get_serializer_max_queryset_rows():
+    """
+    Default is `None`, i.e. all rows of a queryset get serialized.
+    """
+    return get_serializer_settings().get("MAX_QUERYSET_ROWS")
+
+
+def get_serializer_data_size_warning():
+    """
+    Default is to warn when a component's data is larger than 1,000,000 characters.
+    """
+    return get_serializer_settings().get("DATA_SIZE_WARNING", 1_000_000)
+
+
+def get_call_method_parser_cache_size():
+    """
+    Default is to cache the 1024 most recently parsed method calls (and kwargs).
+    """
+    return get_setting("CALL_METHOD_PARSER_CACHE_SIZE", 1024)
+
+
+def get_lazy_max_age():
+    """
+    Default is for lazy components to be renderable for one day (in seconds) after the page was rendered.
+    """
+    return get_setting("LAZY_MAX_AGE", 60 * 60 * 24)
+
+
 def get_minify_html_enabled():
     minify_html_enabled = get_setting("MINIFY_HTML", False)
 
@@ -11,6 +11,7 @@ import {
   hasValue,
   isEmpty,
   isFunction,
+  parseCall,
   walk,
   FilterSkipNested,
 } from "./utils.js";
@@ -249,6 +250,16 @@ export class Component {
       payload: { name: methodName },
       partials,
     };
+
+    // Send the arguments as JSON when possible so the server doesn't have to parse the method call
+    const call = parseCall(methodName);
+
+    if (call) {
+      action.payload.method = call.method;
+      action.payload.args = call.args;
+      action.payload.kwargs = call.kwargs;
+    }
+
     this.actionQueue.push(action);
 
     // Debounce timeout defaults to 0 in element.js to remove any perceived lag, but can be overridden
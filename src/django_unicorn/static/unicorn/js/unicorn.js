@@ -1,9 +1,10 @@
 import { Component } from "./component.js";
-import { isEmpty, hasValue } from "./utils.js";
+import { getCsrfToken, isEmpty, hasValue } from "./utils.js";
 import { components, lifecycleEvents } from "./store.js";
 import { getMorpher } from "./morpher.js";
 
 let messageUrl = "";
+let renderUrl = "";
 let csrfTokenHeaderName = "X-CSRFToken";
 let csrfTokenCookieName = "csrftoken";
 let morpher;
@@ -17,10 +18,15 @@ export function init(
   _messageUrl,
   _csrfTokenHeaderName,
   _csrfTokenCookieName,
-  _morpherSettings
+  _morpherSettings,
+  _renderUrl
 ) {
   messageUrl = _messageUrl;
 
+  if (hasValue(_renderUrl)) {
+    renderUrl = _renderUrl;
+  }
+
   morpher = getMorpher(_morpherSettings);
 
   if (hasValue(_csrfTokenHeaderName)) {
@@ -38,6 +44,11 @@ export function init(
           if (node.nodeType === Node.ELEMENT_NODE) {
             scan(node);
           }
+
+          // A streamed component is complete once the parser added the node after it
+          if (isStreamedComponent(node.previousSibling)) {
+            swapStreamedComponent(node.previousSibling);
+          }
         });
       });
     });
@@ -48,8 +59,14 @@ export function init(
     });
   }
 
+  if (typeof document !== "undefined") {
+    scanLazy(document);
+    scanStreamed(document);
+  }
+
   return {
     messageUrl,
+    renderUrl,
     csrfTokenHeaderName,
     csrfTokenCookieName,
     morpher,
@@ -113,6 +130,157 @@ export function scan(root) {
   elements.forEach((element) => {
     insertComponentFromDom(element);
   });
+
+  scanLazy(root);
+}
+
+// Placeholders of lazy components that are already waiting to get loaded
+const lazyElements = new WeakSet();
+
+/**
+ * Replaces the placeholder of a lazy component with the component rendered by the server.
+ *
+ * @param {Element} el The placeholder element with a `unicorn:lazy` attribute.
+ */
+export function loadLazyComponent(el) {
+  const headers = {
+    Accept: "application/json",
+    "X-Requested-With": "XMLHttpRequest",
+  };
+  headers[csrfTokenHeaderName] = getCsrfToken({
+    document,
+    csrfTokenCookieName,
+  });
+
+  return fetch(`${renderUrl}/${el.getAttribute("unicorn:name")}`, {
+    method: "POST",
+    headers,
+    body: JSON.stringify({ lazy: el.getAttribute("unicorn:lazy") }),
+  })
+    .then((response) => {
+      if (response.ok) {
+        return response.json();
+      }
+
+      throw Error(
+        `Error when getting response: ${response.statusText} (${response.status})`
+      );
+    })
+    .then((responseJson) => {
+      if (responseJson.error) {
+        throw Error(responseJson.error);
+      }
+
+      const template = document.createElement("template");
+      template.innerHTML = responseJson.dom.trim();
+
+      const componentRoot = template.content.firstElementChild;
+      el.replaceWith(template.content);
+
+      if (componentRoot) {
+        scan(componentRoot);
+      }
+    })
+    .catch((err) => {
+      console.error(err);
+    });
+}
+
+/**
+ * Loads the lazy component when the placeholder becomes visible or when the browser is idle,
+ * depending on the `unicorn:lazy:trigger` attribute.
+ *
+ * @param {Element} el The placeholder element with a `unicorn:lazy` attribute.
+ */
+function observeLazyComponent(el) {
+  if (lazyElements.has(el)) {
+    return;
+  }
+
+  lazyElements.add(el);
+
+  const trigger = el.getAttribute("unicorn:lazy:trigger");
+
+  if (trigger !== "idle" && typeof IntersectionObserver !== "undefined") {
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        observer.disconnect();
+        loadLazyComponent(el);
+      }
+    });
+
+    observer.observe(el);
+  } else if (typeof requestIdleCallback !== "undefined") {
+    requestIdleCallback(() => loadLazyComponent(el));
+  } else {
+    setTimeout(() => loadLazyComponent(el), 1);
+  }
+}
+
+/**
+ * Scans the DOM for placeholders of lazy components and starts observing them.
+ * @param {Element} root The root element to scan.
+ */
+function scanLazy(root) {
+  if (root.hasAttribute && root.hasAttribute("unicorn:lazy")) {
+    observeLazyComponent(root);
+  }
+
+  root.querySelectorAll("[unicorn\\:lazy]").forEach((element) => {
+    observeLazyComponent(element);
+  });
+}
+
+/**
+ * Whether the node is the `<template>` of a component that was streamed after the rest of the page.
+ *
+ * @param {Node} node The node to check.
+ */
+function isStreamedComponent(node) {
+  return (
+    !!node &&
+    node.nodeType === Node.ELEMENT_NODE &&
+    node.tagName === "TEMPLATE" &&
+    node.hasAttribute("unicorn:stream:for")
+  );
+}
+
+/**
+ * Replaces the placeholder of a streamed component with the rendered component in the `<template>`.
+ *
+ * @param {Element} template The `<template>` element with a `unicorn:stream:for` attribute.
+ */
+export function swapStreamedComponent(template) {
+  const componentId = template.getAttribute("unicorn:stream:for");
+  const placeholder = Array.from(
+    document.querySelectorAll("[unicorn\\:stream]")
+  ).find((el) => el.getAttribute("unicorn:stream") === componentId);
+
+  const componentRoot = template.content.firstElementChild;
+  template.remove();
+
+  if (placeholder) {
+    placeholder.replaceWith(template.content);
+
+    if (componentRoot) {
+      scan(componentRoot);
+    }
+  }
+}
+
+/**
+ * Swaps in the streamed components that were added before Unicorn got initialized.
+ * @param {Element} root The root element to scan.
+ */
+function scanStreamed(root) {
+  root
+    .querySelectorAll("template[unicorn\\:stream\\:for]")
+    .forEach((template) => {
+      // The last template might still be parsed while the page is loading
+      if (template.nextSibling || document.readyState !== "loading") {
+        swapStreamedComponent(template);
+      }
+    });
 }
 
 /**
@@ -218,3 +218,189 @@ export function toRegExp(str) {
   });
   return new RegExp(regexp);
 }
+
+const CALL_NAME_REGEX = /^\$?[A-Za-z_][A-Za-z0-9_]*/;
+const CALL_TOKEN_REGEX =
+  /[ \t]*(?:('[^'\\\n\r]*'|"[^"\\\n\r]*")|(-?(?:0|[1-9][0-9]*))(?![A-Za-z0-9_.])|([A-Za-z_][A-Za-z0-9_]*)|([()[\]{},:=]))/y;
+const CALL_CONSTANTS = { True: true, False: false, None: null };
+
+function hasOwn(obj, key) {
+  return Object.prototype.hasOwnProperty.call(obj, key);
+}
+
+/**
+ * Tokenizes the arguments of a method call. Returns `null` for anything unexpected.
+ */
+function tokenizeCall(func, start) {
+  const tokens = [];
+  CALL_TOKEN_REGEX.lastIndex = start;
+
+  while (CALL_TOKEN_REGEX.lastIndex < func.length) {
+    const idx = CALL_TOKEN_REGEX.lastIndex;
+    const match = CALL_TOKEN_REGEX.exec(func);
+
+    if (!match) {
+      if (func.slice(idx).trim() === "") {
+        break;
+      }
+
+      return null;
+    }
+
+    if (match[1] !== undefined) {
+      tokens.push({ type: "string", value: match[1].slice(1, -1) });
+    } else if (match[2] !== undefined) {
+      tokens.push({ type: "number", value: match[2] });
+    } else if (match[3] !== undefined) {
+      tokens.push({ type: "name", value: match[3] });
+    } else {
+      tokens.push({ type: "punctuation", value: match[4] });
+    }
+  }
+
+  return tokens;
+}
+
+/**
+ * Parses a method call (e.g. `select(1234, flag=True)`) into the method name, arguments and keyword
+ * arguments so they can be sent to the server as JSON.
+ *
+ * Only handles arguments whose types stay the same after being converted to JSON: strings without
+ * escape characters, integers, `True`, `False`, `None`, lists and dictionaries with string keys.
+ *
+ * Returns `null` if the method call can't be parsed; the server will parse the method call instead.
+ */
+export function parseCall(func) {
+  if (typeof func !== "string") {
+    return null;
+  }
+
+  const nameMatch = CALL_NAME_REGEX.exec(func);
+
+  if (!nameMatch) {
+    return null;
+  }
+
+  const method = nameMatch[0];
+
+  if (method.length === func.length) {
+    return { method, args: [], kwargs: {} };
+  }
+
+  const tokens = tokenizeCall(func, method.length);
+
+  if (!tokens) {
+    return null;
+  }
+
+  let idx = 0;
+  const invalid = {};
+
+  const next = () => tokens[idx++] || invalid;
+  const peek = (offset = 0) => tokens[idx + offset] || invalid;
+  const isPunctuation = (token, value) =>
+    token.type === "punctuation" && token.value === value;
+
+  function parseValue() {
+    const token = next();
+
+    if (token.type === "string") {
+      return token.value;
+    } else if (token.type === "number") {
+      const value = Number(token.value);
+
+      if (!Number.isSafeInteger(value)) {
+        throw Error("Unsafe integer");
+      }
+
+      return value;
+    } else if (token.type === "name" && hasOwn(CALL_CONSTANTS, token.value)) {
+      return CALL_CONSTANTS[token.value];
+    } else if (isPunctuation(token, "[")) {
+      const items = [];
+
+      while (!isPunctuation(peek(), "]")) {
+        items.push(parseValue());
+
+        if (!isPunctuation(peek(), "]") && !isPunctuation(next(), ",")) {
+          throw Error("Invalid list");
+        }
+      }
+
+      next();
+
+      return items;
+    } else if (isPunctuation(token, "{")) {
+      const items = {};
+
+      while (!isPunctuation(peek(), "}")) {
+        const key = next();
+
+        if (key.type !== "string" || key.value === "__proto__") {
+          throw Error("Invalid dictionary key");
+        }
+
+        if (!isPunctuation(next(), ":")) {
+          throw Error("Invalid dictionary");
+        }
+
+        items[key.value] = parseValue();
+
+        if (!isPunctuation(peek(), "}") && !isPunctuation(next(), ",")) {
+          throw Error("Invalid dictionary");
+        }
+      }
+
+      next();
+
+      return items;
+    }
+
+    throw Error("Invalid value");
+  }
+
+  const args = [];
+  const kwargs = {};
+
+  try {
+    if (!isPunctuation(next(), "(")) {
+      return null;
+    }
+
+    while (!isPunctuation(peek(), ")")) {
+      if (peek().type === "name" && isPunctuation(peek(1), "=")) {
+        const kwarg = next().value;
+        next();
+
+        if (
+          hasOwn(kwargs, kwarg) ||
+          hasOwn(CALL_CONSTANTS, kwarg) ||
+          kwarg === "__proto__"
+        ) {
+          return null;
+        }
+
+        kwargs[kwarg] = parseValue();
+      } else if (Object.keys(kwargs).length > 0) {
+        // Positional arguments can't come after keyword arguments
+        return null;
+      } else {
+        args.push(parseValue());
+      }
+
+      if (!isPunctuation(peek(), ")") && !isPunctuation(next(), ",")) {
+        return null;
+      }
+    }
+
+    next();
+  } catch (err) {
+    return null;
+  }
+
+  if (idx !== tokens.length) {
+    return null;
+  }
+
+  return { method, args, kwargs };
+}
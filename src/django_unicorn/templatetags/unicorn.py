@@ -1,12 +1,17 @@
+import logging
+from typing import NamedTuple
+
 import shortuuid
 from django import template
 from django.conf import settings
-from django.template.base import FilterExpression
+from django.template.base import FilterExpression, Variable
 
 from django_unicorn.call_method_parser import InvalidKwargError, parse_kwarg
 from django_unicorn.errors import ComponentNotValidError
 from django_unicorn.settings import get_morpher_settings
 
+logger = logging.getLogger(__name__)
+
 register = template.Library()
 
 
@@ -40,6 +45,49 @@ def unicorn_errors(context):
     return {"unicorn": {"errors": context.get("unicorn", {}).get("errors", {})}}
 
 
+class UnparseableKwarg(NamedTuple):
+    """
+    A kwarg of the `unicorn` template tag whose value is a template variable.
+    """
+
+    value: str
+    variable: FilterExpression | Variable
+
+    # Fallback for `model.id` variables to `model.pk`
+    pk_variable: FilterExpression | Variable | None = None
+
+
+UNICORN_VARIABLE = Variable("unicorn")
+IMPLICIT_PARENT_VARIABLE = Variable("unicorn.component")
+
+
+def compile_variable(parser, value: str) -> FilterExpression | Variable:
+    """
+    Compiles a template variable when the template gets parsed. Falls back to a plain `Variable` for values
+    that are not valid `FilterExpression`s (e.g. with an unknown filter), which only fail to resolve.
+    """
+
+    try:
+        return parser.compile_filter(value)
+    except template.TemplateSyntaxError:
+        return Variable(value)
+
+
+def resolve_variable(variable: FilterExpression | Variable, context):
+    """
+    Resolves a compiled template variable. Unlike `FilterExpression.resolve`, a missing variable raises
+    `VariableDoesNotExist` instead of returning `string_if_invalid`.
+    """
+
+    if isinstance(variable, FilterExpression):
+        if variable.filters or not isinstance(variable.var, Variable):
+            return variable.resolve(context)
+
+        variable = variable.var
+
+    return variable.resolve(context)
+
+
 def unicorn(parser, token):
     contents = token.split_contents()
 
@@ -60,10 +108,17 @@ def unicorn(parser, token):
         except InvalidKwargError:
             # Assume it's an arg if invalid kwarg and kwargs is empty
             if not kwargs:
-                args.append(arg)
+                args.append(compile_variable(parser, arg))
         except ValueError:
             parsed_kwarg = parse_kwarg(arg, raise_if_unparseable=False)
-            unparseable_kwargs.update(parsed_kwarg)
+
+            for key, value in parsed_kwarg.items():
+                pk_variable = None
+
+                if value.endswith(".id"):
+                    pk_variable = compile_variable(parser, value.replace(".id", ".pk"))
+
+                unparseable_kwargs[key] = UnparseableKwarg(value, compile_variable(parser, value), pk_variable)
 
     return UnicornNode(component_name, args, kwargs, unparseable_kwargs)
 
@@ -72,9 +127,9 @@ class UnicornNode(template.Node):
     def __init__(
         self,
         component_name: FilterExpression,
-        args: list | None = None,
+        args: list[FilterExpression | Variable] | None = None,
         kwargs: dict | None = None,
-        unparseable_kwargs: dict | None = None,
+        unparseable_kwargs: dict[str, UnparseableKwarg] | None = None,
     ):
         self.component_name = component_name
         self.args = args if args is not None else []
@@ -90,24 +145,27 @@ class UnicornNode(template.Node):
             request = context.request
 
         from django_unicorn.components import UnicornView  # noqa: PLC0415
+        from django_unicorn.components.lazy import (  # noqa: PLC0415
+            LazyComponent,
+            get_lazy_trigger,
+            render_lazy_placeholder,
+        )
+        from django_unicorn.components.render_cache import render_component  # noqa: PLC0415
+        from django_unicorn.components.streaming import STREAM_CONTEXT_KEY, StreamedComponent  # noqa: PLC0415
+        from django_unicorn.components.unicorn_template_response import LazyContext  # noqa: PLC0415
 
-        resolved_args = []
-
-        for value in self.args:
-            resolved_arg = template.Variable(value).resolve(context)
-            resolved_args.append(resolved_arg)
-
+        resolved_args = [resolve_variable(arg, context) for arg in self.args]
         resolved_kwargs = self.kwargs.copy()
 
-        for key, value in self.unparseable_kwargs.items():
+        for key, (value, variable, pk_variable) in self.unparseable_kwargs.items():
             try:
-                resolved_value = template.Variable(value).resolve(context)
+                resolved_value = resolve_variable(variable, context)
 
                 if key == "parent" and value == "view" and not isinstance(resolved_value, UnicornView):
                     # Handle rendering a parent component from a template that is called from
                     # a `TemplateView`; for some reason `view` is clobbered in this instance, but
                     # the `unicorn` dictionary has enough data to instantiate a `UnicornView`
-                    parent_component_data = template.Variable("unicorn").resolve(context)
+                    parent_component_data = UNICORN_VARIABLE.resolve(context)
 
                     resolved_value = UnicornView(
                         component_name=parent_component_data.get("component_name"),
@@ -118,11 +176,9 @@ class UnicornNode(template.Node):
             except TypeError:
                 resolved_kwargs.update({key: value})
             except template.VariableDoesNotExist:
-                if value.endswith(".id"):
-                    pk_val = value.replace(".id", ".pk")
-
+                if pk_variable is not None:
                     try:
-                        resolved_kwargs.update({key: template.Variable(pk_val).resolve(context)})
+                        resolved_kwargs.update({key: resolve_variable(pk_variable, context)})
                     except TypeError:
                         resolved_kwargs.update({key: value})
                     except template.VariableDoesNotExist:
@@ -131,13 +187,16 @@ class UnicornNode(template.Node):
         if "key" in resolved_kwargs:
             self.component_key = resolved_kwargs.pop("key")
 
+        lazy_trigger = get_lazy_trigger(resolved_kwargs.pop("lazy", None))
+        stream = resolved_kwargs.pop("stream", False)
+
         if "parent" in resolved_kwargs:
             self.parent = resolved_kwargs.pop("parent")
         else:
             # if there is no explicit parent, but this node is rendering under an existing
             # unicorn template, set that as the parent
             try:
-                implicit_parent = template.Variable("unicorn.component").resolve(context)
+                implicit_parent = IMPLICIT_PARENT_VARIABLE.resolve(context)
                 if implicit_parent:
                     self.parent = implicit_parent
             except template.VariableDoesNotExist:
@@ -179,6 +238,42 @@ class UnicornNode(template.Node):
         # Useful for unit test
         self.component_id = component_id
 
+        if lazy_trigger and not (
+            self.parent and any(child.component_id == component_id for child in self.parent.children)
+        ):
+            # Render a placeholder unless the component was already loaded, e.g. when the parent re-renders
+            lazy_component = LazyComponent(
+                component_id=component_id,
+                component_name=component_name,
+                component_key=self.component_key,
+                parent_cache_key=self.parent.component_cache_key if self.parent else None,
+                args=resolved_args,
+                kwargs=resolved_kwargs,
+            )
+
+            try:
+                return render_lazy_placeholder(lazy_component, lazy_trigger)
+            except TypeError as e:
+                logger.warning(f"'{component_name}' is not rendered lazily because its arguments are not JSON: {e}")
+
+        if stream:
+            # Components are only streamed when the page is rendered with a stream, e.g. by `render_stream`;
+            # otherwise (e.g. when the parent re-renders) they are rendered right away
+            component_stream = context.get(STREAM_CONTEXT_KEY)
+
+            if component_stream is not None:
+                streamed_component = StreamedComponent(
+                    component_id=component_id,
+                    component_name=component_name,
+                    component_key=self.component_key,
+                    parent=self.parent,
+                    args=resolved_args,
+                    kwargs=resolved_kwargs,
+                    extra_context=context.flatten(),
+                )
+
+                return component_stream.defer(streamed_component)
+
         self.view = UnicornView.create(
             component_id=component_id,
             component_name=component_name,
@@ -189,11 +284,7 @@ class UnicornNode(template.Node):
             kwargs=resolved_kwargs,
         )
 
-        extra_context = {}
-        for c in context:
-            extra_context.update(c)
-
-        rendered_component = self.view.render(init_js=True, extra_context=extra_context)
+        rendered_component = render_component(self.view, init_js=True, extra_context=LazyContext(context))
 
         return rendered_component
 
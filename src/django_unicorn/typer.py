@@ -1,7 +1,9 @@
 import inspect
 import logging
+from collections.abc import Callable
 from dataclasses import is_dataclass
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 from inspect import signature
 from typing import Any, Union
 
@@ -58,8 +60,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-type_hints_cache = LRUCache(maxsize=100)
-function_signature_cache = LRUCache(maxsize=100)
+type_hints_cache = LRUCache(maxsize=1000)
+function_signature_cache = LRUCache(maxsize=1000)
+type_hints_key_kinds_cache = LRUCache(maxsize=1000)
 
 
 def _parse_bool(value):
@@ -78,110 +81,244 @@ CASTERS = {
 }
 
 
+def _get_type_hints_key_kind(obj) -> str:
+    if inspect.isclass(obj) or inspect.ismodule(obj):
+        return "object"
+
+    if inspect.ismethod(obj):
+        return "method"
+
+    if inspect.isroutine(obj):
+        return "object"
+
+    if hasattr(obj, "__class__"):
+        return "class"
+
+    return "object"
+
+
+def _get_type_hints_key(obj) -> Any:
+    """Get the object that type hints get looked up (and cached) for.
+
+    Instances use their class and bound methods use their underlying function, so that type hints are shared
+    between every instance of a component instead of being cached per instance.
+    """
+
+    obj_type = type(obj)
+
+    try:
+        kind = type_hints_key_kinds_cache[obj_type]
+    except KeyError:
+        # The `inspect` checks only depend on the type of the object, so they get cached per type
+        kind = _get_type_hints_key_kind(obj)
+        type_hints_key_kinds_cache[obj_type] = kind
+
+    if kind == "class":
+        # Should be called with class object (instead of instance) to get type hints of parent classes. From docs:
+        # "If obj is a class C, the function returns a dictionary that merges annotations from C's base classes with
+        # those on C directly. This is done by traversing C.__mro__ and iteratively combining __annotations__
+        # dictionaries." (https://docs.python.org/3/library/typing.html#typing.get_type_hints)
+        return obj.__class__
+
+    if kind == "method":
+        return obj.__func__
+
+    return obj
+
+
 def get_type_hints(obj) -> dict:
-    """Get type hints from an object. These get cached in a local memory cache for quicker look-up later.
+    """Get type hints from an object. These get cached in a local memory cache keyed by the class (or function)
+    for quicker look-up later.
 
     Returns:
         An empty dictionary if no type hints can be retrieved.
     """
 
-    type_hints = {}
+    key = _get_type_hints_key(obj)
 
     try:
-        if obj in type_hints_cache:
-            return type_hints_cache[obj]
+        return type_hints_cache[key]
+    except KeyError:
+        pass
     except TypeError:
-        # Ignore issues with checking for an object in the cache, e.g. when a Django model is missing a PK
+        # Ignore issues with checking for an object in the cache, e.g. when it is not hashable
         pass
 
     try:
-        if inspect.isclass(obj) or inspect.ismodule(obj) or inspect.isroutine(obj):
-            type_hints = typing_get_type_hints(obj)
-        elif hasattr(obj, "__class__"):
-            # Should be called with class object (instead of instance) to get type hints of parent classes. From docs:
-            # "If obj is a class C, the function returns a dictionary that merges annotations from C's base classes with
-            # those on C directly. This is done by traversing C.__mro__ and iteratively combining __annotations__
-            # dictionaries." (https://docs.python.org/3/library/typing.html#typing.get_type_hints)
-            type_hints = typing_get_type_hints(obj.__class__)
-        else:
-            type_hints = typing_get_type_hints(obj)
+        type_hints = typing_get_type_hints(key)
     except (TypeError, NameError):
         # Fallback to __annotations__ if get_type_hints fails, which can happen in some environments
         # (e.g. Python 3.11 with coverage instrumentation)
-        type_hints = getattr(obj, "__annotations__", {})
+        type_hints = getattr(key, "__annotations__", {})
 
     try:
         # Cache the type hints just in case
-        type_hints_cache[obj] = type_hints
+        type_hints_cache[key] = type_hints
     except TypeError:
         pass
 
     return type_hints
 
 
-def cast_value(type_hint, value):
-    """Try to cast the value based on the type hint and
-    `django_unicorn.call_method_parser.CASTERS`.
+# Returned by a caster step when it could not cast the value, so the next type hint gets tried
+_NOT_CAST = object()
 
-    Additional features:
-    - convert `int`/`float` epoch to `datetime` or `date`
-    - instantiate the `type_hint` class with passed-in value
+
+def _compile_cast_date_step(type_hint, caster: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def cast_date(value):
+        try:
+            return caster(value)
+        except TypeError:
+            if isinstance(value, float | int):
+                try:
+                    value = datetime.fromtimestamp(value, tz=timezone.utc)
+
+                    if type_hint is date:
+                        return value.date()
+
+                    return value
+                except ValueError:
+                    pass
+
+        return _NOT_CAST
+
+    return cast_date
+
+
+def _compile_cast_step(type_hint) -> tuple[Callable[[Any], Any] | None, bool]:
+    """Compile the function that casts a value for one (non-`Union`) type hint.
+
+    Returns:
+        A tuple of the function (or `None` if the type hint should be skipped) and whether the function always
+        casts the value, i.e. never returns `_NOT_CAST`.
     """
 
-    type_hints = []
+    caster = CASTERS.get(type_hint)
 
-    if get_origin(type_hint) is Union or get_origin(type_hint) is UnionType or get_origin(type_hint) is list:
-        for arg in get_args(type_hint):
-            type_hints.append(arg)
+    if caster:
+        if type_hint is datetime or type_hint is date:
+            return (_compile_cast_date_step(type_hint, caster), False)
+
+        def cast_with_caster(value):
+            try:
+                return caster(value)
+            except TypeError:
+                return _NOT_CAST
+
+        return (cast_with_caster, False)
+
+    if isinstance(type_hint, type) and issubclass(type_hint, Model):
+        return (None, False)
+
+    try:
+        is_keyword_type = _check_pydantic(type_hint) or is_dataclass(type_hint)
+    except TypeError as e:
+        error_args = e.args
+
+        # Raise when the value gets cast to match the behavior of casting without a compiled caster
+        def raise_type_error(value):  # noqa: ARG001
+            raise TypeError(*error_args)
+
+        return (raise_type_error, True)
+
+    if is_keyword_type:
+
+        def cast_with_keywords(value):
+            return type_hint(**value)
+
+        return (cast_with_keywords, True)
+
+    return (type_hint, True)
+
+
+def _compile_caster(type_hint) -> Callable[[Any], Any]:
+    """Compile the function that casts a value based on the type hint. See `cast_value` for details."""
+
+    origin = get_origin(type_hint)
+
+    if origin is Union or origin is UnionType or origin is list:
+        type_hints = get_args(type_hint)
     else:
-        type_hints.append(type_hint)
+        type_hints = (type_hint,)
 
-    if get_origin(type_hint) is list:
-        if len(type_hints) == 1:
-            # There should only be one argument for a list type hint
-            arg = type_hints[0]
+    if origin is list and len(type_hints) == 1:
+        # Handle type hints that are a list by looping over the value and
+        # casting each item individually
+        item_caster = get_caster(type_hints[0])
 
-            # Handle type hints that are a list by looping over the value and
-            # casting each item individually
-            return [cast_value(arg, item) for item in value]
+        def cast_list(value):
+            return [item_caster(item) for item in value]
 
-    # Handle Optional type hint and the value is None
-    if type(None) in type_hints and value is None:
-        return value
+        return cast_list
+
+    is_optional = type(None) in type_hints
+    steps = []
+    always_casts = False
 
     for _type_hint in type_hints:
-        if _type_hint == type(None):  # noqa: E721
+        if _type_hint is type(None):
             continue
 
-        caster = CASTERS.get(_type_hint)
+        (step, step_always_casts) = _compile_cast_step(_type_hint)
 
-        if caster:
-            try:
-                value = caster(value)
-                break
-            except TypeError:
-                if (_type_hint is datetime or _type_hint is date) and (isinstance(value, float | int)):
-                    try:
-                        value = datetime.fromtimestamp(value, tz=timezone.utc)
+        if step is None:
+            continue
 
-                        if _type_hint is date:
-                            value = value.date()
+        steps.append(step)
+        always_casts = step_always_casts
 
-                        break
-                    except ValueError:
-                        pass
-        else:
-            if isinstance(_type_hint, type) and issubclass(_type_hint, Model):
-                continue
+        if always_casts:
+            # Later type hints would never get tried
+            break
 
-            if _check_pydantic(_type_hint) or is_dataclass(_type_hint):
-                value = _type_hint(**value)
-                break
+    if not is_optional and len(steps) == 1 and always_casts:
+        return steps[0]
 
-            value = _type_hint(value)
-            break
+    def cast(value):
+        # Handle Optional type hint and the value is None
+        if is_optional and value is None:
+            return value
 
-    return value
+        for step in steps:
+            cast_value = step(value)
+
+            if cast_value is not _NOT_CAST:
+                return cast_value
+
+        return value
+
+    return cast
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_caster(type_hint) -> Callable[[Any], Any]:
+    return _compile_caster(type_hint)
+
+
+def get_caster(type_hint) -> Callable[[Any], Any]:
+    """Get a function that casts a value based on the type hint. The function gets compiled once per type hint.
+
+    The function raises a `TypeError` if the type hint can't be instantiated with the value.
+    """
+
+    try:
+        hash(type_hint)
+    except TypeError:
+        return _compile_caster(type_hint)
+
+    return _get_cached_caster(type_hint)
+
+
+def cast_value(type_hint, value):
+    """Try to cast the value based on the type hint and
+    `django_unicorn.call_method_parser.CASTERS`.
+
+    Additional features:
+    - convert `int`/`float` epoch to `datetime` or `date`
+    - instantiate the `type_hint` class with passed-in value
+    """
+
+    return get_caster(type_hint)(value)
 
 
 def cast_attribute_value(obj, name, value):
@@ -205,19 +342,43 @@ def cast_attribute_value(obj, name, value):
 
 
 def get_method_arguments(func) -> list[str]:
-    """Gets the arguments for a method.
+    """Gets the arguments for a method. Bound methods are cached by their underlying function, so the arguments
+    are shared between every instance of a component.
 
     Returns:
         A list of strings, one for each argument.
     """
 
-    if func in function_signature_cache:
-        return function_signature_cache[func]
+    if inspect.ismethod(func):
+        # The arguments of a bound method don't include `self`, so cache it separately from the function
+        key = ("method", func.__func__)
+    else:
+        key = func
+
+    if key in function_signature_cache:
+        return function_signature_cache[key]
+
+    function_signature_cache[key] = list(signature(func).parameters)
+
+    return function_signature_cache[key]
+
 
-    function_signature = signature(func)
-    function_signature_cache[func] = list(function_signature.parameters)
+def _is_queryset_type_hint(type_hint) -> bool:
+    """Whether the type hint is a `QuerySetType` (or a `Union` that includes one)."""
 
-    return function_signature_cache[func]
+    if get_origin(type_hint) is QuerySetType:
+        return True
+    elif get_origin(type_hint) is Union or get_origin(type_hint) is UnionType:
+        for arg in get_args(type_hint):
+            if get_origin(arg) is QuerySetType:
+                return True
+
+    return False
+
+
+@lru_cache(maxsize=1024)
+def _is_queryset_type_hint_cached(type_hint) -> bool:
+    return _is_queryset_type_hint(type_hint)
 
 
 def is_queryset(obj, type_hint, value):
@@ -227,17 +388,37 @@ def is_queryset(obj, type_hint, value):
     is_queryset_type = False
 
     if type_hint:
-        if get_origin(type_hint) is QuerySetType:
-            is_queryset_type = True
-        elif get_origin(type_hint) is Union or get_origin(type_hint) is UnionType:
-            for arg in get_args(type_hint):
-                if get_origin(arg) is QuerySetType:
-                    is_queryset_type = True
-                    break
+        try:
+            hash(type_hint)
+        except TypeError:
+            is_queryset_type = _is_queryset_type_hint(type_hint)
+        else:
+            is_queryset_type = _is_queryset_type_hint_cached(type_hint)
 
     return ((isinstance(obj, QuerySet) or is_queryset_type) and isinstance(value, list)) or isinstance(value, QuerySet)
 
 
+@lru_cache(maxsize=128)
+def _get_model_field_column_names(model_type) -> dict[str, str]:
+    """Get the column name to set for each field name of a model. `pk` maps to the primary key."""
+
+    column_names = {}
+
+    for field in model_type._meta.fields:
+        column_name = field.name
+
+        if field.is_relation:
+            column_name = field.attname
+
+        # The first matching field wins
+        column_names.setdefault(field.name, column_name)
+
+        if field.primary_key:
+            column_names.setdefault("pk", column_name)
+
+    return column_names
+
+
 def _construct_model(model_type, model_data: dict):
     """Construct a model based on the type and dictionary data."""
 
@@ -245,18 +426,13 @@ def _construct_model(model_type, model_data: dict):
         return None
 
     model = model_type()
+    column_names = _get_model_field_column_names(model_type)
 
     for field_name, field_value in model_data.items():
-        for field in model._meta.fields:
-            if field.name == field_name or (field_name == "pk" and field.primary_key):
-                column_name = field.name
-
-                if field.is_relation:
-                    column_name = field.attname
+        column_name = column_names.get(field_name)
 
-                setattr(model, column_name, field_value)
-
-                break
+        if column_name:
+            setattr(model, column_name, field_value)
 
     return model
 
@@ -312,25 +488,46 @@ def create_queryset(obj, type_hint, value) -> QuerySet:
         # `model` attribute in that case
         model_type = queryset.model
 
+    # The following portion uses the internal `_result_cache` QuerySet API which
+    # is private and could potentially change in the future, but not sure how
+    # else to change internal models or append a new model to a QuerySet (probably
+    # because it isn't really allowed)
+    if queryset._result_cache is None:
+        # Explicitly set `_result_cache` to an empty list
+        queryset._result_cache = []
+
+    result_cache = queryset._result_cache
+
+    # Indexes of the models in `_result_cache` keyed by their `pk`
+    pk_indexes: dict[Any, list[int]] = {}
+
+    def _index_model(idx, model):
+        if hasattr(model, "pk"):
+            try:
+                pk_indexes.setdefault(model.pk, []).append(idx)
+            except TypeError:
+                pass
+
+    for idx, model in enumerate(result_cache):
+        _index_model(idx, model)
+
     for model_value in value:
-        model_found = False
-
-        # The following portion uses the internal `_result_cache` QuerySet API which
-        # is private and could potentially change in the future, but not sure how
-        # else to change internal models or append a new model to a QuerySet (probably
-        # because it isn't really allowed)
-        if queryset._result_cache is None:
-            # Explicitly set `_result_cache` to an empty list
-            queryset._result_cache = []
-
-        for idx, model in enumerate(queryset._result_cache):
-            if hasattr(model, "pk") and model.pk == model_value.get("pk"):
-                constructed_model = _construct_model(model_type, model_value)
-                queryset._result_cache[idx] = constructed_model
-                model_found = True
+        model_pk = model_value.get("pk")
 
-        if not model_found:
+        try:
+            indexes = pk_indexes.pop(model_pk, None)
+        except TypeError:
+            # An unhashable `pk` can't match any model
+            indexes = None
+
+        if indexes:
+            for idx in indexes:
+                constructed_model = _construct_model(model_type, model_value)
+                result_cache[idx] = constructed_model
+                _index_model(idx, constructed_model)
+        else:
             constructed_model = _construct_model(model_type, model_value)
-            queryset._result_cache.append(constructed_model)
+            result_cache.append(constructed_model)
+            _index_model(len(result_cache) - 1, constructed_model)
 
     return queryset
@@ -8,4 +8,6 @@ app_name = "django_unicorn"
 urlpatterns = (
     re_path(r"message/(?P<component_name>[\w/\.-]+)", views.message, name="message"),
     path("message", views.message, name="message"),  # Only here to build the correct url in scripts.html
+    re_path(r"render/(?P<component_name>[\w/\.-]+)", views.render, name="render"),
+    path("render", views.render, name="render"),  # Only here to build the correct url in scripts.html
 )
@@ -1,9 +1,12 @@
+import hashlib
 import hmac
 import logging
 from collections.abc import Callable, Sequence, Set
+from functools import lru_cache
 from inspect import signature
 from pprint import pprint
 
+import orjson
 import shortuuid
 from django.conf import settings
 from django.template import engines
@@ -30,9 +33,165 @@ def html_element_to_string(element: html.HtmlElement, **kwargs) -> str:
     return html.tostring(element, encoding="unicode", **kwargs)
 
 
+# Checksums are prefixed with the version so that checksums from a previous version can still be validated
+CHECKSUM_VERSION = "2"
+
+CHECKSUM_DIGEST_SIZE = 8
+
+FIELD_HASH_DIGEST_SIZE = 16
+
+
+def _to_json_bytes(data) -> bytes:
+    # Canonical JSON so that the hash does not depend on the order of the keys
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+
+@lru_cache(maxsize=8)
+def _get_checksum_hash(secret_key: str):
+    """
+    Gets a BLAKE2 hash that is keyed with the secret key. It gets copied for every checksum instead of being
+    keyed again.
+    """
+
+    # BLAKE2 keys can be at most 64 bytes, so the secret key gets hashed first
+    key = hashlib.blake2b(str.encode(secret_key), person=b"unicorn:key").digest()
+
+    return hashlib.blake2b(key=key, digest_size=CHECKSUM_DIGEST_SIZE, person=b"unicorn:checksum")
+
+
+def get_field_hash(field_name: str, value) -> bytes:
+    """
+    Hashes one field of the component data. It is not keyed, because only the checksum that combines the field
+    hashes needs to be.
+    """
+
+    field_hash = hashlib.blake2b(digest_size=FIELD_HASH_DIGEST_SIZE, person=b"unicorn:field")
+    field_hash.update(str.encode(field_name))
+    field_hash.update(b"\0")
+    field_hash.update(_to_json_bytes(value))
+
+    return field_hash.digest()
+
+
+def get_field_hashes(data: dict) -> dict[str, bytes]:
+    return {field_name: get_field_hash(field_name, value) for field_name, value in data.items()}
+
+
+def combine_field_hashes(field_hashes: dict[str, bytes]) -> str:
+    """
+    Generates the checksum of the component data from the hashes of its fields.
+    """
+
+    checksum_hash = _get_checksum_hash(settings.SECRET_KEY).copy()
+
+    # The field names are part of the field hashes, which all have the same size
+    checksum_hash.update(b"".join(field_hashes[field_name] for field_name in sorted(field_hashes)))
+
+    return f"{CHECKSUM_VERSION}:{checksum_hash.hexdigest()}"
+
+
+def _is_same_value(value, other) -> bool:
+    """
+    Whether the values would be serialized the same. Unlike `==` the types have to match, e.g. `1` and `True` or
+    `1` and `1.0` are different values.
+    """
+
+    if value is other:
+        return True
+
+    if type(value) is not type(other):
+        return False
+
+    if isinstance(value, dict):
+        return value.keys() == other.keys() and all(_is_same_value(value[key], other[key]) for key in value)
+
+    if isinstance(value, list | tuple):
+        return len(value) == len(other) and all(
+            _is_same_value(item, other_item) for item, other_item in zip(value, other, strict=True)
+        )
+
+    if value is None or isinstance(value, str | int):
+        return value == other
+
+    # Other types, e.g. floats (`0.0 == -0.0`) or decimals (`Decimal("1.0") == Decimal("1.00")`), can be equal
+    # but get serialized differently
+    return _to_json_bytes(value) == _to_json_bytes(other)
+
+
+class FieldChecksums:
+    """
+    The hashes of every field of the component data. The checksum combines the field hashes, so when the data
+    changes only the fields that are different need to be hashed again.
+
+    The data is kept to find the fields that changed, so it should not be mutated afterwards.
+    """
+
+    __slots__ = ("data", "field_hashes")
+
+    def __init__(self, data: dict, field_hashes: dict[str, bytes] | None = None):
+        self.data = data
+
+        if field_hashes is None:
+            self.field_hashes = get_field_hashes(data)
+        else:
+            self.field_hashes = {
+                field_name: field_hashes.get(field_name) or get_field_hash(field_name, value)
+                for field_name, value in data.items()
+            }
+
+    def __repr__(self):
+        return f"FieldChecksums(fields={list(self.field_hashes)})"
+
+    @property
+    def checksum(self) -> str:
+        return combine_field_hashes(self.field_hashes)
+
+    def update(self, data: dict) -> "FieldChecksums":
+        """
+        Gets the field checksums for the new data by only hashing the fields that changed.
+        """
+
+        field_hashes = {}
+
+        for field_name, value in data.items():
+            field_hash = self.field_hashes.get(field_name)
+
+            if field_hash is None or field_name not in self.data or not _is_same_value(self.data[field_name], value):
+                field_hash = get_field_hash(field_name, value)
+
+            field_hashes[field_name] = field_hash
+
+        return FieldChecksums(data, field_hashes)
+
+
 def generate_checksum(data: bytes | str | dict | None) -> str:
     """Generates a checksum for the passed-in data.
 
+    Args:
+        data: The raw input to generate the checksum against. The checksum of a `dict` is combined from the
+            hashes of its fields.
+
+    Returns:
+        The generated checksum.
+    """
+
+    if isinstance(data, dict):
+        return combine_field_hashes(get_field_hashes(data))
+
+    if isinstance(data, str):
+        data = str.encode(data)
+    elif not isinstance(data, bytes):
+        raise TypeError(f"Invalid type: {type(data)}")
+
+    checksum_hash = _get_checksum_hash(settings.SECRET_KEY).copy()
+    checksum_hash.update(data)
+
+    return f"{CHECKSUM_VERSION}:{checksum_hash.hexdigest()}"
+
+
+def generate_legacy_checksum(data: bytes | str | dict | None) -> str:
+    """Generates a checksum like versions before `CHECKSUM_VERSION` 2 did.
+
     Args:
         data: The raw input to generate the checksum against.
 
@@ -61,6 +220,54 @@ def generate_checksum(data: bytes | str | dict | None) -> str:
     return checksum
 
 
+def is_valid_checksum(
+    checksum: str, data: bytes | str | dict | None, *, field_checksums: FieldChecksums | None = None
+) -> bool:
+    """Checks whether the checksum matches the passed-in data.
+
+    Checksums from before `CHECKSUM_VERSION` 2 (e.g. from a page that was rendered before an upgrade) are still
+    valid, so they get rolled over to the current version with the next response.
+
+    Args:
+        checksum: The checksum to check.
+        data: The raw input the checksum was generated against.
+        field_checksums: The already hashed fields of `data`.
+
+    Returns:
+        Whether the checksum matches.
+    """
+
+    if not isinstance(checksum, str):
+        return False
+
+    if checksum.startswith(f"{CHECKSUM_VERSION}:"):
+        if field_checksums is not None:
+            return hmac.compare_digest(checksum, field_checksums.checksum)
+
+        return hmac.compare_digest(checksum, generate_checksum(data))
+
+    return hmac.compare_digest(checksum, generate_legacy_checksum(data))
+
+
+def generate_content_hash(data: bytes | str) -> str:
+    """Generates a hash of rendered content, e.g. to check whether the DOM changed. Unlike `generate_checksum`, it
+    is not keyed, so it can't be used to validate data from the frontend.
+
+    Args:
+        data: The raw input to generate the hash against.
+
+    Returns:
+        The generated hash.
+    """
+
+    if isinstance(data, str):
+        data = str.encode(data)
+    elif not isinstance(data, bytes):
+        raise TypeError(f"Invalid type: {type(data)}")
+
+    return hashlib.blake2b(data, digest_size=CHECKSUM_DIGEST_SIZE).hexdigest()
+
+
 def dicts_equal(dictionary_one: dict, dictionary_two: dict) -> bool:
     """
     Return True if all keys and values are the same between two dictionaries.
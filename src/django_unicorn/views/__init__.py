@@ -6,8 +6,19 @@ from django.http.response import HttpResponseNotModified
 from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie
 from django.views.decorators.http import require_POST
 
-from django_unicorn.decorators import timed
-from django_unicorn.errors import RenderNotModifiedError, UnicornViewError
+from django_unicorn.cacher import restore_from_cache
+from django_unicorn.components import UnicornView
+from django_unicorn.components.lazy import loads_lazy_component
+from django_unicorn.errors import LazyComponentExpiredError, RenderNotModifiedError, UnicornViewError
+from django_unicorn.profiling import (
+    Span,
+    get_server_timing,
+    get_stats,
+    is_server_timing_enabled,
+    profile,
+    profile_root,
+)
+from django_unicorn.serializer import JSONDecodeError, loads
 from django_unicorn.views.message import UnicornMessageHandler
 from django_unicorn.views.request import ComponentRequest
 
@@ -23,6 +34,8 @@ def handle_error(view_func):
     def wrapped_view(*args, **kwargs):
         try:
             return view_func(*args, **kwargs)
+        except LazyComponentExpiredError as e:
+            return JsonResponse({"error": str(e)}, status=400)
         except UnicornViewError as e:
             return JsonResponse({"error": str(e)})
         except RenderNotModifiedError:
@@ -33,7 +46,34 @@ def handle_error(view_func):
     return wraps(view_func)(wrapped_view)
 
 
-@timed
+def profile_request(name: str):
+    """
+    Profiles the request and adds the time spent in each phase and the payload sizes to the response headers if
+    `PROFILING["SERVER_TIMING"]` is enabled.
+    """
+
+    def decorator(view_func):
+        def wrapped_view(request, *args, **kwargs):
+            server_timing = is_server_timing_enabled()
+
+            # Spans get recorded for the headers even if profiling is disabled
+            with profile_root(name, enabled=server_timing or None) as span:
+                span.add_size("payload", len(request.body))
+                response = view_func(request, *args, **kwargs)
+                span.add_size("response", len(response.content))
+
+            if server_timing and isinstance(span, Span):
+                response["Server-Timing"] = get_server_timing(span)
+                response["X-Unicorn-Stats"] = get_stats(span)
+
+            return response
+
+        return wraps(view_func)(wrapped_view)
+
+    return decorator
+
+
+@profile_request("message")
 @handle_error
 @ensure_csrf_cookie
 @csrf_protect  # type: ignore
@@ -62,8 +102,71 @@ def message(request: HttpRequest, component_name: str | None = None) -> JsonResp
     if not component_name:
         raise AssertionError("Missing component name in url")
 
-    component_request = ComponentRequest(request, component_name)
+    with profile("parse"):
+        component_request = ComponentRequest(request, component_name)
+
     handler = UnicornMessageHandler(request)
     json_result = handler.handle(component_request)
 
     return JsonResponse(json_result, json_dumps_params={"separators": (",", ":")})
+
+
+@profile_request("lazy-render")
+@handle_error
+@ensure_csrf_cookie
+@csrf_protect  # type: ignore
+@require_POST  # type: ignore
+def render(request: HttpRequest, component_name: str | None = None) -> JsonResponse:  # type: ignore
+    """
+    Endpoint that renders a component that was deferred with `lazy=True` in the `unicorn` template tag.
+
+    Args:
+        param request: HttpRequest for the function-based view.
+        param: component_name: Name of the component, e.g. "hello-world".
+
+    Returns:
+        `JsonResponse` with the following structure in the body:
+        {
+        "id": component_id,
+        "dom": html,  # rendered component
+        }
+    """
+
+    if not component_name:
+        raise AssertionError("Missing component name in url")
+
+    try:
+        body = loads(request.body)
+    except JSONDecodeError as e:
+        raise UnicornViewError("Body could not be parsed") from e
+
+    if not isinstance(body, dict) or not body.get("lazy"):
+        raise AssertionError("Missing lazy component")
+
+    lazy_component = loads_lazy_component(body["lazy"])
+
+    if lazy_component.component_name != component_name:
+        raise AssertionError("Invalid component name")
+
+    parent = None
+
+    if lazy_component.parent_cache_key:
+        parent = restore_from_cache(lazy_component.parent_cache_key, request=request)
+
+    component = UnicornView.create(
+        component_id=lazy_component.component_id,
+        component_name=lazy_component.component_name,
+        component_key=lazy_component.component_key,
+        parent=parent,
+        request=request,
+        component_args=lazy_component.args,
+        kwargs=lazy_component.kwargs,
+    )
+
+    # The frontend initializes the component from the attributes of the root element
+    rendered_component = component.render(request=request)
+
+    return JsonResponse(
+        {"id": component.component_id, "dom": rendered_component},
+        json_dumps_params={"separators": (",", ":")},
+    )
@@ -1,6 +1,6 @@
 from typing import Any
 
-from django_unicorn.call_method_parser import parse_call_method_name
+from django_unicorn.call_method_parser import parse_call_method_name, parse_call_method_payload
 
 
 class Action:
@@ -40,7 +40,8 @@ class CallMethod(Action):
     def __init__(self, data: dict[str, Any]):
         super().__init__(data)
         call_method_name = self.payload.get("name", "")
-        self.method_name, self.args, kwargs = parse_call_method_name(call_method_name)
+        parsed_call_method = parse_call_method_payload(self.payload) or parse_call_method_name(call_method_name)
+        self.method_name, self.args, kwargs = parsed_call_method
         self.kwargs = dict(kwargs)
 
     def __repr__(self):
@@ -68,7 +69,8 @@ class Toggle(Action):
         # We need to parse args similar to CallMethod
         super().__init__(data)
         call_method_name = self.payload.get("name", "")
-        self.method_name, self.args, kwargs = parse_call_method_name(call_method_name)
+        parsed_call_method = parse_call_method_payload(self.payload) or parse_call_method_name(call_method_name)
+        self.method_name, self.args, kwargs = parsed_call_method
         self.kwargs = dict(kwargs)
 
     def __repr__(self):
@@ -10,10 +10,11 @@ from django.db.models import Model
 from django_unicorn.call_method_parser import (
     InvalidKwargError,
     parse_call_method_name,
+    parse_call_method_payload,
     parse_kwarg,
 )
 from django_unicorn.components import UnicornView
-from django_unicorn.decorators import timed
+from django_unicorn.profiling import profiled
 from django_unicorn.typer import cast_value, get_type_hints
 from django_unicorn.utils import get_method_arguments
 from django_unicorn.views.action_parsers.utils import set_property_value
@@ -51,7 +52,13 @@ def handle(component_request: ComponentRequest, component: UnicornView, payload:
 
             call_method_name = call_method_name[8:]
 
-    (method_name, args, kwargs) = parse_call_method_name(call_method_name)
+    parsed_call_method = None
+
+    if call_method_name == payload["name"]:
+        # Use the arguments that were already parsed by the frontend; `$parent` calls always get parsed
+        parsed_call_method = parse_call_method_payload(payload)
+
+    (method_name, args, kwargs) = parsed_call_method or parse_call_method_name(call_method_name)
     return_data = Return(method_name, args, kwargs)
     setter_method = {}
 
@@ -59,7 +66,7 @@ def handle(component_request: ComponentRequest, component: UnicornView, payload:
     is_reset_called = False
     validate_all_fields = False
 
-    if "=" in call_method_name:
+    if parsed_call_method is None and "=" in call_method_name:
         try:
             setter_method = parse_kwarg(call_method_name, raise_if_unparseable=True)
         except InvalidKwargError:
@@ -127,7 +134,7 @@ def handle(component_request: ComponentRequest, component: UnicornView, payload:
     )
 
 
-@timed
+@profiled
 def _call_method_name(component: UnicornView, method_name: str, args: tuple[Any], kwargs: dict[str, Any]) -> Any:
     """
     Calls the method name with parameters.
@@ -197,7 +204,7 @@ def _call_method_name(component: UnicornView, method_name: str, args: tuple[Any]
             return func()
 
 
-@timed
+@profiled
 def _get_property_value(component: UnicornView, property_name: str) -> Any:
     """
     Gets property value from the component based on the property name.
@@ -1,9 +1,14 @@
 from django_unicorn.components import UnicornView
-from django_unicorn.views.action_parsers.utils import set_property_value
+from django_unicorn.views.action_parsers.utils import ManyToManySets, set_property_value
 from django_unicorn.views.request import ComponentRequest
 
 
-def handle(component_request: ComponentRequest, component: UnicornView, payload: dict):
+def handle(
+    component_request: ComponentRequest,
+    component: UnicornView,
+    payload: dict,
+    many_to_many_sets: ManyToManySets | None = None,
+):
     property_name = payload.get("name")
     property_value = payload.get("value")
 
@@ -18,5 +23,10 @@ def handle(component_request: ComponentRequest, component: UnicornView, payload:
             call_resolved_method = True
 
     set_property_value(
-        component, property_name, property_value, component_request.data, call_resolved_method=call_resolved_method
+        component,
+        property_name,
+        property_value,
+        component_request.data,
+        call_resolved_method=call_resolved_method,
+        many_to_many_sets=many_to_many_sets,
     )
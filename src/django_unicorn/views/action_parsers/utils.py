@@ -1,18 +1,114 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from django.db.models import QuerySet
 
 from django_unicorn.components import UnicornView
-from django_unicorn.decorators import timed
+from django_unicorn.profiling import profiled
 
 
-@timed
+class RelationField(NamedTuple):
+    """
+    A relation of a model that can be set as a nested property.
+    """
+
+    field: Any
+    is_many_to_many: bool
+
+
+@lru_cache(maxsize=128)
+def get_relation_fields(model_type) -> dict[str, RelationField]:
+    """
+    Gets the relations of a model keyed by the attribute name that sets them. Many-to-many relations use their
+    related name (or `{name}_set` for reverse relations without one) and other relations use the field name.
+    Cached per model class.
+    """
+
+    relation_fields = {}
+
+    for field in model_type._meta.get_fields():
+        if field.is_relation and field.many_to_many:
+            related_name = field.name
+
+            if field.auto_created:
+                related_name = field.related_name or f"{field.name}_set"
+
+            # The first matching field wins
+            relation_fields.setdefault(related_name, RelationField(field, is_many_to_many=True))
+        elif field.is_relation:
+            relation_fields.setdefault(field.name, RelationField(field, is_many_to_many=False))
+
+    return relation_fields
+
+
+class ManyToManySets:
+    """
+    Many-to-many `set()` calls that get deferred and applied together, so that a relation that gets set multiple
+    times (e.g. by multiple `syncInput` actions in one message) only gets saved once with the last value.
+    """
+
+    def __init__(self):
+        self._sets: dict[tuple[int, str], tuple[Any, str, Any]] = {}
+
+    def __len__(self):
+        return len(self._sets)
+
+    def add(self, model: Any, related_name: str, value: Any) -> None:
+        self._sets[(id(model), related_name)] = (model, related_name, value)
+
+    def apply(self) -> None:
+        """
+        Calls `set()` for every deferred many-to-many relation.
+        """
+
+        sets = list(self._sets.values())
+        self._sets.clear()
+
+        for model, related_name, value in sets:
+            getattr(model, related_name).set(value)
+
+    def apply_one(self, model: Any, related_name: str) -> None:
+        """
+        Calls `set()` for the deferred many-to-many relation of the model, if there is one.
+        """
+
+        deferred_set = self._sets.pop((id(model), related_name), None)
+
+        if deferred_set is not None:
+            getattr(model, related_name).set(deferred_set[2])
+
+
+def _has_updated_hooks(component: UnicornView, property_name: str, *, call_resolved_method: bool) -> bool:
+    """
+    Whether any `updated`/`resolved` hook would get called after the property is set.
+    """
+
+    property_name_snake_case = property_name.replace(".", "_")
+    component_class = type(component)
+
+    if hasattr(component, f"updated_{property_name_snake_case}"):
+        return True
+
+    if component_class.updated is not UnicornView.updated:
+        return True
+
+    if call_resolved_method:
+        return hasattr(component, f"resolved_{property_name_snake_case}") or (
+            component_class.resolved is not UnicornView.resolved
+        )
+
+    return False
+
+
+@profiled
 def set_property_value(
     component: UnicornView,
     property_name: str | None,
     property_value: Any,
     data: dict | None = None,
     call_resolved_method=True,  # noqa: FBT002
+    *,
+    many_to_many_sets: ManyToManySets | None = None,
 ) -> None:
     """
     Sets properties on the component.
@@ -24,6 +120,8 @@ def set_property_value(
         param property_value: Value to set on the property.
         param data: Dictionary that gets sent back with the response. Defaults to {}.
         call_resolved_method: Whether or not to call the resolved method. Defaults to True.
+        many_to_many_sets: Defer setting many-to-many relations until `apply()` gets called on it. Defaults to
+            setting them immediately.
     """
 
     if property_name is None:
@@ -81,33 +179,32 @@ def set_property_value(
                     is_relation_field = False
 
                     # Set the id property for ForeignKeys
-                    # TODO: Move some of this to utility function
                     if hasattr(component_or_field, "_meta"):
-                        for field in component_or_field._meta.get_fields():
-                            if field.is_relation and field.many_to_many:
-                                related_name = field.name
-
-                                if field.auto_created:
-                                    related_name = field.related_name or f"{field.name}_set"
-
-                                if related_name == property_name_part:
-                                    related_descriptor = getattr(component_or_field, related_name)
-                                    related_descriptor.set(property_value)
-                                    is_relation_field = True
-                                    break
-                            elif field.name == property_name_part:
-                                if field.is_relation:
-                                    setattr(
-                                        component_or_field,
-                                        field.attname,
-                                        property_value,
-                                    )
-                                    is_relation_field = True
-                                    break
+                        relation_field = get_relation_fields(type(component_or_field)).get(property_name_part)
+
+                        if relation_field and relation_field.is_many_to_many:
+                            if many_to_many_sets is None:
+                                getattr(component_or_field, property_name_part).set(property_value)
+                            else:
+                                many_to_many_sets.add(component_or_field, property_name_part, property_value)
+
+                                # Hooks expect to see the new relation, so it can only be deferred without them
+                                if _has_updated_hooks(
+                                    component, property_name, call_resolved_method=call_resolved_method
+                                ):
+                                    many_to_many_sets.apply_one(component_or_field, property_name_part)
+
+                            is_relation_field = True
+                        elif relation_field:
+                            setattr(component_or_field, relation_field.field.attname, property_value)
+                            is_relation_field = True
 
                     if not is_relation_field:
                         setattr(component_or_field, property_name_part, property_value)
 
+                    # Nested properties are not set with `_set_property`, so invalidate based on the top-level name
+                    component._invalidate_computed_cache(property_name_parts[0])
+
                     if hasattr(component, updated_function_name):
                         getattr(component, updated_function_name)(property_value)
 
@@ -6,13 +6,16 @@ from django.core.cache import caches
 from django.forms import ValidationError
 from django.http import HttpRequest
 
+from django_unicorn import metrics
 from django_unicorn.components import UnicornView
 from django_unicorn.components.unicorn_template_response import get_root_element
 from django_unicorn.errors import RenderNotModifiedError, UnicornViewError
+from django_unicorn.profiling import profile
 from django_unicorn.settings import get_cache_alias, get_serial_enabled, get_serial_timeout
-from django_unicorn.utils import html_element_to_string
+from django_unicorn.utils import FieldChecksums, html_element_to_string
 from django_unicorn.views.action import Action, CallMethod, Refresh, Reset, SyncInput, Toggle
 from django_unicorn.views.action_parsers import call_method, sync_input
+from django_unicorn.views.action_parsers.utils import ManyToManySets
 from django_unicorn.views.request import ComponentRequest
 from django_unicorn.views.response import ComponentResponse
 from django_unicorn.views.utils import set_property_from_data
@@ -51,6 +54,9 @@ class UnicornMessageHandler:
         )
 
         if len(component_requests) > 1:
+            metrics.serial_queued.inc()
+            metrics.serial_queue_depth.observe(len(component_requests))
+
             original_epoch = component_requests[0].epoch
             return {
                 "queued": True,
@@ -97,6 +103,9 @@ class UnicornMessageHandler:
                     for key, val in first_json_result.get("data", {}).items():
                         merged_component_request.data[key] = val
 
+                        # The merged value was not hashed when the request was validated
+                        merged_component_request.field_hashes.pop(key, None)
+
                 component_requests.pop(0)
                 cache.set(
                     queue_cache_key,
@@ -110,6 +119,7 @@ class UnicornMessageHandler:
 
         return first_json_result
 
+    @metrics.observe_message
     def _process_request(self, component_request: ComponentRequest) -> dict:
         component = UnicornView.create(
             component_id=component_request.id,
@@ -128,6 +138,9 @@ class UnicornMessageHandler:
             raise AssertionError("Component request data is required")
         original_data = copy.deepcopy(component_request.data)
 
+        # The fields of the request data were hashed when the checksum got validated
+        component._field_checksums = FieldChecksums(original_data, component_request.field_hashes)
+
         component.pre_parse()
 
         for property_name, property_value in component_request.data.items():
@@ -143,48 +156,60 @@ class UnicornMessageHandler:
         return_data = None
         partials = []
 
-        for action in component_request.action_queue:
-            if action.partials:
-                partials.extend(action.partials)
-
-            # TODO: Refactor this to use polymorphism on Action classes if possible
-            # For now, map back to existing handlers logic
-
-            if isinstance(action, SyncInput):
-                # Reconstruct payload for existing handler
-                # existing handler expects {"name": ..., "value": ...}
-                sync_input.handle(component_request, component, action.payload)
-            elif isinstance(action, CallMethod | Refresh | Reset | Toggle):
-                # Refresh and Reset are handled inside call_method.handle currently via special methods
-                # or we might need to handle them explicitly if we changed something.
-                # Since I'm using the existing call_method.handle, and it parses "name",
-                # I should pass the payload which contains the "name" (e.g. "$refresh" or "method()").
-                # My `views/request.py` parses these into classes but action.payload is still the original dict.
-
-                try:
-                    (
-                        component,
-                        _is_refresh_called,
-                        _is_reset_called,
-                        _validate_all_fields,
-                        return_data,
-                    ) = call_method.handle(component_request, component, action.payload)
-
-                    is_refresh_called = is_refresh_called | _is_refresh_called
-                    is_reset_called = is_reset_called | _is_reset_called
-                    validate_all_fields = validate_all_fields | _validate_all_fields
-                except ValidationError as e:
-                    component._handle_validation_error(e)
-            elif isinstance(action, Action):
-                # Fallback/Generic?
-                if action.action_type == "syncInput":
-                    sync_input.handle(component_request, component, action.payload)
-                elif action.action_type == "callMethod":
-                    # ...
-                    pass
-                else:
-                    logger.warning(f"Unknown action_type '{action.action_type}'")
-
+        # Many-to-many relations set by `syncInput` actions only get saved once per relation; they are applied
+        # before any other action so that methods always see the updated relations
+        many_to_many_sets = ManyToManySets()
+
+        with profile("actions"):
+            for action in component_request.action_queue:
+                if action.partials:
+                    partials.extend(action.partials)
+
+                if not isinstance(action, SyncInput):
+                    many_to_many_sets.apply()
+
+                # TODO: Refactor this to use polymorphism on Action classes if possible
+                # For now, map back to existing handlers logic
+
+                if isinstance(action, SyncInput):
+                    # Reconstruct payload for existing handler
+                    # existing handler expects {"name": ..., "value": ...}
+                    sync_input.handle(component_request, component, action.payload, many_to_many_sets=many_to_many_sets)
+                elif isinstance(action, CallMethod | Refresh | Reset | Toggle):
+                    # Refresh and Reset are handled inside call_method.handle currently via special methods
+                    # or we might need to handle them explicitly if we changed something.
+                    # Since I'm using the existing call_method.handle, and it parses "name",
+                    # I should pass the payload which contains the "name" (e.g. "$refresh" or "method()").
+                    # My `views/request.py` parses these into classes but action.payload is still the original dict.
+
+                    try:
+                        (
+                            component,
+                            _is_refresh_called,
+                            _is_reset_called,
+                            _validate_all_fields,
+                            return_data,
+                        ) = call_method.handle(component_request, component, action.payload)
+
+                        is_refresh_called = is_refresh_called | _is_refresh_called
+                        is_reset_called = is_reset_called | _is_reset_called
+                        validate_all_fields = validate_all_fields | _validate_all_fields
+                    except ValidationError as e:
+                        component._handle_validation_error(e)
+                elif isinstance(action, Action):
+                    # Fallback/Generic?
+                    if action.action_type == "syncInput":
+                        sync_input.handle(component_request, component, action.payload)
+                    elif action.action_type == "callMethod":
+                        # ...
+                        pass
+                    else:
+                        logger.warning(f"Unknown action_type '{action.action_type}'")
+
+            many_to_many_sets.apply()
+
+        # Actions can set attributes directly, so make sure `complete` and `render` get fresh computed values
+        component._computed_cache = {}
         component.complete()
 
         # Re-load frontend context variables
@@ -5,7 +5,7 @@ from django.http.response import HttpResponseRedirect
 from django_unicorn.components import HashUpdate, LocationUpdate, PollUpdate
 from django_unicorn.errors import UnicornViewError
 from django_unicorn.serializer import JSONDecodeError, dumps, loads
-from django_unicorn.utils import generate_checksum, is_int
+from django_unicorn.utils import is_int, is_valid_checksum
 
 logger = logging.getLogger(__name__)
 
@@ -97,9 +97,7 @@ class ComponentRequest:
             # TODO: Raise specific exception
             raise AssertionError("Missing checksum")
 
-        generated_checksum = generate_checksum(self.data)
-
-        if checksum != generated_checksum:
+        if not is_valid_checksum(checksum, self.data):
             # TODO: Raise specific exception
             raise AssertionError("Checksum does not match")
 
@@ -1,9 +1,9 @@
 import logging
 
-from django_unicorn.call_method_parser import parse_call_method_name
+from django_unicorn.call_method_parser import parse_call_method_name, parse_call_method_payload
 from django_unicorn.errors import UnicornViewError
 from django_unicorn.serializer import JSONDecodeError, loads
-from django_unicorn.utils import generate_checksum
+from django_unicorn.utils import FieldChecksums, is_valid_checksum
 from django_unicorn.views.action import Action, CallMethod, Refresh, Reset, SyncInput, Toggle
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,7 @@ class ComponentRequest:
         "body",
         "data",
         "epoch",
+        "field_hashes",
         "hash",
         "id",
         "key",
@@ -69,7 +70,7 @@ class ComponentRequest:
                 self.action_queue.append(SyncInput(action_data))
             elif action_type == "callMethod":
                 name = payload.get("name", "")
-                method_name, _, _ = parse_call_method_name(name)
+                method_name, _, _ = parse_call_method_payload(payload) or parse_call_method_name(name)
 
                 if method_name == "$refresh":
                     self.action_queue.append(Refresh(action_data))
@@ -100,7 +101,10 @@ class ComponentRequest:
         if not checksum:
             raise AssertionError("Missing checksum")
 
-        generated_checksum = generate_checksum(self.data)
+        field_checksums = FieldChecksums(self.data)
 
-        if checksum != generated_checksum:
+        if not is_valid_checksum(checksum, self.data, field_checksums=field_checksums):
             raise AssertionError("Checksum does not match")
+
+        # Keep the field hashes so the checksum of the response only needs to hash the fields that changed
+        self.field_hashes = field_checksums.field_hashes
@@ -3,8 +3,9 @@ from typing import Any
 from django_unicorn.components import UnicornView
 from django_unicorn.components.unicorn_template_response import get_root_element
 from django_unicorn.errors import RenderNotModifiedError
+from django_unicorn.profiling import profile
 from django_unicorn.serializer import loads
-from django_unicorn.utils import generate_checksum, html_element_to_string
+from django_unicorn.utils import generate_content_hash, html_element_to_string
 from django_unicorn.views.request import ComponentRequest
 
 
@@ -55,6 +56,7 @@ class ComponentResponse:
             calls.extend(self._collect_calls_from_component(child))
         return calls
 
+    @profile("respond")
     def get_data(self) -> dict[str, Any]:
         # Sort data so it's stable
         if self.component_request.data:
@@ -67,7 +69,7 @@ class ComponentResponse:
             "data": self.component_request.data,
             "errors": self.component.errors,
             "calls": self._collect_all_calls(),
-            "checksum": generate_checksum(self.component_request.data),
+            "checksum": self.component._get_checksum(self.component_request.data),
         }
 
         render_not_modified = False
@@ -77,7 +79,7 @@ class ComponentResponse:
         if self.partials:
             result.update({"partials": self.partials})
         else:
-            rendered_component_hash = generate_checksum(rendered_component)
+            rendered_component_hash = generate_content_hash(rendered_component)
 
             if (
                 self.component_request.hash == rendered_component_hash
@@ -127,7 +129,7 @@ class ComponentResponse:
             if parent_component.force_render is True:
                 # TODO: Should parent_component.hydrate() be called?
                 parent_frontend_context_variables = loads(parent_component.get_frontend_context_variables())
-                parent_checksum = generate_checksum(str(parent_frontend_context_variables))
+                parent_checksum = parent_component._get_checksum(parent_frontend_context_variables)
 
                 parent = {
                     "id": parent_component.component_id,
@@ -168,7 +170,7 @@ class ComponentResponse:
                             "dom": parent_dom,
                             "data": parent_frontend_context_variables,
                             "errors": parent_component.errors,
-                            "hash": generate_checksum(parent_dom),
+                            "hash": generate_content_hash(parent_dom),
                         }
                     )
 
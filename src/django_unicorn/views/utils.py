@@ -5,7 +5,8 @@ from typing import Any, Union, cast, get_args, get_origin
 from django.db.models import Model
 
 from django_unicorn.components import UnicornField, UnicornView
-from django_unicorn.decorators import timed
+from django_unicorn.components.computed import get_computed_properties
+from django_unicorn.profiling import profiled
 from django_unicorn.typer import (
     cast_value,
     create_queryset,
@@ -22,7 +23,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-@timed
+@profiled
 def set_property_from_data(
     component_or_field: UnicornView | UnicornField | Model,
     name: str,
@@ -34,6 +35,10 @@ def set_property_from_data(
     Sets properties on the component based on passed-in data.
     """
 
+    if isinstance(component_or_field, UnicornView) and name in get_computed_properties(component_or_field.__class__):
+        # Computed properties get re-calculated from the rest of the data instead of being set
+        return
+
     try:
         if not hasattr(component_or_field, name):
             return
@@ -100,7 +105,7 @@ def set_property_from_data(
             setattr(component_or_field, name, value)
 
 
-@timed
+@profiled
 def _is_component_field_model_or_unicorn_field(
     component_or_field: UnicornView | UnicornField | Model,
     name: str,
@@ -0,0 +1,23 @@
+import pytest
+
+from django_unicorn.call_method_parser import _parse_call_method_name_ast, parse_call_method_name
+
+CALL_METHOD_NAMES = [
+    "increment",
+    "$refresh",
+    "select(1234)",
+    "set_name('Bob')",
+    'update(4, flag=True, label="It\'s done")',
+    "filter({'name': 'unicorn', 'tags': ['a', 'b']}, page=2)",
+]
+
+
+@pytest.mark.parametrize("call_method_name", CALL_METHOD_NAMES)
+def test_parse_call_method_name(benchmark, call_method_name):
+    # Call the uncached function so that every call gets parsed
+    benchmark(parse_call_method_name.__wrapped__, call_method_name)
+
+
+@pytest.mark.parametrize("call_method_name", CALL_METHOD_NAMES)
+def test_parse_call_method_name_ast(benchmark, call_method_name):
+    benchmark(_parse_call_method_name_ast, call_method_name)
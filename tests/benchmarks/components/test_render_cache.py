@@ -0,0 +1,33 @@
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.components.render_cache import render_component
+
+
+class RowComponent(UnicornView):
+    template_html = """<div>
+  <span>{{ name }}</span>
+  {% for tag in tags %}<b>{{ tag }}</b>{% endfor %}
+</div>"""
+
+    name = "row"
+    tags = tuple(f"tag {i}" for i in range(20))
+
+
+class CachedRowComponent(RowComponent):
+    class Meta:
+        render_cache = True
+
+
+class TableComponent(UnicornView):
+    template_html = "<div></div>"
+
+
+@pytest.mark.parametrize("component_class", [RowComponent, CachedRowComponent])
+def test_render_child_component(benchmark, component_class):
+    parent = TableComponent(component_id="benchmark", component_name="table")
+    component = component_class(component_id="benchmark:row", component_name="row", parent=parent)
+
+    rendered = benchmark(render_component, component, init_js=True)
+
+    assert "<b>tag 19</b>" in rendered
@@ -0,0 +1,34 @@
+from django_unicorn.components import UnicornField, UnicornView
+
+
+class Field(UnicornField):
+    def __init__(self):
+        self.name = "abc"
+        self.count = 1
+        self.items = [1, 2, 3]
+
+
+ManyFieldsComponent = type(
+    "ManyFieldsComponent",
+    (UnicornView,),
+    {f"field_{i}": Field() for i in range(50)},
+)
+
+
+def _construct():
+    return ManyFieldsComponent(component_id="benchmark", component_name="many-fields")
+
+
+def test_construct_component_with_many_unicorn_fields(benchmark):
+    component = benchmark(_construct)
+
+    assert len(component._attribute_names_cache) == 50
+
+
+def test_reset_component_with_many_unicorn_fields(benchmark):
+    component = _construct()
+    component.field_0.name = "def"
+
+    benchmark(component.reset)
+
+    assert component.field_0.name == "abc"
@@ -1,4 +1,6 @@
 import uuid
+from dataclasses import dataclass
+from decimal import Decimal
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -6,7 +8,28 @@ from django.utils.dateparse import parse_duration
 from django.utils.timezone import now
 
 from django_unicorn import serializer
+from django_unicorn.components import UnicornField
 from django_unicorn.utils import dicts_equal
+from example.coffee.models import Flavor
+
+
+def _get_nested_payload(row_count: int) -> dict:
+    return {
+        "rows": [
+            {
+                "id": i,
+                "name": f"row {i}",
+                "price": Decimal("1.99"),
+                "ratio": i / 3,
+                "tags": ["a", "b", "c"],
+                "uuid": uuid.UUID(int=i),
+                "meta": {str(j): {"value": j * 1.5, "enabled": j % 2 == 0} for j in range(10)},
+            }
+            for i in range(row_count)
+        ],
+        "totals": {str(i): i * 0.5 for i in range(100)},
+        "name": "payload",
+    }
 
 
 class SimpleTestModel(models.Model):
@@ -69,8 +92,8 @@ def test_get_model_dict_complicated_model(benchmark):
         "date": str(now_datetime.date()),
         "time": str(now_datetime.time())[:-3],
         "uuid": str(model.uuid),
-        "float_value": 0.583,  # will be converted from float to string by _fix_floats
-        "decimal_value": 0.984,  # will be converted from float to string by _fix_floats
+        "float_value": 0.583,  # will be converted from float to string by dumps
+        "decimal_value": 0.984,  # will be converted from float to string by dumps
         "duration": "-1 19:00:00",
     }
 
@@ -116,3 +139,77 @@ def test_get_model_dict_subclass_complicated_model(benchmark):
     actual = benchmark(serializer._get_model_dict, model)
 
     assert dicts_equal(expected, actual)
+
+
+def test_dumps_large_nested_payload(benchmark):
+    data = _get_nested_payload(1_000)
+
+    actual = benchmark(serializer.dumps, data)
+
+    assert actual.startswith('{"name":"payload","rows":[{"id":0,')
+
+
+def test_dumps_large_nested_payload_no_fix_floats_no_sort_dict(benchmark):
+    data = _get_nested_payload(1_000)
+
+    actual = benchmark(serializer.dumps, data, fix_floats=False, sort_dict=False)
+
+    assert actual.startswith('{"rows":[{"id":0,')
+
+
+def test_dumps_large_nested_payload_exclude_field_attributes(benchmark):
+    data = {"payload": _get_nested_payload(1_000)}
+
+    actual = benchmark(serializer.dumps, data, exclude_field_attributes=("payload.totals",))
+
+    assert '"totals"' not in actual
+
+
+def test_dumps_queryset(benchmark, db):  # noqa: ARG001
+    Flavor.objects.bulk_create(
+        [
+            Flavor(
+                name=f"flavor {i}",
+                label=f"label {i}",
+                float_value=i / 3,
+                decimal_value=Decimal("1.99"),
+                datetime=now(),
+                date=now().date(),
+                time=now().time(),
+            )
+            for i in range(1_000)
+        ]
+    )
+    flavors = Flavor.objects.all()
+    len(flavors)  # evaluate the queryset before benchmarking
+
+    actual = benchmark(serializer.dumps, {"flavors": flavors})
+
+    assert actual.count('"pk":') == 1_000
+
+
+def test_dumps_component_payload(benchmark):
+    data = {f"attribute_{i}": i / 3 if i % 2 else f"value {i}" for i in range(50)}
+
+    actual = benchmark(serializer.dumps, data)
+
+    assert actual.startswith('{"attribute_0":"value 0","attribute_1":"0.3333333333333333",')
+
+
+def test_dumps_custom_objects(benchmark):
+    class Author(UnicornField):
+        def __init__(self, i):
+            self.name = f"author {i}"
+            self.rating = i / 3
+
+    @dataclass
+    class Book:
+        title: str
+        price: Decimal
+        author: Author
+
+    data = {"books": [Book(title=f"book {i}", price=Decimal("9.99"), author=Author(i)) for i in range(1_000)]}
+
+    actual = benchmark(serializer.dumps, data)
+
+    assert actual.startswith('{"books":[{"title":"book 0","price":"9.99","author":{"name":"author 0","rating":"0.0"}}')
@@ -0,0 +1,25 @@
+from django.template import Context, Template
+
+from django_unicorn.components import UnicornView
+
+
+class RowComponent(UnicornView):
+    template_html = "<div>{{ row }} {{ title }}</div>"
+
+    row = 0
+
+
+def test_render_child_tags_in_large_context(benchmark):
+    template = Template(
+        "{% load unicorn %}"
+        "{% for row in rows %}"
+        "{% unicorn 'tests.benchmarks.templatetags.test_unicorn.RowComponent' row=row %}"
+        "{% endfor %}"
+    )
+    context = {f"variable_{i}": i for i in range(200)}
+    context.update({"rows": range(500), "title": "Rows"})
+
+    rendered = benchmark.pedantic(template.render, args=(Context(context),), rounds=5)
+
+    assert rendered.count("<div unicorn:id=") == 500
+    assert "499 Rows" in rendered
@@ -0,0 +1,45 @@
+from datetime import date
+
+import pytest
+
+from django_unicorn.components import UnicornView
+from django_unicorn.typer import cast_attribute_value, create_queryset
+from example.coffee.models import Flavor
+
+
+@pytest.mark.parametrize("row_count", [10, 100, 1_000])
+def test_create_queryset(benchmark, row_count):
+    value = [{"pk": i, "name": f"flavor {i}", "label": f"label {i}", "parent": None} for i in range(row_count)]
+
+    def setup():
+        queryset = Flavor.objects.none()
+        queryset._result_cache = [Flavor(pk=i, name=f"original {i}") for i in range(row_count)]
+
+        return (queryset, None, value), {}
+
+    queryset = benchmark.pedantic(create_queryset, setup=setup, rounds=20)
+
+    assert len(queryset._result_cache) == row_count
+    assert queryset._result_cache[-1].name == f"flavor {row_count - 1}"
+
+
+class CastComponent(UnicornView):
+    count: int = 0
+    price: float | None = None
+    publish_date: date | None = None
+    tags: list[str] = None
+
+
+def test_cast_attribute_value(benchmark):
+    components = [
+        CastComponent(component_id=f"test_cast_attribute_value_{i}", component_name="cast") for i in range(10)
+    ]
+
+    def cast_attribute_values():
+        for component in components:
+            cast_attribute_value(component, "count", "1")
+            cast_attribute_value(component, "price", "1.5")
+            cast_attribute_value(component, "publish_date", "2020-01-01")
+            cast_attribute_value(component, "tags", ["a", "b"])
+
+    benchmark(cast_attribute_values)
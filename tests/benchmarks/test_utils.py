@@ -0,0 +1,56 @@
+import copy
+
+import pytest
+
+from django_unicorn.utils import FieldChecksums, generate_checksum, generate_content_hash, generate_legacy_checksum
+
+
+def _get_data(row_count):
+    return {
+        "name": "World",
+        "count": row_count,
+        "rows": [{"pk": i, "name": f"flavor {i}", "label": f"label {i}", "price": i * 1.5} for i in range(row_count)],
+    }
+
+
+@pytest.mark.parametrize("row_count", [10, 1_000])
+def test_generate_checksum(benchmark, row_count):
+    data = _get_data(row_count)
+
+    checksum = benchmark(generate_checksum, data)
+
+    assert checksum.startswith("2:")
+
+
+@pytest.mark.parametrize("row_count", [10, 1_000])
+def test_generate_legacy_checksum(benchmark, row_count):
+    data = _get_data(row_count)
+
+    checksum = benchmark(generate_legacy_checksum, data)
+
+    assert len(checksum) == 8
+
+
+def test_generate_content_hash(benchmark):
+    rendered = "".join(f"<div>flavor {i}</div>" for i in range(1_000))
+
+    benchmark(generate_content_hash, rendered)
+
+
+def test_generate_legacy_content_hash(benchmark):
+    rendered = "".join(f"<div>flavor {i}</div>" for i in range(1_000))
+
+    benchmark(generate_legacy_checksum, rendered)
+
+
+@pytest.mark.parametrize("row_count", [10, 1_000])
+def test_field_checksums_update(benchmark, row_count):
+    data = _get_data(row_count)
+    field_checksums = FieldChecksums(data)
+
+    # Only one field changed, e.g. after a `syncInput` action; the data gets re-loaded for every request
+    updated_data = copy.deepcopy({**data, "name": "Universe"})
+
+    updated_field_checksums = benchmark(field_checksums.update, updated_data)
+
+    assert updated_field_checksums.checksum == generate_checksum(updated_data)
@@ -1,4 +1,6 @@
-from django_unicorn.call_method_parser import parse_call_method_name
+import pytest
+
+from django_unicorn.call_method_parser import _parse_call_method_name_ast, parse_call_method_name
 
 
 def setup_function():
@@ -122,3 +124,43 @@ def test_string_with_mixed_quotes_and_parentheses():
     actual = parse_call_method_name("set_name('test(with \\'quotes\\' and \"double\")')")
 
     assert actual == expected
+
+
+def test_trailing_comma():
+    expected = ("set_name", (1, (2,)), {"kwarg1": [3]})
+    actual = parse_call_method_name("set_name(1, (2,), kwarg1=[3,],)")
+
+    assert actual == expected
+
+
+def test_set_and_nested_tuple_args():
+    expected = ("set_name", ({1, (2, 3)}, -1.5e2), {})
+    actual = parse_call_method_name("set_name({1, (2, 3)}, -1.5e2)")
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "call_method_name",
+    [
+        "set_name(1, b'x')",
+        "set_name(0x10, 1_000, 1j)",
+        "set_name(a=1, a=2)",
+        "set_name(a=1, 2)",
+        "set_name(not_a_literal)",
+        "$parent.set_name(1)",
+        "set_name('a' 'b')",
+        "set_name(-(1))",
+        "set_name(01)",
+    ],
+)
+def test_same_as_ast(call_method_name):
+    try:
+        expected = _parse_call_method_name_ast(call_method_name)
+    except Exception as e:
+        with pytest.raises(type(e)):
+            parse_call_method_name(call_method_name)
+    else:
+        (method_name, args, kwargs) = parse_call_method_name(call_method_name)
+
+        assert (method_name, list(args), dict(kwargs)) == expected
@@ -0,0 +1,35 @@
+from django_unicorn.call_method_parser import parse_call_method_payload
+
+
+def test_parsed_args_and_kwargs():
+    expected = ("set_name", (1, [2]), {"kwarg1": "wow"})
+    actual = parse_call_method_payload(
+        {"name": "set_name(1, [2], kwarg1='wow')", "method": "set_name", "args": [1, [2]], "kwargs": {"kwarg1": "wow"}}
+    )
+
+    assert actual == expected
+
+
+def test_special_method():
+    expected = ("$reset", (), {})
+    actual = parse_call_method_payload({"name": "$reset", "method": "$reset"})
+
+    assert actual == expected
+
+
+def test_name_only():
+    assert parse_call_method_payload({"name": "set_name(1)"}) is None
+
+
+def test_invalid_method_name():
+    assert parse_call_method_payload({"name": "$parent.set_name(1)", "method": "$parent.set_name", "args": [1]}) is None
+    assert parse_call_method_payload({"name": "if(1)", "method": "if", "args": [1]}) is None
+
+
+def test_invalid_args():
+    assert parse_call_method_payload({"name": "set_name(1)", "method": "set_name", "args": "1"}) is None
+
+
+def test_invalid_kwargs():
+    assert parse_call_method_payload({"name": "set_name(1)", "method": "set_name", "kwargs": [1]}) is None
+    assert parse_call_method_payload({"name": "set_name(True=1)", "method": "set_name", "kwargs": {"True": 1}}) is None
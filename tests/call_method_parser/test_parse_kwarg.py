@@ -70,3 +70,24 @@ def test_kwargs_raise_unparseable_value():
         parse_kwarg("test=some_context_variable", raise_if_unparseable=True)
 
     assert e.type is ValueError
+
+
+def test_kwargs_dotted_key():
+    expected = {"book.title": "Unicorn"}
+    actual = parse_kwarg("book.title = 'Unicorn'")
+
+    assert actual == expected
+
+
+def test_kwargs_tuple():
+    expected = {"test": (1, "2")}
+    actual = parse_kwarg("test=1, '2'")
+
+    assert actual == expected
+
+
+def test_kwargs_invalid_method_call():
+    with pytest.raises(InvalidKwargError) as e:
+        parse_kwarg("set_name(test=1)")
+
+    assert e.type == InvalidKwargError
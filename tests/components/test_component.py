@@ -1,3 +1,4 @@
+import threading
 import types
 
 import orjson
@@ -7,7 +8,8 @@ from tests.views.fake_components import (
     FakeValidationComponent,
 )
 
-from django_unicorn.components import UnicornView
+from django_unicorn.components import UnicornField, UnicornView
+from django_unicorn.components.unicorn_view import get_resettable_class_attributes, meta_excludes_cache
 from django_unicorn.serializer import InvalidFieldNameError
 
 
@@ -92,6 +94,24 @@ def test_get_frontend_context_variables_javascript_exclude(component):
     assert "name" not in frontend_context_variables_dict
 
 
+def test_get_frontend_context_variables_data_size_warning(component, settings, caplog):
+    settings.UNICORN = {**settings.UNICORN, "SERIALIZER": {"DATA_SIZE_WARNING": 10}}
+    component.name = "A longer name"
+
+    component.get_frontend_context_variables()
+
+    assert "The data for 'example' is 24 characters" in caplog.text
+
+
+def test_get_frontend_context_variables_data_size_warning_disabled(component, settings, caplog):
+    settings.UNICORN = {**settings.UNICORN, "SERIALIZER": {"DATA_SIZE_WARNING": None}}
+    component.name = "A longer name"
+
+    component.get_frontend_context_variables()
+
+    assert "The data for" not in caplog.text
+
+
 def test_get_frontend_context_variables_javascript_exclude_invalid_field(component):
     class Meta:
         javascript_exclude = ("blob",)
@@ -319,3 +339,96 @@ def test_get_frontend_context_variables_authentication_form(component):
     )
 
     component.get_frontend_context_variables()
+
+
+class Author(UnicornField):
+    def __init__(self, name="Neil"):
+        self.name = name
+
+
+def test_reset_unicorn_field():
+    class TestComponent(UnicornView):
+        author = Author()
+
+    component = TestComponent(component_id="test_reset_unicorn_field", component_name="hello-world")
+    component.author = Author(name="Terry")
+
+    component.reset()
+
+    assert component.author.name == "Neil"
+
+
+def test_reset_unicorn_field_from_kwargs():
+    class TestComponent(UnicornView):
+        author = Author()
+
+    component = TestComponent(
+        component_id="test_reset_unicorn_field_from_kwargs", component_name="hello-world", author=Author(name="Terry")
+    )
+    component.author.name = "Douglas"
+
+    component.reset()
+
+    assert component.author.name == "Terry"
+
+
+def test_reset_unicorn_field_overridden_with_none():
+    class TestComponent(UnicornView):
+        author = Author()
+
+    component = TestComponent(
+        component_id="test_reset_unicorn_field_overridden_with_none", component_name="hello-world", author=None
+    )
+
+    component.reset()
+
+    assert component.author is None
+
+
+class LockedAuthor(UnicornField):
+    def __init__(self):
+        self.lock = threading.Lock()
+
+
+@pytest.mark.parametrize("from_kwargs", [False, True])
+def test_resettable_attribute_that_cannot_be_pickled(caplog, from_kwargs):
+    class TestComponent(UnicornView):
+        author = LockedAuthor() if not from_kwargs else None
+
+    kwargs = {"author": LockedAuthor()} if from_kwargs else {}
+    component = TestComponent(
+        component_id="test_resettable_attribute_that_cannot_be_pickled", component_name="hello-world", **kwargs
+    )
+
+    assert "author" not in component._resettable_attributes_cache
+    assert "author" not in get_resettable_class_attributes(TestComponent)
+    assert "Caching 'author' failed because it could not be pickled." in caplog.text
+
+
+def test_resettable_class_attributes_are_shared():
+    class TestComponent(UnicornView):
+        author = Author()
+
+    component = TestComponent(component_id="test_resettable_class_attributes_are_shared", component_name="hello-world")
+    component_two = TestComponent(
+        component_id="test_resettable_class_attributes_are_shared_2", component_name="hello-world"
+    )
+
+    assert component._resettable_attributes_cache == {}
+    assert component_two._resettable_attributes_cache == {}
+    assert "author" in get_resettable_class_attributes(TestComponent)
+
+
+def test_meta_exclude_is_compiled_once():
+    class TestComponent(UnicornView):
+        name = "World"
+        age = 1
+
+        class Meta:
+            exclude = ("name",)
+
+    component = TestComponent(component_id="test_meta_exclude_is_compiled_once", component_name="hello-world")
+
+    assert meta_excludes_cache[TestComponent.Meta] == frozenset(("name",))
+    assert component._is_public("name") is False
+    assert component._is_public("age") is True
@@ -0,0 +1,146 @@
+import orjson
+import pytest
+from tests.views.message.utils import post_and_get_response
+
+from django_unicorn.cacher import CacheableComponent
+from django_unicorn.components import UnicornView, computed
+
+
+class ComputedComponent(UnicornView):
+    template_html = "<div>{{ greeting }} {{ greeting }} {{ total }}</div>"
+
+    name = "World"
+    count = 1
+    greeting_call_count = 0
+    total_call_count = 0
+
+    @computed(depends_on=("name",))
+    def greeting(self):
+        self.greeting_call_count += 1
+        return f"Hello {self.name}"
+
+    @computed(javascript_exclude=True)
+    def total(self):
+        self.total_call_count += 1
+        return self.count * 10
+
+    def increment(self):
+        self.count += 1
+
+
+@pytest.fixture()
+def component():
+    return ComputedComponent(component_id="test_computed", component_name="computed")
+
+
+def test_computed_is_memoized(component):
+    assert component.greeting == "Hello World"
+    assert component.greeting == "Hello World"
+    assert component.greeting_call_count == 1
+
+
+class MountComputedComponent(UnicornView):
+    template_html = "<div>{{ title }}</div>"
+
+    @computed
+    def title(self):
+        # `name` only gets set in `mount`
+        return self.name.title()
+
+    def mount(self):
+        self.name = "world"
+
+
+def test_computed_is_not_evaluated_before_mount():
+    component = MountComputedComponent(component_id="test_computed_mount", component_name="computed")
+
+    assert component._computed_cache == {}
+    assert "title" in component._attribute_names_cache
+
+    component.mount()
+
+    assert component.title == "World"
+
+
+def test_computed_is_not_evaluated_on_construction(component):
+    assert component.greeting_call_count == 0
+    assert component.total_call_count == 0
+
+
+def test_computed_is_an_attribute(component):
+    assert "greeting" in component._attribute_names_cache
+    assert "greeting" not in component._methods()
+
+
+def test_computed_invalidated_by_dependency(component):
+    assert component.greeting == "Hello World"
+
+    component._set_property("name", "Universe")
+
+    assert component.greeting == "Hello Universe"
+
+
+def test_computed_not_invalidated_by_other_attribute(component):
+    component._computed_cache = {}
+    component.greeting_call_count = 0
+
+    assert component.greeting == "Hello World"
+
+    component._set_property("count", 2)
+
+    assert component.greeting == "Hello World"
+    assert component.greeting_call_count == 1
+
+
+def test_computed_without_dependencies_invalidated_by_any_attribute(component):
+    assert component.total == 10
+
+    component._set_property("count", 2)
+
+    assert component.total == 20
+
+
+def test_computed_cannot_be_set(component):
+    with pytest.raises(AttributeError):
+        component.greeting = "Hi"
+
+
+def test_computed_javascript_exclude(component):
+    component._computed_cache = {}
+    component.total_call_count = 0
+
+    frontend_context_variables = orjson.loads(component.get_frontend_context_variables())
+
+    assert frontend_context_variables["greeting"] == "Hello World"
+    assert "total" not in frontend_context_variables
+    assert component.total_call_count == 0
+
+
+def test_computed_cache_is_not_pickled(component):
+    assert component.greeting == "Hello World"
+
+    with CacheableComponent(component):
+        assert component._computed_cache == {}
+
+    assert "greeting" in component._computed_cache
+
+
+def test_computed_is_recalculated_after_method(client, settings):
+    settings.UNICORN = {**settings.UNICORN, "COMPONENTS": {"computed": ComputedComponent}}
+
+    response = post_and_get_response(
+        client,
+        url="/message/computed",
+        data={"name": "World", "count": 1, "greeting": "stale", "greeting_call_count": 0, "total_call_count": 0},
+        action_queue=[
+            {
+                "payload": {"name": "increment"},
+                "type": "callMethod",
+            }
+        ],
+    )
+
+    assert not response["errors"]
+    assert response["data"]["count"] == 2
+    assert response["data"]["greeting"] == "Hello World"
+    assert "Hello World Hello World 20" in response["dom"]
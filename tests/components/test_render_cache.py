@@ -0,0 +1,169 @@
+from importlib import import_module
+
+import pytest
+from django.core.cache import caches
+from django.template import Context
+from django.template.base import Parser, Token, TokenType
+
+from django_unicorn.components import UnicornView
+from django_unicorn.components.render_cache import (
+    get_render_cache_key,
+    get_render_cache_timeout,
+    render_cache_stats,
+    render_component,
+)
+from django_unicorn.templatetags.unicorn import unicorn
+
+RENDERS = []
+
+
+def _get_renders():
+    # Components are loaded by their dotted path, which might not be this module when run by `pytest`
+    return import_module("tests.components.test_render_cache").RENDERS
+
+
+class RenderCacheComponent(UnicornView):
+    template_html = "<div>{{ name }} {{ track_render }}</div>"
+
+    name = "World"
+
+    def track_render(self):
+        RENDERS.append(self.name)
+        return len(RENDERS)
+
+    class Meta:
+        render_cache = True
+
+
+class RenderCacheTimeoutComponent(UnicornView):
+    template_html = "<div>{{ name }}</div>"
+
+    class Meta:
+        render_cache = True
+        render_cache_timeout = 5
+
+
+class NoRenderCacheComponent(UnicornView):
+    template_html = "<div>{{ name }}</div>"
+
+
+class ParentComponent(UnicornView):
+    template_html = "<div></div>"
+
+
+@pytest.fixture(autouse=True)
+def clear_render_cache():
+    _get_renders().clear()
+    render_cache_stats.reset()
+    caches["default"].clear()
+
+    yield
+
+    render_cache_stats.reset()
+
+
+def _render_child(parent, name="World"):
+    token = Token(
+        TokenType.TEXT,
+        f"unicorn 'tests.components.test_render_cache.RenderCacheComponent' parent=view key='child' name='{name}'",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+
+    html = unicorn_node.render(Context({"view": parent}))
+
+    return unicorn_node.view, html
+
+
+def test_get_render_cache_timeout():
+    assert get_render_cache_timeout(RenderCacheComponent(component_id="test_timeout", component_name="cached")) == 60
+    assert get_render_cache_timeout(RenderCacheTimeoutComponent(component_id="test_timeout", component_name="t")) == 5
+    assert get_render_cache_timeout(NoRenderCacheComponent(component_id="test_timeout", component_name="none")) is None
+
+
+def test_get_render_cache_key_changes_with_state():
+    component = RenderCacheComponent(component_id="test_get_render_cache_key", component_name="cached")
+    render_cache_key = get_render_cache_key(component, init_js=True)
+
+    assert render_cache_key.startswith("unicorn:render:test_get_render_cache_key:")
+    assert render_cache_key == get_render_cache_key(component, init_js=True)
+    assert render_cache_key != get_render_cache_key(component, init_js=False)
+
+    component.name = "Universe"
+    assert render_cache_key != get_render_cache_key(component, init_js=True)
+
+
+def test_get_render_cache_key_with_calls_or_errors():
+    component = RenderCacheComponent(component_id="test_get_render_cache_key_calls", component_name="cached")
+
+    component.call("hello")
+    assert get_render_cache_key(component, init_js=True) is None
+
+    component.calls = []
+    component.errors = {"name": [{"code": "required", "message": "Required"}]}
+    assert get_render_cache_key(component, init_js=True) is None
+
+
+def test_render_component_hit(settings):
+    settings.DEBUG = True
+    parent = ParentComponent(component_id="test_render_component_hit", component_name="parent")
+
+    child, html = _render_child(parent)
+    assert "World 1" in html
+    assert render_cache_stats.as_dict()["misses"] == 1
+
+    init_script = child._init_script
+    del child._init_script
+
+    child, cached_html = _render_child(parent)
+
+    assert cached_html == html
+    assert _get_renders() == ["World"]
+    assert child._init_script == init_script
+    assert child._json_tag.get("id") == f"unicorn:data:{child.component_id}"
+    assert render_cache_stats.as_dict() == {
+        "hits": 1,
+        "misses": 1,
+        "components": {"tests.components.test_render_cache.RenderCacheComponent": {"hits": 1, "misses": 1}},
+    }
+
+
+def test_render_component_miss_after_state_change(settings):
+    settings.DEBUG = True
+    parent = ParentComponent(component_id="test_render_component_miss", component_name="parent")
+
+    _render_child(parent)
+    _, html = _render_child(parent, name="Universe")
+
+    assert "Universe 2" in html
+    assert _get_renders() == ["World", "Universe"]
+    assert render_cache_stats.as_dict()["misses"] == 2
+
+
+def test_render_component_without_render_cache():
+    component = NoRenderCacheComponent(component_id="test_render_component_without", component_name="none")
+
+    render_component(component)
+    render_component(component)
+
+    assert render_cache_stats.as_dict()["misses"] == 0
+
+
+def test_render_component_serializes_once(settings, monkeypatch):
+    settings.DEBUG = True
+    parent = ParentComponent(component_id="test_render_component_serializes_once", component_name="parent")
+
+    calls = []
+    component_class = import_module("tests.components.test_render_cache").RenderCacheComponent
+    get_frontend_context_variables = component_class.get_frontend_context_variables
+
+    def _get_frontend_context_variables(component):
+        calls.append(component.component_id)
+        return get_frontend_context_variables(component)
+
+    monkeypatch.setattr(component_class, "get_frontend_context_variables", _get_frontend_context_variables)
+
+    _, html = _render_child(parent)
+
+    assert "World 1" in html
+    assert render_cache_stats.as_dict()["misses"] == 1
+    assert len(calls) == 1
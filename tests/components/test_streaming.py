@@ -0,0 +1,115 @@
+import re
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import Context
+from django.template.base import Parser, Token, TokenType
+from django.test import RequestFactory
+
+from django_unicorn.components import UnicornView
+from django_unicorn.components.streaming import STREAM_CONTEXT_KEY, ComponentStream, render_stream
+from django_unicorn.templatetags.unicorn import unicorn
+
+
+class FakeComponentStreamed(UnicornView):
+    template_html = "<div>{{ name }}</div>"
+
+    name = "World"
+
+    def mount(self):
+        self.name = self.component_kwargs.get("name", self.name)
+
+
+class FakeComponentStreamedError(UnicornView):
+    template_html = "<div></div>"
+
+    def mount(self):
+        raise ValueError("Slow component failed")
+
+
+class FakeComponentStreamedParent(UnicornView):
+    template_html = """{% load unicorn %}
+<div>
+  {% unicorn 'tests.components.test_streaming.FakeComponentStreamed' stream=True %}
+</div>"""
+
+
+def _get_content(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def _render_tag(context, component_name="FakeComponentStreamed"):
+    token = Token(TokenType.TEXT, f"unicorn 'tests.components.test_streaming.{component_name}' stream=True")
+
+    return unicorn(Parser([]), token).render(context)
+
+
+def test_render_stream(settings):
+    settings.DEBUG = True
+    request = RequestFactory().get("/")
+
+    response = render_stream(request, "templates/test_stream_template.html", {"name": "Universe"})
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert response["Content-Type"] == "text/html; charset=utf-8"
+
+    (page, chunk) = _get_content(response).split("</main>")
+    component_id = re.search(r'unicorn:stream="(\w+)"', page).group(1)
+
+    assert 'unicorn:name="tests.components.test_streaming.FakeComponentStreamed"></div>' in page
+    assert chunk.strip().startswith(f'<template unicorn:stream:for="{component_id}"><div unicorn:id="{component_id}"')
+    assert "Universe</div></template>" in chunk
+    assert "<script" not in chunk
+
+
+def test_component_stream_defer():
+    stream = ComponentStream()
+
+    html = _render_tag(Context({STREAM_CONTEXT_KEY: stream}))
+
+    assert html.startswith("<div unicorn:stream=")
+    assert len(stream.deferred) == 1
+    assert stream.deferred[0].component_name == "tests.components.test_streaming.FakeComponentStreamed"
+    assert "<script" not in html
+
+
+def test_component_stream_without_stream_in_context():
+    html = _render_tag(Context({}))
+
+    assert "unicorn:stream" not in html
+    assert "World</div>" in html
+
+
+def test_component_stream_error(caplog):
+    stream = ComponentStream()
+    _render_tag(Context({STREAM_CONTEXT_KEY: stream}), component_name="FakeComponentStreamedError")
+    _render_tag(Context({STREAM_CONTEXT_KEY: stream}))
+
+    chunks = list(stream)
+
+    assert len(chunks) == 1
+    assert "World</div></template>" in chunks[0]
+    assert "could not be streamed" in caplog.text
+
+
+def test_streaming_response_without_deferred_components():
+    response = HttpResponse("<div></div>")
+
+    assert ComponentStream().streaming_response(response) is response
+
+
+def test_direct_view_streams_child(settings):
+    settings.DEBUG = True
+    request = RequestFactory().get("/")
+    view = FakeComponentStreamedParent.as_view()
+
+    response = view(request).render()
+
+    assert isinstance(response, StreamingHttpResponse)
+
+    content = _get_content(response)
+    (component, chunk) = content.split("<template ")
+
+    assert component.count("unicorn:stream=") == 1
+    assert "<script" in component
+    assert chunk.startswith('unicorn:stream:for="')
+    assert "World</div></template>" in chunk
@@ -0,0 +1,115 @@
+from django import forms
+
+from django_unicorn.components import UnicornView
+from django_unicorn.components.validation import FormValidationCache, can_clean_form_fields, clean_form_fields
+from example.coffee.models import Flavor
+
+
+class CountingForm(forms.Form):
+    name = forms.CharField(min_length=3)
+    email = forms.EmailField()
+
+    clean_calls: list[str] = []  # noqa: RUF012
+
+    def clean_name(self):
+        self.clean_calls.append("name")
+        return self.cleaned_data["name"]
+
+    def clean_email(self):
+        self.clean_calls.append("email")
+        return self.cleaned_data["email"]
+
+    def clean(self):
+        self.clean_calls.append("__all__")
+        cleaned_data = super().clean()
+
+        if cleaned_data.get("name") == "bob" and cleaned_data.get("email") == "bob@example.com":
+            raise forms.ValidationError("Bob is not allowed", code="bob")
+
+        return cleaned_data
+
+
+class CountingComponent(UnicornView):
+    form_class = CountingForm
+
+    name = "alice"
+    email = "alice@example.com"
+
+
+def _create_component(component_id):
+    CountingForm.clean_calls.clear()
+    component = CountingComponent(component_id=component_id, component_name="counting")
+    CountingForm.clean_calls.clear()
+
+    return component
+
+
+def test_validate_model_names_only_cleans_changed_fields():
+    component = _create_component("test_validate_model_names_only_cleans_changed_fields")
+    component.validate()
+    CountingForm.clean_calls.clear()
+
+    component._validate_called = False
+    component.name = "al"
+    errors = component.validate(model_names=["name"])
+
+    assert CountingForm.clean_calls == ["__all__"]
+    assert errors["name"][0]["code"] == "min_length"
+    assert "email" not in errors
+
+
+def test_validate_model_names_reuses_unchanged_results():
+    component = _create_component("test_validate_model_names_reuses_unchanged_results")
+    component.validate()
+    CountingForm.clean_calls.clear()
+
+    component._validate_called = False
+    component.validate(model_names=[])
+
+    assert CountingForm.clean_calls == []
+    assert component.errors == {}
+
+
+def test_validate_form_level_clean():
+    component = _create_component("test_validate_form_level_clean")
+    component.validate()
+    CountingForm.clean_calls.clear()
+
+    component._validate_called = False
+    component.name = "bob"
+    component.email = "bob@example.com"
+    errors = component.validate()
+
+    assert sorted(CountingForm.clean_calls) == ["__all__", "email", "name"]
+    assert errors["__all__"][0]["code"] == "bob"
+
+
+def test_validate_matches_full_clean():
+    data = {"name": "al", "email": "not-an-email"}
+
+    form = CountingForm(data=data)
+    form.is_valid()
+
+    incremental_form = CountingForm(data=data)
+    clean_form_fields(incremental_form, FormValidationCache(), field_names=())
+
+    assert incremental_form.errors.get_json_data() == form.errors.get_json_data()
+    assert incremental_form.cleaned_data == form.cleaned_data
+
+    # Re-use every cached result
+    cached_form = CountingForm(data=data)
+    validation_cache = FormValidationCache()
+    clean_form_fields(cached_form, validation_cache, field_names=())
+    clean_form_fields(cached_form, validation_cache, field_names=())
+
+    assert cached_form.errors.get_json_data() == form.errors.get_json_data()
+
+
+def test_can_clean_form_fields():
+    class FlavorForm(forms.ModelForm):
+        class Meta:
+            model = Flavor
+            fields = ("name",)
+
+    assert can_clean_form_fields(CountingForm(data={}))
+    assert not can_clean_form_fields(FlavorForm(data={}))
@@ -151,6 +151,25 @@ test("$returnValue", (t) => {
   t.is(action.payload.name, 'test("123")');
 });
 
+test("$returnValue sends parsed arguments", (t) => {
+  const html = `
+<div unicorn:id="5jypjiyb" unicorn:name="text-inputs" unicorn:checksum="GXzew3Km">
+  <input unicorn:model='name'></input>
+  <button unicorn:click='test($returnValue, flag=True)'></button>
+</div>`;
+  const component = getComponent(html);
+  component.return = { value: "123" };
+
+  component.actionEvents.click[0].element.el.click();
+
+  t.is(component.actionQueue.length, 1);
+  const action = component.actionQueue[0];
+  t.is(action.payload.name, 'test("123", flag=True)');
+  t.is(action.payload.method, "test");
+  t.deepEqual(action.payload.args, ["123"]);
+  t.deepEqual(action.payload.kwargs, { flag: true });
+});
+
 test("$returnValue invalid property", (t) => {
   const html = `
 <div unicorn:id="5jypjiyb" unicorn:name="text-inputs" unicorn:checksum="GXzew3Km">
@@ -5,6 +5,7 @@ test("init unicorn", (t) => {
   const actual = init("unicorn/", "X-Unicorn", "unicorn", { NAME: "morphdom" });
 
   t.true(actual.messageUrl === "unicorn/");
+  t.true(actual.renderUrl === "");
   t.true(actual.csrfTokenHeaderName === "X-Unicorn");
   t.true(actual.csrfTokenCookieName === "unicorn");
 });
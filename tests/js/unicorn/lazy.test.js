@@ -0,0 +1,45 @@
+import test from "ava";
+import fetchMock from "fetch-mock";
+import { JSDOM } from "jsdom";
+import { init } from "../../../src/django_unicorn/static/unicorn/js/unicorn.js";
+import { components } from "../../../src/django_unicorn/static/unicorn/js/store.js";
+
+test.beforeEach(() => {
+  const dom = new JSDOM(`<!doctype html><html><body>
+<input type="hidden" name="csrfmiddlewaretoken" value="asdf">
+<div unicorn:lazy="signed" unicorn:lazy:trigger="idle" unicorn:name="hello-world"></div>
+</body></html>`);
+  global.document = dom.window.document;
+  global.window = dom.window;
+  global.Node = dom.window.Node;
+  global.NodeFilter = dom.window.NodeFilter;
+
+  for (const key in components) {
+    delete components[key];
+  }
+});
+
+test.afterEach(() => {
+  delete global.document;
+  delete global.window;
+  delete global.Node;
+  delete global.fetch;
+});
+
+test("load lazy component when idle", async (t) => {
+  const res = {
+    id: "lazy-id",
+    dom: `<div unicorn:id="lazy-id" unicorn:name="hello-world" unicorn:key="" unicorn:checksum="abc" unicorn:data='{"name":"World"}' unicorn:calls="[]">World</div>`,
+  };
+  global.fetch = fetchMock.sandbox().mock().post("/unicorn/render/hello-world", res);
+
+  init("/unicorn/message", "X-Unicorn", "unicorn", { NAME: "morphdom" }, "/unicorn/render");
+
+  // Wait for the idle callback and the response
+  await new Promise((resolve) => setTimeout(resolve, 50));
+
+  t.is(document.querySelector("[unicorn\\:lazy]"), null);
+  t.is(document.querySelector("[unicorn\\:id]").textContent, "World");
+  t.truthy(components["lazy-id"]);
+  t.is(JSON.parse(global.fetch.lastOptions().body).lazy, "signed");
+});
@@ -0,0 +1,35 @@
+import test from "ava";
+import { JSDOM } from "jsdom";
+import { init } from "../../../src/django_unicorn/static/unicorn/js/unicorn.js";
+import { components } from "../../../src/django_unicorn/static/unicorn/js/store.js";
+
+test.beforeEach(() => {
+  const dom = new JSDOM(`<!doctype html><html><body>
+<div unicorn:stream="stream-id" unicorn:name="hello-world"></div>
+</body></html>
+<template unicorn:stream:for="stream-id"><div unicorn:id="stream-id" unicorn:name="hello-world" unicorn:key="" unicorn:checksum="abc" unicorn:data='{"name":"World"}' unicorn:calls="[]">World</div></template>
+`);
+  global.document = dom.window.document;
+  global.window = dom.window;
+  global.Node = dom.window.Node;
+  global.NodeFilter = dom.window.NodeFilter;
+
+  for (const key in components) {
+    delete components[key];
+  }
+});
+
+test.afterEach(() => {
+  delete global.document;
+  delete global.window;
+  delete global.Node;
+});
+
+test("swap streamed component", (t) => {
+  init("/unicorn/message", "X-Unicorn", "unicorn", { NAME: "morphdom" }, "/unicorn/render");
+
+  t.is(document.querySelector("[unicorn\\:stream]"), null);
+  t.is(document.querySelector("template"), null);
+  t.is(document.querySelector("[unicorn\\:id]").textContent, "World");
+  t.truthy(components["stream-id"]);
+});
@@ -0,0 +1,66 @@
+import test from "ava";
+import { parseCall } from "../../../src/django_unicorn/static/unicorn/js/utils.js";
+
+test("method without parenthesis", (t) => {
+  t.deepEqual(parseCall("$refresh"), {
+    method: "$refresh",
+    args: [],
+    kwargs: {},
+  });
+});
+
+test("int arg", (t) => {
+  t.deepEqual(parseCall("select(1234)"), {
+    method: "select",
+    args: [1234],
+    kwargs: {},
+  });
+});
+
+test("args and kwargs", (t) => {
+  t.deepEqual(parseCall("update('a', [1, None], flag=True, label=\"It's\")"), {
+    method: "update",
+    args: ["a", [1, null]],
+    kwargs: { flag: true, label: "It's" },
+  });
+});
+
+test("dictionary arg", (t) => {
+  t.deepEqual(parseCall("filter({'name': 'unicorn', 'page': 2},)"), {
+    method: "filter",
+    args: [{ name: "unicorn", page: 2 }],
+    kwargs: {},
+  });
+});
+
+test("float arg is not parsed", (t) => {
+  t.is(parseCall("select(1.5)"), null);
+});
+
+test("tuple arg is not parsed", (t) => {
+  t.is(parseCall("select((1, 2))"), null);
+});
+
+test("int dictionary key is not parsed", (t) => {
+  t.is(parseCall("select({1: 2})"), null);
+});
+
+test("escaped string is not parsed", (t) => {
+  t.is(parseCall("select('It\\'s')"), null);
+});
+
+test("variable arg is not parsed", (t) => {
+  t.is(parseCall("select(constructor)"), null);
+});
+
+test("parent method is not parsed", (t) => {
+  t.is(parseCall("$parent.select(1)"), null);
+});
+
+test("setter is not parsed", (t) => {
+  t.is(parseCall("name='World'"), null);
+});
+
+test("positional arg after kwarg is not parsed", (t) => {
+  t.is(parseCall("select(a=1, 2)"), null);
+});
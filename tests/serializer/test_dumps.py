@@ -1,20 +1,27 @@
+import gc
 import json
 import uuid
-from datetime import timedelta
+import weakref
+from dataclasses import dataclass
+from datetime import date, timedelta
 from decimal import Decimal
 from types import MappingProxyType
 from typing import cast
 
+import orjson
 import pytest
+from django.core.serializers import serialize
 from django.db import models
 from django.db.models import Model
 from django.utils.timezone import now
 from pydantic import BaseModel
 
 from django_unicorn import serializer
+from django_unicorn.components import UnicornField
 from django_unicorn.serializer import InvalidFieldAttributeError, InvalidFieldNameError
+from django_unicorn.typer import _construct_model
 from django_unicorn.utils import dicts_equal
-from example.coffee.models import Flavor, NewFlavor, Taste
+from example.coffee.models import Flavor, NewFlavor, Origin, Taste
 
 
 class SimpleTestModel(models.Model):
@@ -67,6 +74,17 @@ class SubclassForeignKeyTestModel(ForeignKeyTestModel):
         app_label = "tests"
 
 
+if hasattr(models, "CompositePrimaryKey"):
+
+    class CompositePrimaryKeyTestModel(models.Model):
+        pk = models.CompositePrimaryKey("name", "date")  # type: ignore
+        name = models.CharField(max_length=10)
+        date = models.DateField()
+
+        class Meta:
+            app_label = "tests"
+
+
 class ManyToManyTestModel(models.Model):
     name = models.CharField(max_length=10)
     parents = models.ManyToManyField("self")
@@ -139,6 +157,24 @@ def test_simple_model():
     assert_dicts(expected, actual)
 
 
+@pytest.mark.skipif(not hasattr(models, "CompositePrimaryKey"), reason="Requires composite primary keys")
+def test_composite_primary_key_model():
+    composite_test_model = CompositePrimaryKeyTestModel(name="abc", date=date(2025, 1, 2))
+
+    actual = orjson.loads(serializer.dumps(composite_test_model))
+
+    # The same representation that Django's serializer produces
+    assert actual["pk"] == orjson.loads(serialize("json", [composite_test_model]))[0]["pk"]
+    assert actual["name"] == "abc"
+    assert actual["date"] == "2025-01-02"
+
+    # Round-trip the serialized data back into a model
+    constructed_model = _construct_model(CompositePrimaryKeyTestModel, actual)
+
+    assert constructed_model.pk == ("abc", "2025-01-02")
+    assert orjson.loads(serializer.dumps(constructed_model)) == actual
+
+
 def test_subclass_simple_model():
     expected = {"subclass_name": "def", "pk": 2, "name": "abc"}
 
@@ -527,6 +563,103 @@ def test_dumps_queryset(db):  # noqa: ARG001
     assert dicts_equal(expected, actual)
 
 
+def _create_flavors_with_many_to_many():
+    flavors = [Flavor.objects.create(name=f"name{i}", label=f"label{i}") for i in range(5)]
+
+    bitter = Taste.objects.create(name="Bitter")
+    bitter.flavor.add(flavors[0], flavors[1])
+    sweet = Taste.objects.create(name="Sweet")
+    sweet.flavor.add(flavors[1])
+
+    colombia = Origin.objects.create(name="Colombia")
+    colombia.flavor.add(*flavors)
+
+    return flavors, bitter, sweet, colombia
+
+
+def test_dumps_queryset_many_to_many(db, django_assert_num_queries):  # noqa: ARG001
+    flavors, bitter, sweet, colombia = _create_flavors_with_many_to_many()
+
+    # One query for the flavors and one query for each many-to-many field
+    with django_assert_num_queries(3):
+        actual = json.loads(serializer.dumps({"flavors": Flavor.objects.all()}))
+
+    assert [flavor["taste_set"] for flavor in actual["flavors"]] == [[bitter.pk], [bitter.pk, sweet.pk], [], [], []]
+    assert [flavor["origins"] for flavor in actual["flavors"]] == [[colombia.pk]] * len(flavors)
+
+
+def test_dumps_queryset_many_to_many_prefetched(db, django_assert_num_queries):  # noqa: ARG001
+    _, bitter, sweet, _ = _create_flavors_with_many_to_many()
+
+    # The prefetched many-to-many field doesn't get queried again
+    with django_assert_num_queries(3):
+        actual = json.loads(serializer.dumps({"flavors": Flavor.objects.prefetch_related("taste_set")}))
+
+    assert [flavor["taste_set"] for flavor in actual["flavors"]] == [[bitter.pk], [bitter.pk, sweet.pk], [], [], []]
+
+
+def test_dumps_queryset_many_to_many_forward(db, django_assert_num_queries):  # noqa: ARG001
+    flavors, bitter, sweet, _ = _create_flavors_with_many_to_many()
+
+    with django_assert_num_queries(2):
+        actual = json.loads(serializer.dumps({"tastes": Taste.objects.order_by("pk")}))
+
+    assert actual["tastes"][0]["pk"] == bitter.pk
+    assert actual["tastes"][0]["flavor"] == [flavors[0].pk, flavors[1].pk]
+    assert actual["tastes"][1]["pk"] == sweet.pk
+    assert actual["tastes"][1]["flavor"] == [flavors[1].pk]
+
+
+def test_dumps_queryset_chunks(db, settings, django_assert_num_queries):  # noqa: ARG001
+    settings.UNICORN = {**settings.UNICORN, "SERIALIZER": {"CHUNK_SIZE": 2}}
+    flavors, bitter, sweet, colombia = _create_flavors_with_many_to_many()
+
+    # One query for the flavors and one query for each many-to-many field per chunk of 2 flavors
+    with django_assert_num_queries(1 + 3 * 2):
+        actual = json.loads(serializer.dumps({"flavors": Flavor.objects.all()}))
+
+    assert [flavor["pk"] for flavor in actual["flavors"]] == [flavor.pk for flavor in flavors]
+    assert [flavor["taste_set"] for flavor in actual["flavors"]] == [[bitter.pk], [bitter.pk, sweet.pk], [], [], []]
+    assert [flavor["origins"] for flavor in actual["flavors"]] == [[colombia.pk]] * len(flavors)
+
+
+def test_dumps_queryset_fills_result_cache(db, django_assert_num_queries):  # noqa: ARG001
+    flavors, _, _, _ = _create_flavors_with_many_to_many()
+    queryset = Flavor.objects.all()
+
+    serializer.dumps({"flavors": queryset})
+
+    # Rendering the template re-uses the models that were serialized
+    with django_assert_num_queries(0):
+        assert [flavor.pk for flavor in queryset] == [flavor.pk for flavor in flavors]
+
+
+def test_dumps_queryset_max_rows(db, settings, caplog):  # noqa: ARG001
+    settings.UNICORN = {**settings.UNICORN, "SERIALIZER": {"MAX_QUERYSET_ROWS": 2}}
+    flavors, _, _, _ = _create_flavors_with_many_to_many()
+
+    actual = json.loads(serializer.dumps({"flavors": Flavor.objects.all()}))
+    assert [flavor["pk"] for flavor in actual["flavors"]] == [flavors[0].pk, flavors[1].pk]
+    assert "Only the first 2 rows of a Flavor queryset were serialized" in caplog.text
+
+    # Evaluated querysets also get limited
+    evaluated_flavors = Flavor.objects.all()
+    len(evaluated_flavors)
+
+    actual = json.loads(serializer.dumps({"flavors": evaluated_flavors}))
+    assert [flavor["pk"] for flavor in actual["flavors"]] == [flavors[0].pk, flavors[1].pk]
+
+
+def test_dumps_queryset_max_rows_not_reached(db, settings, caplog):  # noqa: ARG001
+    settings.UNICORN = {**settings.UNICORN, "SERIALIZER": {"MAX_QUERYSET_ROWS": 5}}
+    flavors, _, _, _ = _create_flavors_with_many_to_many()
+
+    actual = json.loads(serializer.dumps({"flavors": Flavor.objects.all()}))
+
+    assert len(actual["flavors"]) == len(flavors)
+    assert "MAX_QUERYSET_ROWS" not in caplog.text
+
+
 def test_get_model_dict():
     flavor_one = Flavor(name="name1", label="label1")
     actual = serializer._get_model_dict(flavor_one)
@@ -550,6 +683,41 @@ def test_get_model_dict():
     assert dicts_equal(expected, actual)
 
 
+@pytest.mark.django_db
+def test_get_model_dict_matches_django_serializer():
+    now_datetime = now()
+    flavor = Flavor(
+        id=1,
+        name="name1",
+        label="label1",
+        parent_id=2,
+        float_value=0.583,
+        decimal_value=Decimal("0.98"),
+        datetime=now_datetime,
+        date=now_datetime.date(),
+        time=now_datetime.time(),
+        duration=timedelta(days=-1, hours=19),
+    )
+
+    expected = json.loads(serialize("json", [flavor]))[0]["fields"]
+    expected["pk"] = 1
+    expected["taste_set"] = []
+    expected["origins"] = []
+
+    actual = serializer._get_model_dict(flavor)
+
+    assert dicts_equal(expected, actual)
+
+
+def test_get_model_serialization_plan_is_cached():
+    plan = serializer._get_model_serialization_plan(Flavor)
+
+    assert serializer._get_model_serialization_plan(Flavor) is plan
+    assert [f.name for f in plan.fields] == [f.name for f in Flavor._meta.local_fields if f.serialize]
+    assert plan.many_to_many_field_names == ("taste_set", "origins")
+    assert plan.inherited_fields == ()
+
+
 @pytest.mark.django_db
 def test_get_model_dict_many_to_many_is_referenced(django_assert_num_queries):
     flavor_one = Flavor(name="name1", label="label1")
@@ -710,6 +878,79 @@ def test_pydantic():
     assert expected == actual
 
 
+def test_pydantic_json_mode():
+    class Book(BaseModel):
+        title: str = "The Grapes of Wrath"
+        price: Decimal = Decimal("9.99")
+        rating: float = 4.5
+        published: date = date(1939, 4, 14)
+
+    expected = '{"price":"9.99","published":"1939-04-14","rating":"4.5","title":"The Grapes of Wrath"}'
+    actual = serializer.dumps(Book())
+
+    assert expected == actual
+
+
+def test_dataclass():
+    @dataclass
+    class Book:
+        title: str = "The Grapes of Wrath"
+        rating: float = 4.5
+
+    expected = '{"books":[{"title":"The Grapes of Wrath","rating":"4.5"}]}'
+    actual = serializer.dumps({"books": [Book()]})
+
+    assert expected == actual
+
+
+def test_unicorn_field():
+    class Author(UnicornField):
+        def __init__(self):
+            self.name = "John Steinbeck"
+            self.books = [{"title": "The Grapes of Wrath", "rating": 4.5}]
+
+    expected = '{"author":{"books":[{"title":"The Grapes of Wrath","rating":"4.5"}],"name":"John Steinbeck"}}'
+    actual = serializer.dumps({"author": Author()})
+
+    assert expected == actual
+    assert serializer._get_json_serializer_encoder(Author) is vars
+
+
+def test_unicorn_field_to_json():
+    class Author(UnicornField):
+        def to_json(self):
+            return {"name": "John Steinbeck"}
+
+    expected = '{"author":{"name":"John Steinbeck"}}'
+    actual = serializer.dumps({"author": Author()})
+
+    assert expected == actual
+
+
+def test_instance_to_json():
+    class Author:
+        pass
+
+    author = Author()
+    author.to_json = lambda: {"name": "John Steinbeck"}
+
+    expected = '{"author":{"name":"John Steinbeck"}}'
+    actual = serializer.dumps({"author": author})
+
+    assert expected == actual
+
+
+def test_type_encoder_is_cached():
+    @dataclass
+    class Book:
+        title: str
+
+    encoder = serializer._get_type_encoder(Book)
+
+    assert serializer._get_type_encoder(Book) is encoder
+    assert encoder(Book(title="The Grapes of Wrath")) == {"title": "The Grapes of Wrath"}
+
+
 def test_exclude_field_attributes():
     expected = '{"book":{"title":"The Grapes of Wrath"}}'
 
@@ -841,3 +1082,20 @@ def test_dictionary_with_int_keys_as_strings_no_sort():
     )
 
     assert expected == actual
+
+
+def test_dumps_does_not_retain_data():
+    class Payload:
+        def to_json(self):
+            return {"name": "payload"}
+
+    payload = Payload()
+    payload_ref = weakref.ref(payload)
+
+    assert serializer.dumps({"payload": payload}) == '{"payload":{"name":"payload"}}'
+
+    del payload
+    gc.collect()
+
+    # Serialized payloads are not cached, so nothing should be holding on to the data
+    assert payload_ref() is None
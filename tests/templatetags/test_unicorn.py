@@ -1,4 +1,4 @@
-from django.template.base import Parser, Token, TokenType
+from django.template.base import Parser, Token, TokenType, Variable
 
 from django_unicorn.templatetags.unicorn import unicorn
 
@@ -24,3 +24,22 @@ def test_unicorn_args_and_kwargs():
     unicorn_node = unicorn(Parser([]), token)
 
     assert unicorn_node.kwargs == {"hello": "world", "test": 3}
+
+
+def test_unicorn_args_and_unparseable_kwargs_are_compiled():
+    token = Token(TokenType.TEXT, "unicorn 'todo' 'hello' name model=book.id")
+    unicorn_node = unicorn(Parser([]), token)
+
+    assert [arg.token for arg in unicorn_node.args] == ["'hello'", "name"]
+
+    kwarg = unicorn_node.unparseable_kwargs["model"]
+    assert kwarg.value == "book.id"
+    assert kwarg.variable.token == "book.id"
+    assert kwarg.pk_variable.token == "book.pk"
+
+
+def test_unicorn_arg_with_unknown_filter():
+    token = Token(TokenType.TEXT, "unicorn 'todo' name|unknown")
+    unicorn_node = unicorn(Parser([]), token)
+
+    assert isinstance(unicorn_node.args[0], Variable)
@@ -1,13 +1,15 @@
 import re
 
 import pytest
-from django.template import Context
+from django.template import Context, Engine, VariableDoesNotExist
 from django.template.base import Parser, Token, TokenType
 
 from django_unicorn.components import UnicornView
+from django_unicorn.components.lazy import loads_lazy_component
+from django_unicorn.components.unicorn_template_response import LazyContext
 from django_unicorn.errors import ComponentNotValidError
 from django_unicorn.templatetags.unicorn import unicorn
-from django_unicorn.utils import generate_checksum
+from django_unicorn.utils import generate_content_hash
 from example.coffee.models import Flavor
 
 
@@ -80,6 +82,11 @@ class FakeComponentModel(UnicornView):
             self.model_id = self.component_kwargs.get("model_id")
 
 
+class FakeComponentOuterContext(UnicornView):
+    template_html = "<div>{{ outer }} {{ hello }}</div>"
+    hello = "world"
+
+
 class FakeComponentCalls(UnicornView):
     template_name = "templates/test_component.html"
 
@@ -193,6 +200,126 @@ def test_unicorn_render_context_variable():
     assert "<b>variable!</b>" in actual
 
 
+def test_unicorn_render_outer_context_variable():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentOuterContext'",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+    context = Context({"outer": "page", "hello": "outer hello", "unused": "unused"})
+
+    with context.push(outer="loop"):
+        actual = unicorn_node.render(context)
+
+    # The component's attributes take precedence and the top-most layer of the outer context is used
+    assert "loop world" in actual
+
+    # Only the variables that were read are materialized
+    extra_context = unicorn_node.view.extra_context
+    assert isinstance(extra_context, LazyContext)
+    assert list(extra_context._values) == ["outer"]
+    assert extra_context.flatten()["unused"] == "unused"
+
+
+def test_unicorn_render_outer_context_is_a_snapshot():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentOuterContext'",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+    context = Context({"outer": "page"})
+
+    with context.push(outer="loop", counter=1):
+        unicorn_node.render(context)
+        extra_context = unicorn_node.view.extra_context
+
+        # `{% for %}` updates the variables of its layer in place for the next iteration
+        context["counter"] = 2
+
+    assert extra_context["counter"] == 1
+    assert extra_context.flatten()["counter"] == 1
+
+
+def test_unicorn_render_arg_with_filter():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentArgs' test_var|upper",
+    )
+    unicorn_node = unicorn(Parser([], builtins=Engine.get_default().template_builtins), token)
+    context = {"test_var": "tested!"}
+    actual = unicorn_node.render(Context(context))
+
+    assert "<b>TESTED!</b>" in actual
+
+
+def test_unicorn_render_missing_arg():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentArgs' missing",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+
+    with pytest.raises(VariableDoesNotExist):
+        unicorn_node.render(Context({}))
+
+
+def test_unicorn_render_lazy():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentKwargs' 'arg' test_kwarg=test_var lazy=True",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+    html = unicorn_node.render(Context({"test_var": "variable!"}))
+
+    assert html.startswith("<div unicorn:lazy=")
+    assert 'unicorn:lazy:trigger="visible"' in html
+    assert not hasattr(unicorn_node, "view")
+
+    signed_lazy_component = re.search(r'unicorn:lazy="([^"]+)"', html).group(1)
+    lazy_component = loads_lazy_component(signed_lazy_component)
+
+    assert lazy_component.component_id == unicorn_node.component_id
+    assert lazy_component.component_name == "tests.templatetags.test_unicorn_render.FakeComponentKwargs"
+    assert lazy_component.args == ["arg"]
+    assert lazy_component.kwargs == {"test_kwarg": "variable!"}
+
+
+def test_unicorn_render_lazy_idle():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentKwargs' lazy='idle'",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+    html = unicorn_node.render(Context({}))
+
+    assert 'unicorn:lazy:trigger="idle"' in html
+
+
+def test_unicorn_render_lazy_invalid_trigger():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentKwargs' lazy='later'",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+
+    with pytest.raises(AssertionError):
+        unicorn_node.render(Context({}))
+
+
+@pytest.mark.django_db
+def test_unicorn_render_lazy_with_model_kwarg():
+    token = Token(
+        TokenType.TEXT,
+        "unicorn 'tests.templatetags.test_unicorn_render.FakeComponentModel' model=model lazy=True",
+    )
+    unicorn_node = unicorn(Parser([]), token)
+    html = unicorn_node.render(Context({"model": Flavor(pk=1)}))
+
+    # The kwargs can't be signed, so the component gets rendered right away
+    assert "unicorn:lazy" not in html
+    assert unicorn_node.view.component_kwargs["model"].pk == 1
+
+
 def test_unicorn_render_with_invalid_html():
     token = Token(
         TokenType.TEXT,
@@ -450,7 +577,7 @@ def test_unicorn_render_hash(settings):
     # Assert that the content hash is correct
     script_idx = html.index("<script")
     rendered_content_without_inserted_after_script = html[:script_idx]
-    expected_hash = generate_checksum(rendered_content_without_inserted_after_script)
+    expected_hash = generate_content_hash(rendered_content_without_inserted_after_script)
     assert f'"hash":"{expected_hash}"' in html
 
 
@@ -473,7 +600,7 @@ def test_unicorn_render_hash_append(settings):
     # Assert that the content hash is correct
     script_idx = html.index("<script")
     rendered_content_without_appended_script = html[:script_idx] + "</div>"
-    expected_hash = generate_checksum(rendered_content_without_appended_script)
+    expected_hash = generate_content_hash(rendered_content_without_appended_script)
     assert f'"hash":"{expected_hash}"' in html
 
 
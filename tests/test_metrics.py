@@ -0,0 +1,226 @@
+import pytest
+from django.http import Http404
+
+from django_unicorn import metrics
+from django_unicorn.components import UnicornView
+from django_unicorn.components.render_cache import render_cache_stats
+from django_unicorn.errors import ComponentClassLoadError
+from django_unicorn.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    is_metrics_enabled,
+    metrics_view,
+)
+from django_unicorn.utils import generate_content_hash
+from tests.views.message.utils import post_and_get_response
+
+
+@pytest.fixture
+def metrics_enabled(settings):
+    settings.UNICORN = {**settings.UNICORN, "METRICS": True}
+    metrics.registry.reset()
+
+    yield
+
+    metrics.registry.reset()
+
+
+def test_is_metrics_enabled_default():
+    assert not is_metrics_enabled()
+
+
+def test_is_metrics_enabled_dict(settings):
+    settings.UNICORN = {**settings.UNICORN, "METRICS": {"ENABLED": True}}
+
+    assert is_metrics_enabled()
+
+
+def test_is_metrics_enabled_is_resolved_once(settings, monkeypatch):
+    settings.UNICORN = {**settings.UNICORN, "METRICS": True}
+
+    assert is_metrics_enabled()
+
+    def _get_setting(*args, **kwargs):  # noqa: ARG001
+        raise AssertionError("The setting should not be looked up again")
+
+    monkeypatch.setattr(metrics, "get_setting", _get_setting)
+
+    assert is_metrics_enabled()
+
+
+def test_is_metrics_enabled_setting_changed(settings):
+    settings.UNICORN = {**settings.UNICORN, "METRICS": True}
+    assert is_metrics_enabled()
+
+    settings.UNICORN = {**settings.UNICORN, "METRICS": False}
+    assert not is_metrics_enabled()
+
+
+def test_counter(metrics_enabled):  # noqa: ARG001
+    counter = Counter("test_total", "Test counter.", ("component",))
+    counter.inc(component="hello-world")
+    counter.inc(2, component="hello-world")
+    counter.inc(component='hello-"world"')
+
+    assert counter.get(component="hello-world") == 3
+
+    expected = """# HELP test_total Test counter.
+# TYPE test_total counter
+test_total{component="hello-\\"world\\""} 1
+test_total{component="hello-world"} 3"""
+
+    assert counter.generate() == expected
+
+
+def test_counter_disabled():
+    counter = Counter("test_total", "Test counter.")
+    counter.inc()
+
+    assert counter.get() == 0
+
+
+def test_counter_invalid_labels(metrics_enabled):  # noqa: ARG001
+    counter = Counter("test_total", "Test counter.", ("component",))
+
+    with pytest.raises(AssertionError) as e:
+        counter.inc(tier="render")
+
+    assert e.exconly() == "AssertionError: test_total requires the labels: component"
+
+
+def test_histogram(metrics_enabled):  # noqa: ARG001
+    histogram = Histogram("test_seconds", "Test histogram.", buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert histogram.get_count() == 4
+
+    expected = """# HELP test_seconds Test histogram.
+# TYPE test_seconds histogram
+test_seconds_bucket{le="0.1"} 2
+test_seconds_bucket{le="1"} 3
+test_seconds_bucket{le="+Inf"} 4
+test_seconds_sum 5.65
+test_seconds_count 4"""
+
+    assert histogram.generate() == expected
+
+
+def test_histogram_labels(metrics_enabled):  # noqa: ARG001
+    histogram = Histogram("test_bytes", "Test histogram.", ("component",), buckets=(1024,))
+    histogram.observe(10, component="hello-world")
+
+    assert 'test_bytes_bucket{component="hello-world",le="1024"} 1' in histogram.generate()
+
+
+def test_registry(metrics_enabled):  # noqa: ARG001
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter.")
+    registry.histogram("test_seconds", "Test histogram.")
+    counter.inc()
+
+    generated = registry.generate()
+
+    assert generated.startswith("# HELP test_total Test counter.\n# TYPE test_total counter\ntest_total 1\n")
+    assert "# TYPE test_seconds histogram\n" in generated
+
+    registry.reset()
+
+    assert counter.get() == 0
+
+
+def test_cache_counter_render_tier(metrics_enabled):  # noqa: ARG001
+    render_cache_stats.reset()
+    render_cache_stats.hit("hello-world")
+    render_cache_stats.hit("hello-world")
+    metrics.cache_hits.inc(tier="component")
+
+    assert metrics.cache_hits.get(tier="render") == 2
+
+    expected = """# HELP unicorn_cache_hits_total Cache hits per cache tier.
+# TYPE unicorn_cache_hits_total counter
+unicorn_cache_hits_total{tier="component"} 1
+unicorn_cache_hits_total{tier="render"} 2"""
+
+    assert metrics.cache_hits.generate() == expected
+
+    render_cache_stats.reset()
+
+
+def test_registry_duplicate():
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Test counter.")
+
+    with pytest.raises(AssertionError):
+        registry.counter("test_total", "Test counter.")
+
+
+def test_metrics_view(rf, metrics_enabled):  # noqa: ARG001
+    metrics.messages.inc(component="hello-world")
+
+    response = metrics_view(rf.get("/metrics"))
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == PROMETHEUS_CONTENT_TYPE
+    assert 'unicorn_messages_total{component="hello-world"} 1\n' in response.content.decode()
+
+
+def test_metrics_view_disabled(rf):
+    with pytest.raises(Http404):
+        metrics_view(rf.get("/metrics"))
+
+
+def test_message_metrics(client, metrics_enabled):  # noqa: ARG001
+    component_name = "tests.views.fake_components.FakeComponent"
+
+    post_and_get_response(
+        client,
+        url=f"/message/{component_name}",
+        data={"method_count": 0},
+        action_queue=[{"payload": {"name": "test_method"}, "type": "callMethod"}],
+    )
+
+    assert metrics.messages.get(component=component_name) == 1
+    assert metrics.messages_not_modified.get(component=component_name) == 0
+    assert metrics.message_duration.get_count(component=component_name) == 1
+    assert metrics.message_payload_size.get_count(component=component_name) == 1
+    assert metrics.render_duration.get_count(component=component_name) == 1
+    assert metrics.serialize_duration.get_count(component=component_name) >= 1
+    assert metrics.cache_misses.get(tier="component") == 1
+
+
+def test_message_metrics_not_modified(client, metrics_enabled):  # noqa: ARG001
+    component_name = "tests.views.fake_components.FakeComponent"
+
+    component = UnicornView.create(
+        component_id="metrics-not-modified",
+        component_name=component_name,
+    )
+    rendered_content = component.render()
+    metrics.registry.reset()
+
+    response = post_and_get_response(
+        client,
+        url=f"/message/{component_name}",
+        data={"method_count": 0},
+        action_queue=[{"payload": {"name": "test_method_kwargs(count=0)"}, "type": "callMethod"}],
+        component_id="metrics-not-modified",
+        hash=generate_content_hash(rendered_content),
+        return_response=True,
+    )
+
+    assert response.status_code == 304
+    assert metrics.messages.get(component=component_name) == 1
+    assert metrics.messages_not_modified.get(component=component_name) == 1
+    assert metrics.cache_hits.get(tier="component") == 1
+
+
+def test_message_metrics_invalid_component(client, metrics_enabled):  # noqa: ARG001
+    with pytest.raises(ComponentClassLoadError):
+        post_and_get_response(client, url="/message/tests.views.fake_components.MissingComponent")
+
+    assert metrics.messages.samples() == []
@@ -0,0 +1,325 @@
+import logging
+
+import orjson
+import pytest
+
+from django_unicorn import profiling
+from django_unicorn.decorators import timed
+from django_unicorn.profiling import (
+    NOOP_SPAN,
+    FileSink,
+    LoggingSink,
+    MemorySink,
+    Span,
+    get_current_span,
+    get_phase_durations,
+    get_phase_sizes,
+    get_server_timing,
+    get_sink,
+    get_stats,
+    is_profiling_enabled,
+    profile,
+    profile_root,
+    profiled,
+)
+from tests.views.message.utils import post_and_get_response
+
+
+@pytest.fixture
+def memory_sink(settings):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": {"ENABLED": True, "SINK": "memory"}}
+
+    sink = get_sink()
+    sink.clear()
+
+    yield sink
+
+    sink.clear()
+
+
+def _iter_spans(span, name):
+    if span.name == name:
+        yield span
+
+    for child in span.children:
+        yield from _iter_spans(child, name)
+
+
+def _get_span_names(span):
+    return [span.name, *(name for child in span.children for name in _get_span_names(child))]
+
+
+def test_is_profiling_enabled_default():
+    assert not is_profiling_enabled()
+
+
+def test_is_profiling_enabled_bool(settings):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": True}
+
+    assert is_profiling_enabled()
+
+
+def test_profile_without_root():
+    with profile("render") as span:
+        assert span is NOOP_SPAN
+        span.add_size("dom", 10)
+
+    assert get_current_span() is NOOP_SPAN
+
+
+def test_profile_root_disabled():
+    with profile_root("message") as span:
+        assert span is NOOP_SPAN
+
+        with profile("render") as child:
+            assert child is NOOP_SPAN
+
+
+def test_profile_root_enabled():
+    with profile_root("message", enabled=True) as span:
+        span.add_size("payload", 5)
+        span.add_size("payload", 5)
+
+        with profile("render") as child:
+            assert get_current_span() is child
+
+            with profile("template"):
+                pass
+
+        with profile("respond"):
+            pass
+
+    assert get_current_span() is NOOP_SPAN
+    assert span.duration >= span.children[0].duration
+    assert span.sizes == {"payload": 10}
+    assert _get_span_names(span) == ["message", "render", "template", "respond"]
+
+
+def test_profile_root_nested():
+    with profile_root("message", enabled=True) as span:
+        with profile_root("lazy-render") as child:
+            pass
+
+    assert span.children == [child]
+
+
+def test_profile_decorator():
+    @profile("add")
+    def _add(a, b):
+        return a + b
+
+    assert _add(1, 2) == 3
+
+    with profile_root("root", enabled=True) as span:
+        assert _add(1, 2) == 3
+        assert _add(1, 2) == 3
+
+    assert _get_span_names(span) == ["root", "add", "add"]
+
+
+def test_profile_root_exception():
+    with pytest.raises(ValueError), profile_root("message", enabled=True) as span:
+        raise ValueError
+
+    assert span.duration is not None
+    assert get_current_span() is NOOP_SPAN
+
+
+def test_profiled_disabled():
+    def _add(a, b):
+        return a + b
+
+    assert profiled(_add) is _add
+    assert profiled(name="add")(_add) is _add
+
+
+def test_profiled_enabled(settings):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": True}
+
+    @profiled
+    def _add(a, b):
+        return a + b
+
+    @profiled(name="subtract")
+    def _subtract(a, b):
+        return a - b
+
+    assert _add(1, 2) == 3
+
+    with profile_root("root", enabled=True) as span:
+        assert _add(1, 2) == 3
+        assert _subtract(2, 1) == 1
+
+    assert _get_span_names(span) == ["root", "test_profiled_enabled.<locals>._add", "subtract"]
+
+
+def test_span_format():
+    span = Span("message")
+    span.add_size("payload", 5)
+    span.finish()
+
+    child = Span("render")
+    child.finish()
+    span.children.append(child)
+
+    lines = span.format().split("\n")
+
+    assert lines[0].startswith("message: ")
+    assert lines[0].endswith("ms payload=5")
+    assert lines[1].startswith("  render: ")
+
+
+def test_get_sink_default(settings):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": True}
+
+    assert isinstance(get_sink(), LoggingSink)
+
+
+def test_get_sink_is_cached(memory_sink):
+    assert get_sink() is memory_sink
+
+
+def test_get_sink_dotted_path(settings):
+    settings.UNICORN = {
+        **settings.UNICORN,
+        "PROFILING": {"ENABLED": True, "SINK": "django_unicorn.profiling.MemorySink"},
+    }
+
+    assert isinstance(get_sink(), MemorySink)
+
+
+def test_get_sink_file_missing_path(settings):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": {"ENABLED": True, "SINK": "file"}}
+
+    with pytest.raises(AssertionError) as e:
+        get_sink()
+
+    assert e.exconly() == 'AssertionError: PROFILING["PATH"] is required for the file sink'
+
+
+def test_memory_sink(memory_sink):
+    with profile_root("message"):
+        pass
+
+    assert [span.name for span in memory_sink.spans] == ["message"]
+
+
+def test_memory_sink_size(settings):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": {"ENABLED": True, "SINK": "memory", "SIZE": 2}}
+
+    for name in ("first", "second", "third"):
+        with profile_root(name):
+            pass
+
+    assert [span.name for span in get_sink().spans] == ["second", "third"]
+
+
+def test_logging_sink(settings, caplog):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": True}
+
+    with caplog.at_level(logging.DEBUG, logger="django_unicorn.profiling"), profile_root("message"):
+        with profile("render"):
+            pass
+
+    (message,) = caplog.messages
+    assert message.startswith("message: ")
+    assert "\n  render: " in message
+
+
+def test_file_sink(settings, tmp_path):
+    path = tmp_path / "spans.jsonl"
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": {"ENABLED": True, "SINK": "file", "PATH": str(path)}}
+
+    for _ in range(2):
+        with profile_root("message") as span:
+            span.add_size("payload", 5)
+
+    lines = path.read_bytes().splitlines()
+
+    assert len(lines) == 2
+    assert orjson.loads(lines[0])["sizes"] == {"payload": 5}
+    assert isinstance(get_sink(), FileSink)
+
+
+def test_sink_error_is_logged(settings, caplog, monkeypatch):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": True}
+
+    def _emit(span):  # noqa: ARG001
+        raise OSError
+
+    monkeypatch.setattr(profiling.LoggingSink, "emit", staticmethod(_emit))
+
+    with profile_root("message"):
+        pass
+
+    assert "Profiling span could not be emitted" in caplog.text
+
+
+def test_message_span(client, memory_sink, profiled_phases):  # noqa: ARG001
+    post_and_get_response(
+        client,
+        url="/message/tests.views.fake_components.FakeComponent",
+        data={"method_count": 0},
+        action_queue=[{"payload": {"name": "test_method"}, "type": "callMethod"}],
+    )
+
+    (span,) = memory_sink.spans
+    span_names = _get_span_names(span)
+
+    assert span.name == "message"
+    assert span.sizes["payload"] > 0
+    assert span.sizes["response"] > 0
+
+    for name in ("parse", "construct", "actions", "serialize", "render", "template", "parse-html", "respond"):
+        assert name in span_names
+
+    render = next(_iter_spans(span, "render"))
+    assert render.sizes["dom"] > 0
+
+
+def _get_span_tree():
+    span = Span("message")
+    span.add_size("payload", 5)
+    span.duration = 10
+
+    render = Span("render")
+    render.add_size("dom", 100)
+    render.duration = 6
+    span.children.append(render)
+
+    serialize = Span("serialize")
+    serialize.duration = 1
+    render.children.append(serialize)
+
+    child_render = Span("render")
+    child_render.add_size("dom", 20)
+    child_render.duration = 2
+    render.children.append(child_render)
+
+    return span
+
+
+def test_get_phase_durations():
+    assert get_phase_durations(_get_span_tree()) == {"message": 4, "render": 5, "serialize": 1}
+
+
+def test_get_phase_sizes():
+    assert get_phase_sizes(_get_span_tree()) == {"payload": 5, "dom": 100}
+
+
+def test_get_server_timing():
+    expected = "message;dur=4.000, render;dur=5.000, serialize;dur=1.000, total;dur=10.000"
+
+    assert get_server_timing(_get_span_tree()) == expected
+
+
+def test_get_stats():
+    assert get_stats(_get_span_tree()) == "payload=5, dom=100"
+
+
+def test_timed_is_deprecated():
+    def _add(a, b):
+        return a + b
+
+    with pytest.warns(DeprecationWarning, match="use `django_unicorn.profiling.profiled` instead"):
+        assert timed(_add)(1, 2) == 3
@@ -6,6 +6,9 @@ from django_unicorn.settings import (
     get_morpher_settings,
     get_script_location,
     get_serial_enabled,
+    get_serializer_chunk_size,
+    get_serializer_data_size_warning,
+    get_serializer_max_queryset_rows,
 )
 
 
@@ -89,3 +92,18 @@ def test_get_morpher_settings(settings):
     settings.UNICORN = {**settings.UNICORN}
     if "MORPHER" in settings.UNICORN:
         del settings.UNICORN["MORPHER"]
+
+
+def test_get_serializer_settings(settings):
+    assert get_serializer_chunk_size() == 2000
+    assert get_serializer_max_queryset_rows() is None
+    assert get_serializer_data_size_warning() == 1_000_000
+
+    settings.UNICORN = {
+        **settings.UNICORN,
+        "SERIALIZER": {"CHUNK_SIZE": 100, "MAX_QUERYSET_ROWS": 50, "DATA_SIZE_WARNING": None},
+    }
+
+    assert get_serializer_chunk_size() == 100
+    assert get_serializer_max_queryset_rows() == 50
+    assert get_serializer_data_size_warning() is None
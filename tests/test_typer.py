@@ -5,7 +5,15 @@ from typing import get_type_hints as typing_get_type_hints
 from pydantic import BaseModel
 
 from django_unicorn.components import UnicornView
-from django_unicorn.typer import cast_attribute_value, cast_value, get_type_hints
+from django_unicorn.typer import (
+    cast_attribute_value,
+    cast_value,
+    create_queryset,
+    get_caster,
+    get_method_arguments,
+    get_type_hints,
+)
+from django_unicorn.typing import QuerySetType
 from example.coffee.models import Flavor
 
 
@@ -41,6 +49,21 @@ class TestClass:
     integer: int
     boolean: bool
 
+    def method(self, integer: int):
+        return integer
+
+
+def test_get_type_hints_cached_per_class():
+    assert get_type_hints(TestClass()) is get_type_hints(TestClass())
+    assert get_type_hints(TestClass().method) is get_type_hints(TestClass().method)
+    assert get_type_hints(TestClass().method) == {"integer": int}
+
+
+def test_get_method_arguments_bound_method():
+    assert get_method_arguments(TestClass().method) == ["integer"]
+    assert get_method_arguments(TestClass.method) == ["self", "integer"]
+    assert get_method_arguments(TestClass().method) == ["integer"]
+
 
 def test_cast_attribute_value_int():
     expected = 1
@@ -116,6 +139,17 @@ def test_cast_value_model_int():
     assert actual == 1
 
 
+def test_get_caster_is_cached():
+    assert get_caster(int | None) is get_caster(int | None)
+    assert get_caster(int | None)("1") == 1
+    assert get_caster(int | None)(None) is None
+
+
+def test_cast_value_union_skips_failed_caster():
+    assert cast_value(datetime.date | int, "2020-01-02") == datetime.date(2020, 1, 2)
+    assert cast_value(datetime.date | int, 0) == datetime.date(1970, 1, 1)
+
+
 @dataclass
 class DataClass:
     name: str
@@ -170,3 +204,18 @@ def test_cast_value_list_pydantic():
     type_hint = type_hints["pydantic_list_data"]
     actual = cast_value(type_hint, [{"name": "foo"}])
     assert actual == [test_data]
+
+
+def test_create_queryset_updates_and_appends_models():
+    queryset = Flavor.objects.none()
+    queryset._result_cache = [Flavor(pk=1, name="one"), Flavor(pk=2, name="two")]
+
+    actual = create_queryset(queryset, None, [{"pk": 2, "name": "TWO"}, {"pk": 3, "name": "three"}])
+
+    assert [(model.pk, model.name) for model in actual._result_cache] == [(1, "one"), (2, "TWO"), (3, "three")]
+
+
+def test_create_queryset_from_type_hint():
+    actual = create_queryset([], QuerySetType[Flavor], [{"pk": 1, "name": "one"}, {"pk": 1, "name": "ONE"}])
+
+    assert [(model.pk, model.name) for model in actual._result_cache] == [(1, "ONE")]
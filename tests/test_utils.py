@@ -2,10 +2,14 @@ import pytest
 from django.template.backends.django import Template
 
 from django_unicorn.utils import (
+    FieldChecksums,
     create_template,
     generate_checksum,
+    generate_content_hash,
+    generate_legacy_checksum,
     get_method_arguments,
     is_non_string_sequence,
+    is_valid_checksum,
     sanitize_html,
 )
 
@@ -13,8 +17,8 @@ from django_unicorn.utils import (
 def test_generate_checksum_bytes(settings):
     settings.SECRET_KEY = "asdf"
 
-    expected = "TfxFqcQL"
-    actual = generate_checksum(b'{"name": "test"}')
+    expected = "2:9863c0e867215a0c"
+    actual = generate_checksum(b'{"name":"test"}')
 
     assert expected == actual
 
@@ -22,8 +26,8 @@ def test_generate_checksum_bytes(settings):
 def test_generate_checksum_str(settings):
     settings.SECRET_KEY = "asdf"
 
-    expected = "TfxFqcQL"
-    actual = generate_checksum('{"name": "test"}')
+    expected = "2:9863c0e867215a0c"
+    actual = generate_checksum('{"name":"test"}')
 
     assert expected == actual
 
@@ -31,11 +35,69 @@ def test_generate_checksum_str(settings):
 def test_generate_checksum_dict(settings):
     settings.SECRET_KEY = "asdf"
 
-    # This is different than the above because `str(dict)` turns `{"name": "test"}` into `"{'name': 'test'}"`
-    expected = "JaV4PeA6"
+    # The checksum of a dictionary is combined from the hashes of its fields
+    expected = "2:d764e39246ca794e"
     actual = generate_checksum({"name": "test"})
 
     assert expected == actual
+    assert generate_checksum({"a": 1, "b": 2}) == generate_checksum({"b": 2, "a": 1})
+    assert generate_checksum({"a": 1, "b": 2}) != generate_checksum({"a": 2, "b": 1})
+
+
+def test_field_checksums(settings):
+    settings.SECRET_KEY = "asdf"
+    data = {"name": "test", "count": 1}
+
+    field_checksums = FieldChecksums(data)
+
+    assert field_checksums.checksum == generate_checksum(data)
+    assert list(field_checksums.field_hashes) == ["name", "count"]
+
+
+def test_field_checksums_update(settings):
+    settings.SECRET_KEY = "asdf"
+    field_checksums = FieldChecksums({"name": "test", "count": 1, "removed": True})
+
+    updated_data = {"name": "test", "count": 2, "added": [1, 2]}
+    updated_field_checksums = field_checksums.update(updated_data)
+
+    assert updated_field_checksums.checksum == generate_checksum(updated_data)
+    assert updated_field_checksums.field_hashes["name"] is field_checksums.field_hashes["name"]
+    assert updated_field_checksums.field_hashes["count"] != field_checksums.field_hashes["count"]
+    assert "removed" not in updated_field_checksums.field_hashes
+
+
+@pytest.mark.parametrize(
+    "data,updated_data",
+    [
+        ({"a": 1, "b": {"c": 0}}, {"a": True, "b": {"c": False}}),
+        ({"a": [1, 2]}, {"a": [1.0, 2]}),
+        ({"a": 0.0}, {"a": -0.0}),
+    ],
+)
+def test_field_checksums_update_equal_values_with_different_types(settings, data, updated_data):
+    settings.SECRET_KEY = "asdf"
+
+    assert FieldChecksums(data).update(updated_data).checksum == generate_checksum(updated_data)
+
+
+def test_field_checksums_with_missing_field_hashes(settings):
+    settings.SECRET_KEY = "asdf"
+    data = {"name": "test", "count": 1}
+    field_hashes = FieldChecksums(data).field_hashes
+
+    del field_hashes["count"]
+
+    assert FieldChecksums(data, field_hashes).checksum == generate_checksum(data)
+
+
+def test_generate_checksum_secret_key(settings):
+    settings.SECRET_KEY = "asdf"
+    checksum = generate_checksum({"name": "test"})
+
+    settings.SECRET_KEY = "qwer"
+
+    assert generate_checksum({"name": "test"}) != checksum
 
 
 def test_generate_checksum_invalid(settings):
@@ -47,6 +109,46 @@ def test_generate_checksum_invalid(settings):
     assert e.exconly() == "TypeError: Invalid type: <class 'list'>"
 
 
+def test_generate_legacy_checksum_bytes(settings):
+    settings.SECRET_KEY = "asdf"
+
+    expected = "TfxFqcQL"
+    actual = generate_legacy_checksum(b'{"name": "test"}')
+
+    assert expected == actual
+
+
+def test_generate_legacy_checksum_dict(settings):
+    settings.SECRET_KEY = "asdf"
+
+    # This is different than the above because `str(dict)` turns `{"name": "test"}` into `"{'name': 'test'}"`
+    expected = "JaV4PeA6"
+    actual = generate_legacy_checksum({"name": "test"})
+
+    assert expected == actual
+
+
+def test_is_valid_checksum(settings):
+    settings.SECRET_KEY = "asdf"
+
+    assert is_valid_checksum("2:d764e39246ca794e", {"name": "test"})
+    assert is_valid_checksum("2:d764e39246ca794e", {"name": "test"}, field_checksums=FieldChecksums({"name": "test"}))
+    assert is_valid_checksum("JaV4PeA6", {"name": "test"})
+
+    assert not is_valid_checksum("2:d764e39246ca794e", {"name": "test2"})
+    assert not is_valid_checksum("JaV4PeA6", {"name": "test2"})
+    assert not is_valid_checksum("2:JaV4PeA6", {"name": "test"})
+    assert not is_valid_checksum(None, {"name": "test"})  # type: ignore
+
+
+def test_generate_content_hash():
+    expected = "f95a123500c23987"
+
+    assert generate_content_hash("<div></div>") == expected
+    assert generate_content_hash(b"<div></div>") == expected
+    assert generate_content_hash("<div>1</div>") != expected
+
+
 def test_get_method_arguments():
     def test_func(input_str):
         return input_str
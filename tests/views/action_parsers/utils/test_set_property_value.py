@@ -3,7 +3,7 @@ from datetime import datetime
 import pytest
 
 from django_unicorn.components import UnicornView
-from django_unicorn.views.action_parsers.utils import set_property_value
+from django_unicorn.views.action_parsers.utils import ManyToManySets, get_relation_fields, set_property_value
 from example.coffee.models import Flavor, Taste
 
 
@@ -152,3 +152,70 @@ def test_set_property_value_many_to_many_references_model():
 
     assert data["taste"]["flavor"] == [flavor.pk]
     assert component.taste.flavor.count() == 1  # type: ignore
+
+
+@pytest.mark.django_db
+def test_set_property_value_many_to_many_deferred():
+    component = FakeComponent(component_name="test", component_id="test_set_property_value_many_to_many_deferred")
+    component.taste.save()
+
+    flavor_one = Flavor.objects.create(name="test-flavor-one")
+    flavor_two = Flavor.objects.create(name="test-flavor-two")
+
+    many_to_many_sets = ManyToManySets()
+    data = {"taste": {}}
+
+    set_property_value(component, "taste.flavor", [flavor_one.pk], data, many_to_many_sets=many_to_many_sets)
+    set_property_value(component, "taste.flavor", [flavor_two.pk], data, many_to_many_sets=many_to_many_sets)
+
+    assert data["taste"]["flavor"] == [flavor_two.pk]
+    assert component.taste.flavor.count() == 0  # type: ignore
+    assert len(many_to_many_sets) == 1
+
+    many_to_many_sets.apply()
+
+    assert list(component.taste.flavor.all()) == [flavor_two]  # type: ignore
+    assert len(many_to_many_sets) == 0
+
+
+class FakeComponentWithManyToManyHooks(FakeComponent):
+    def updated_taste_flavor(self, value):  # noqa: ARG002
+        self.updated_flavors.append(list(self.taste.flavor.all()))
+
+    def updated(self, name, value):  # noqa: ARG002
+        self.updated_property_flavors.append(list(self.taste.flavor.all()))
+
+
+@pytest.mark.django_db
+def test_set_property_value_many_to_many_deferred_updated_hooks():
+    component = FakeComponentWithManyToManyHooks(
+        component_name="test", component_id="test_set_property_value_many_to_many_deferred_updated_hooks"
+    )
+    component.taste.save()
+    component.updated_flavors = []
+    component.updated_property_flavors = []
+
+    flavor_one = Flavor.objects.create(name="test-flavor-one")
+    flavor_two = Flavor.objects.create(name="test-flavor-two")
+
+    many_to_many_sets = ManyToManySets()
+    data = {"taste": {}}
+
+    set_property_value(component, "taste.flavor", [flavor_one.pk], data, many_to_many_sets=many_to_many_sets)
+    set_property_value(component, "taste.flavor", [flavor_two.pk], data, many_to_many_sets=many_to_many_sets)
+
+    # The hooks see the new relation, so it does not get deferred
+    assert component.updated_flavors == [[flavor_one], [flavor_two]]
+    assert component.updated_property_flavors == [[flavor_one], [flavor_two]]
+    assert len(many_to_many_sets) == 0
+
+
+def test_get_relation_fields():
+    relation_fields = get_relation_fields(Flavor)
+
+    assert relation_fields["parent"].field.attname == "parent_id"
+    assert not relation_fields["parent"].is_many_to_many
+    assert relation_fields["taste_set"].is_many_to_many
+    assert relation_fields["origins"].is_many_to_many
+    assert "name" not in relation_fields
+    assert get_relation_fields(Flavor) is relation_fields
@@ -14,6 +14,7 @@ def _post_to_component(
     method_name: str,
     component_name: str = "FakeComponent",
     data: dict | None = None,
+    payload: dict | None = None,
 ) -> Any:
     if data is None:
         data = {}
@@ -24,7 +25,7 @@ def _post_to_component(
         data=data,
         action_queue=[
             {
-                "payload": {"name": method_name},
+                "payload": {"name": method_name, **(payload or {})},
                 "type": "callMethod",
             }
         ],
@@ -77,7 +78,7 @@ def test_message_call_method_redirect_with_message(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
@@ -192,6 +193,56 @@ def test_message_call_method_kwargs(client):
     assert body["data"].get("method_count") == 99
 
 
+def test_message_call_method_parsed_args(client):
+    data = {"method_count": 0}
+    body = _post_to_component(
+        client,
+        method_name="test_method_args(3)",
+        data=data,
+        payload={"method": "test_method_args", "args": [4], "kwargs": {}},
+    )
+
+    # The arguments parsed by the frontend get used instead of parsing the name
+    assert body["data"].get("method_count") == 4
+
+
+def test_message_call_method_parsed_kwargs(client):
+    data = {"method_count": 0}
+    body = _post_to_component(
+        client,
+        method_name="test_method_kwargs(count=99)",
+        data=data,
+        payload={"method": "test_method_kwargs", "args": [], "kwargs": {"count": 99}},
+    )
+
+    assert body["data"].get("method_count") == 99
+
+
+def test_message_call_method_parsed_toggle(client):
+    data = {"check": False}
+    body = _post_to_component(
+        client,
+        method_name="$toggle('check')",
+        data=data,
+        payload={"method": "$toggle", "args": ["check"], "kwargs": {}},
+    )
+
+    assert body["data"].get("check") is True
+
+
+def test_message_call_method_invalid_parsed_args(client):
+    data = {"method_count": 0}
+    body = _post_to_component(
+        client,
+        method_name="test_method_args(3)",
+        data=data,
+        payload={"method": "test_method_args(4)", "args": [4], "kwargs": {}},
+    )
+
+    # Invalid parsed arguments are ignored and the name gets parsed
+    assert body["data"].get("method_count") == 3
+
+
 def test_message_call_method_no_validation(client):
     body = _post_to_component(
         client,
@@ -4,7 +4,7 @@ from tests.views.message.test_calls import FakeCallsComponent
 from tests.views.message.utils import post_and_get_response
 
 from django_unicorn.components import UnicornView
-from django_unicorn.utils import generate_checksum
+from django_unicorn.utils import generate_content_hash
 
 
 class FakeComponentParent(UnicornView):
@@ -33,7 +33,7 @@ def test_message_hash_no_change(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -60,7 +60,7 @@ def test_message_hash_changes(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -87,7 +87,7 @@ def test_message_hash_no_change_but_return_value(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -116,7 +116,7 @@ def test_message_hash_no_change_but_return_redirect(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -145,7 +145,7 @@ def test_message_hash_no_change_but_return_hash_update(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -174,7 +174,7 @@ def test_message_hash_no_change_but_return_poll_update(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -203,7 +203,7 @@ def test_message_hash_no_change_but_return_location_update(client):
         component_name="tests.views.fake_components.FakeComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {"method_count": 0}
     response = post_and_get_response(
@@ -232,7 +232,7 @@ def test_message_hash_no_change_but_calls(client):
         component_name="tests.views.message.test_calls.FakeCallsComponent",
     )
     rendered_content = component.render()
-    checksum = generate_checksum(rendered_content)
+    checksum = generate_content_hash(rendered_content)
 
     data = {}
     response = post_and_get_response(
@@ -266,7 +266,7 @@ def test_message_hash_no_change_but_parent(client):
 
     child = component.children[0]
     rendered_child_content = child.render()
-    child_hash = generate_checksum(rendered_child_content)
+    child_hash = generate_content_hash(rendered_child_content)
 
     assert child.parent.value == 0  # type: ignore
 
@@ -0,0 +1,67 @@
+import pytest
+from tests.views.message.utils import post_and_get_response
+
+from django_unicorn.components import UnicornView
+from django_unicorn.utils import generate_content_hash
+
+
+def _post(client, **kwargs):
+    return post_and_get_response(
+        client,
+        url="/message/tests.views.fake_components.FakeComponent",
+        data={"method_count": 0},
+        return_response=True,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def server_timing(settings, request):
+    settings.UNICORN = {**settings.UNICORN, "PROFILING": {"SERVER_TIMING": True}}
+
+    # The phases have to get decorated after `SERVER_TIMING` is enabled
+    request.getfixturevalue("profiled_phases")
+
+
+def test_message_server_timing_disabled(client):
+    response = _post(client, action_queue=[{"payload": {"name": "test_method"}, "type": "callMethod"}])
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response
+    assert "X-Unicorn-Stats" not in response
+
+
+def test_message_server_timing(client, server_timing):  # noqa: ARG001
+    response = _post(client, action_queue=[{"payload": {"name": "test_method"}, "type": "callMethod"}])
+
+    assert response.status_code == 200
+
+    metrics = dict(metric.split(";dur=") for metric in response["Server-Timing"].split(", "))
+
+    for name in ("message", "parse", "restore", "actions", "serialize", "render", "parse-html", "respond", "total"):
+        assert float(metrics[name]) >= 0
+
+    stats = dict(stat.split("=") for stat in response["X-Unicorn-Stats"].split(", "))
+
+    assert int(stats["payload"]) > 0
+    assert int(stats["response"]) == len(response.content)
+    assert int(stats["data"]) > 0
+    assert int(stats["dom"]) > 0
+
+
+def test_message_server_timing_not_modified(client, server_timing):  # noqa: ARG001
+    component = UnicornView.create(
+        component_id="server-timing-not-modified",
+        component_name="tests.views.fake_components.FakeComponent",
+    )
+    rendered_content = component.render()
+
+    response = _post(
+        client,
+        action_queue=[{"payload": {"name": "test_method_kwargs(count=0)"}, "type": "callMethod"}],
+        component_id="server-timing-not-modified",
+        hash=generate_content_hash(rendered_content),
+    )
+
+    assert response.status_code == 304
+    assert "total;dur=" in response["Server-Timing"]
@@ -27,7 +27,7 @@ def test_message_generated_checksum_matches_dom_checksum(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
@@ -48,6 +48,9 @@ def test_message_generated_checksum_matches_dom_checksum(client):
     root_element = get_root_element(dom)
     assert root_element.attrib.get("unicorn:checksum") == body.get("checksum")
 
+    # Only the changed field is hashed again, but the checksum is the same as for the whole data
+    assert body.get("checksum") == generate_checksum(body["data"])
+
 
 def test_message_target_invalid(client):
     data = {"clicked": False}
@@ -60,7 +63,7 @@ def test_message_target_invalid(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
@@ -89,7 +92,7 @@ def test_message_target_id(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
@@ -120,7 +123,7 @@ def test_message_target_only_id(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
@@ -151,7 +154,7 @@ def test_message_target_only_key(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
@@ -182,7 +185,7 @@ def test_message_target_key(client):
             }
         ],
         "data": data,
-        "checksum": generate_checksum(str(data)),
+        "checksum": generate_checksum(data),
         "id": shortuuid.uuid()[:8],
         "epoch": time.time(),
     }
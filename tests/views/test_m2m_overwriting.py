@@ -18,6 +18,9 @@ class M2MComponent(UnicornView):
         if self.taste:
             self.taste = Taste.objects.get(pk=self.taste.pk)
 
+    def flavor_count(self):
+        return self.taste.flavor.count()
+
 
 @pytest.mark.django_db
 def test_m2m_overwriting(client):
@@ -60,3 +63,33 @@ def test_m2m_overwriting(client):
     # and saved it or synced the M2M.
     assert taste.flavor.count() == 2, "DB M2M changes were overwritten!"
     assert flavor2 in taste.flavor.all()
+
+
+@pytest.mark.django_db
+def test_m2m_sync_input_is_set_once_before_methods(client):
+    flavor1 = Flavor.objects.create(name="Flavor 1")
+    flavor2 = Flavor.objects.create(name="Flavor 2")
+    taste = Taste.objects.create(name="Test Taste")
+
+    data = {"taste": {"pk": taste.pk, "flavor": []}}
+    action_queue = [
+        {"payload": {"name": "taste.flavor", "value": [flavor1.pk]}, "type": "syncInput"},
+        {"payload": {"name": "taste.flavor", "value": [flavor1.pk, flavor2.pk]}, "type": "syncInput"},
+        {"payload": {"name": "flavor_count"}, "type": "callMethod"},
+        {"payload": {"name": "taste.flavor", "value": [flavor2.pk]}, "type": "syncInput"},
+    ]
+
+    response = post_and_get_response(
+        client,
+        url="/message/tests.views.test_m2m_overwriting.M2MComponent",
+        data=data,
+        action_queue=action_queue,
+    )
+
+    assert not response.get("errors")
+
+    # The method sees the relation from the `syncInput` actions before it
+    assert response["return"]["value"] == 2
+
+    # The last `syncInput` gets applied at the end of the message
+    assert list(taste.flavor.all()) == [flavor2]
@@ -0,0 +1,92 @@
+import orjson
+import shortuuid
+
+from django_unicorn.cacher import restore_from_cache
+from django_unicorn.components import UnicornView
+from django_unicorn.components.lazy import LazyComponent, dumps_lazy_component
+from django_unicorn.utils import generate_checksum
+
+COMPONENT_NAME = "tests.views.fake_components.FakeComponent"
+
+
+def _post(client, signed_lazy_component, component_name=COMPONENT_NAME):
+    response = client.post(
+        f"/render/{component_name}",
+        {"lazy": signed_lazy_component},
+        content_type="application/json",
+    )
+
+    return orjson.loads(response.content)
+
+
+def _dumps(**kwargs):
+    lazy_component = LazyComponent(
+        component_id=shortuuid.uuid()[:8],
+        component_name=COMPONENT_NAME,
+        component_key="",
+        parent_cache_key=None,
+        args=[],
+        kwargs={},
+    )
+
+    return dumps_lazy_component(lazy_component._replace(**kwargs))
+
+
+def test_render(client):
+    response = _post(client, _dumps(component_id="test_render", kwargs={"method_count": 3}))
+
+    assert response["id"] == "test_render"
+    assert response["dom"].startswith('<div unicorn:id="test_render" unicorn:name="')
+    assert "<script" not in response["dom"]
+
+    data = orjson.loads(response["dom"].split("unicorn:data='")[1].split("'")[0])
+    assert data["method_count"] == 3
+    assert f'unicorn:checksum="{generate_checksum(data)}"' in response["dom"]
+
+
+def test_render_with_parent(client):
+    parent = UnicornView.create(component_id="test_render_with_parent", component_name=COMPONENT_NAME)
+    component_id = "test_render_with_parent:child"
+
+    _post(client, _dumps(component_id=component_id, parent_cache_key=parent.component_cache_key))
+
+    parent = restore_from_cache(parent.component_cache_key)
+    assert [child.component_id for child in parent.children] == [component_id]
+
+
+def test_render_invalid_signature(client):
+    response = _post(client, _dumps() + "x")
+
+    assert response == {"error": "Lazy component is invalid"}
+
+
+def test_render_expired(client, settings):
+    signed_lazy_component = _dumps()
+    settings.UNICORN = {**settings.UNICORN, "LAZY_MAX_AGE": -1}
+
+    response = client.post(
+        f"/render/{COMPONENT_NAME}",
+        {"lazy": signed_lazy_component},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+    assert orjson.loads(response.content) == {"error": "Lazy component has expired"}
+
+
+def test_render_invalid_component_name(client):
+    response = _post(client, _dumps(), component_name="tests.views.fake_components.FakeModelComponent")
+
+    assert response == {"error": "Invalid component name"}
+
+
+def test_render_missing_lazy_component(client):
+    response = client.post(f"/render/{COMPONENT_NAME}", {}, content_type="application/json")
+
+    assert orjson.loads(response.content) == {"error": "Missing lazy component"}
+
+
+def test_render_get(client):
+    response = client.get(f"/render/{COMPONENT_NAME}")
+
+    assert response.status_code == 405
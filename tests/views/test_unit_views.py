@@ -5,7 +5,7 @@ import pytest
 
 from django_unicorn.components import Component
 from django_unicorn.errors import RenderNotModifiedError
-from django_unicorn.utils import generate_checksum
+from django_unicorn.utils import generate_checksum, generate_content_hash
 from django_unicorn.views.action import CallMethod, Refresh, SyncInput, Toggle
 from django_unicorn.views.request import ComponentRequest
 from django_unicorn.views.response import ComponentResponse
@@ -45,7 +45,7 @@ def test_component_request_parsing():
         "checksum": "fail",
     }
 
-    body["checksum"] = generate_checksum(str(body["data"]))
+    body["checksum"] = generate_checksum(body["data"])
 
     request.body = json.dumps(body).encode("utf-8")
 
@@ -71,7 +71,7 @@ def test_component_request_action_parsing():
         ],
     }
 
-    body["checksum"] = generate_checksum(str(body["data"]))
+    body["checksum"] = generate_checksum(body["data"])
     request.body = json.dumps(body).encode("utf-8")
 
     req = ComponentRequest(request, "test-component")
@@ -104,7 +104,7 @@ def test_component_response_structure():
 
     # Calculate real checksum
 
-    req.hash = generate_checksum(component.last_rendered_dom)
+    req.hash = generate_content_hash(component.last_rendered_dom)
 
     with pytest.raises(RenderNotModifiedError):
         res = ComponentResponse(component, req)